@@ -0,0 +1,70 @@
+"""
+Compares request time of a large float vector sent as a JSON body validated by pydantic,
+as a JSON body decoded by ArrayBody and as a raw binary ArrayBody.
+
+Usage: python -m benchmarks.bench_arrays [elements] [iterations]
+"""
+import sys
+import timeit
+
+import numpy as np
+from flask import Flask
+
+from flask_typed import TypedAPI, TypedResource
+from flask_typed.annotations import Body
+from flask_typed.arrays import ArrayBody, ArrayResponse
+
+
+class ListResource(TypedResource):
+
+    def post(self, vector: Body[list[float]]) -> dict:
+        return {"sum": sum(vector)}
+
+
+class ArrayResource(TypedResource):
+
+    def post(self, vector: ArrayBody[np.float64, (None,)]) -> dict:
+        return {"sum": float(vector.sum())}
+
+
+class EchoResource(TypedResource):
+
+    def post(self, vector: ArrayBody[np.float64, (None,)]) -> ArrayResponse[np.float64]:
+        return ArrayResponse[np.float64](vector)
+
+
+def main():
+    elements = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    app = Flask(__name__)
+    api = TypedAPI(app)
+    api.add_resource(ListResource, "/list")
+    api.add_resource(ArrayResource, "/array")
+    api.add_resource(EchoResource, "/echo")
+    client = app.test_client()
+
+    vector = np.random.default_rng(0).random(elements)
+    json_body = app.json.dumps(vector.tolist())
+    binary_body = vector.tobytes()
+
+    cases = {
+        "JSON list[float]": lambda: client.post("/list", data=json_body, content_type="application/json"),
+        "JSON ArrayBody": lambda: client.post("/array", data=json_body, content_type="application/json"),
+        "binary ArrayBody": lambda: client.post(
+            "/array", data=binary_body, content_type="application/octet-stream"
+        ),
+        "binary echo": lambda: client.post("/echo", data=binary_body, content_type="application/octet-stream"),
+        "JSON echo": lambda: client.post(
+            "/echo", data=binary_body, content_type="application/octet-stream", headers={"Accept": "application/json"}
+        ),
+    }
+    print(f"{elements} elements, JSON body {len(json_body)} B, binary body {len(binary_body)} B")
+    for name, request in cases.items():
+        assert request().status_code == 200
+        elapsed = timeit.timeit(request, number=iterations) / iterations
+        print(f"{name:18}  {elapsed * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Compares encoding and decoding time and payload size of the registered codecs for a typical model.
+
+Usage: python -m benchmarks.bench_codecs [iterations]
+"""
+import sys
+import timeit
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from flask_typed.codecs import CODECS
+
+
+class Reading(BaseModel):
+    sensor_id: int
+    time: datetime
+    temperature: float
+    humidity: float
+    tags: list[str]
+
+
+class ReadingBatch(BaseModel):
+    device: str
+    readings: list[Reading]
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    batch = ReadingBatch(
+        device="device-1",
+        readings=[
+            Reading(
+                sensor_id=i, time=datetime(2020, 1, 1, 12, i % 60), temperature=20.5 + i / 100,
+                humidity=0.4, tags=["indoor", "floor-1"]
+            )
+            for i in range(1000)
+        ]
+    )
+
+    for codec in {id(codec): codec for codec in CODECS.values()}.values():
+        encoded = codec.dump_model(batch)
+        data = encoded.encode() if isinstance(encoded, str) else encoded
+        encode_time = timeit.timeit(lambda: codec.dump_model(batch), number=iterations) / iterations
+        decode_time = timeit.timeit(lambda: codec.validate_model(ReadingBatch, data), number=iterations) / iterations
+        print(
+            f"{codec.media_type:20}  size: {len(data):7d} B"
+            f"  encode: {encode_time * 1000:6.3f} ms  decode+validate: {decode_time * 1000:6.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Compares serving a large file through StreamingResponse with FileResponse.
+
+The WSGI server is simulated: the response body is written to /dev/null, and for FileResponse the
+server provides a wsgi.file_wrapper that uses os.sendfile like gunicorn does.
+
+Usage: python -m benchmarks.bench_file_response [size_mb]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from flask import Flask
+from werkzeug.test import EnvironBuilder
+
+from flask_typed import TypedAPI, TypedResource, FileResponse, StreamingResponse
+
+CHUNK_SIZE = 64 * 1024
+
+
+class SendfileWrapper:
+
+    def __init__(self, file, block_size=CHUNK_SIZE):
+        self.file = file
+
+    def __iter__(self):
+        return iter(())
+
+    def close(self):
+        self.file.close()
+
+
+class BinaryStreamingResponse(StreamingResponse):
+    mime_type = "application/octet-stream"
+
+
+class ArtifactResource(TypedResource):
+    path = ""
+
+    def get(self, mode: str) -> FileResponse | BinaryStreamingResponse:
+        if mode == "file":
+            return FileResponse(self.path)
+
+        def read_chunks():
+            with open(self.path, "rb") as f:
+                while chunk := f.read(CHUNK_SIZE):
+                    yield chunk
+
+        return BinaryStreamingResponse(read_chunks(), use_context=False)
+
+
+def serve(app: Flask, mode: str, output_fd: int) -> int:
+    environ = EnvironBuilder(path="/artifact", query_string={"mode": mode}).get_environ()
+    environ["wsgi.file_wrapper"] = SendfileWrapper
+
+    body = app.wsgi_app(environ, lambda status, headers, exc_info=None: None)
+    sent = 0
+    try:
+        if isinstance(body, SendfileWrapper):
+            size = os.fstat(body.file.fileno()).st_size
+            while sent < size:
+                sent += os.sendfile(output_fd, body.file.fileno(), sent, size - sent)
+        else:
+            for chunk in body:
+                sent += os.write(output_fd, chunk)
+    finally:
+        if hasattr(body, "close"):
+            body.close()
+    return sent
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    with tempfile.NamedTemporaryFile() as artifact:
+        artifact.write(os.urandom(1024 * 1024) * size)
+        artifact.flush()
+        ArtifactResource.path = artifact.name
+
+        app = Flask(__name__)
+        api = TypedAPI(app)
+        api.add_resource(ArtifactResource, "/artifact")
+
+        output_fd = os.open(os.devnull, os.O_WRONLY)
+        for mode in ("stream", "file"):
+            serve(app, mode, output_fd)
+            tracemalloc.start()
+            begin = time.perf_counter()
+            sent = serve(app, mode, output_fd)
+            elapsed = time.perf_counter() - begin
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"{mode:6}  {sent / elapsed / 1024 ** 2:9.0f} MB/s"
+                f"  peak Python memory: {peak / 1024:8.1f} KB"
+            )
+        os.close(output_fd)
+
+
+if __name__ == "__main__":
+    main()
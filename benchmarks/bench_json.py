@@ -0,0 +1,61 @@
+"""
+Compares the JSON backends on the paths that use them: plain dict return values, body validation
+of non-model types and the OpenAPI document endpoint.
+
+Usage: python -m benchmarks.bench_json [iterations]
+"""
+import sys
+import timeit
+
+from flask import Flask
+
+from flask_typed import TypedAPI, TypedResource, StdlibJsonBackend, OrjsonBackend
+from flask_typed.annotations import Query, Body
+
+ROWS = [{"id": i, "name": f"row {i}", "score": i / 3, "tags": ["a", "b"]} for i in range(1000)]
+
+
+class RowsResource(TypedResource):
+
+    def get(self, limit: Query[int] = 1000) -> dict:
+        return {"rows": ROWS[:limit]}
+
+    def post(self, scores: Body[dict[str, list[float]]]) -> dict:
+        return {"count": sum(len(values) for values in scores.values())}
+
+
+def make_app(backend):
+    app = Flask(__name__)
+    api = TypedAPI(app, json_backend=backend)
+    api.add_resource(RowsResource, "/rows")
+    for i in range(100):
+        api.add_resource(type(f"RowsResource{i}", (RowsResource,), {}), f"/rows{i}")
+    return app, api
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    body = {f"series{i}": [j / 7 for j in range(100)] for i in range(50)}
+    for backend_cls in (StdlibJsonBackend, OrjsonBackend):
+        try:
+            backend = backend_cls()
+        except ImportError:
+            print(f"{backend_cls.__name__}: not installed")
+            continue
+
+        app, api = make_app(backend)
+        client = app.test_client()
+        dict_time = timeit.timeit(lambda: client.get("/rows"), number=iterations) / iterations
+        body_time = timeit.timeit(lambda: client.post("/rows", json=body), number=iterations) / iterations
+        client.get("/openapi")
+        docs_time = timeit.timeit(lambda: client.get("/openapi"), number=iterations) / iterations
+        schema_time = timeit.timeit(api.get_openapi_schema, number=10) / 10
+        print(
+            f"{backend_cls.__name__:18}  dict response: {dict_time * 1000:6.3f} ms"
+            f"  body: {body_time * 1000:6.3f} ms  /openapi: {docs_time * 1000:6.3f} ms"
+            f"  get_openapi_schema(): {schema_time * 1000:7.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
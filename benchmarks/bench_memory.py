@@ -0,0 +1,98 @@
+"""
+Reports memory retained per route for a synthetic API with many resources.
+
+Usage: python -m benchmarks.bench_memory [route_count]
+"""
+import gc
+import sys
+import tracemalloc
+from datetime import date
+
+from flask import Flask
+from pydantic import BaseModel
+
+from flask_typed import TypedAPI, TypedResource, docs, NotFoundError
+from flask_typed.annotations import Header
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    created: date
+
+
+class ItemCreateBody(BaseModel):
+    name: str
+    created: date
+
+
+def make_resource(index: int) -> type[TypedResource]:
+
+    class ItemResource(TypedResource):
+
+        @docs(errors=[NotFoundError])
+        def get(
+                self,
+                item_id: int,
+                name: str | None = None,
+                created_after: date | None = None,
+                accept_language: Header[str] = "en"
+        ) -> Item:
+            """
+            Retrieves an item
+
+            Items can be filtered with query parameters
+
+            :param item_id: Item ID
+            :param name: Item name
+            :param created_after: Minimum creation date
+            :param accept_language: Response language
+            :return: Item details
+            :raises NotFoundError: Item does not exist
+            """
+            return Item(id=item_id, name=name or "", created=date.today())
+
+        def post(self, item_id: int, body: ItemCreateBody) -> Item:
+            """
+            Creates an item
+
+            :param item_id: Item ID
+            :param body: Item details
+            :return: Created item
+            """
+            return Item(id=item_id, name=body.name, created=body.created)
+
+    ItemResource.__name__ = f"ItemResource{index}"
+    return ItemResource
+
+
+def measure(route_count: int, keep_handler_docs: bool) -> float:
+    resources = [make_resource(i) for i in range(route_count)]
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+
+    app = Flask(__name__)
+    api = TypedAPI(app, keep_handler_docs=keep_handler_docs)
+    for i, resource in enumerate(resources):
+        api.add_resource(resource, f"/items{i}/<int:item_id>")
+    # The generated OpenAPI document is shared by both modes, exclude it from the runtime footprint
+    api.docs.paths.clear()
+
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / route_count
+
+
+def main():
+    route_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with_docs = measure(route_count, keep_handler_docs=True)
+    without_docs = measure(route_count, keep_handler_docs=False)
+    print(f"routes: {route_count}")
+    print(f"bytes per route (handler docs kept):     {with_docs:10.0f}")
+    print(f"bytes per route (handler docs released): {without_docs:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Measures the latency of the first request to each endpoint of a fresh process, with and without
+TypedAPI.warmup().
+
+Usage: python -m benchmarks.bench_warmup [resource_count]
+"""
+import json
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from flask import Flask
+from pydantic import BaseModel, ConfigDict, create_model
+
+from flask_typed import TypedAPI, TypedResource
+
+
+def make_resource(index: int) -> type[TypedResource]:
+    config = ConfigDict(defer_build=True)
+    tag_model = create_model(f"Tag{index}", __config__=config, name=(str, ...), weight=(float, 1.0))
+    body_model = create_model(
+        f"Body{index}", __config__=config,
+        title=(str, ...), tags=(list[tag_model], []), created=(datetime, ...)
+    )
+    result_model = create_model(
+        f"Result{index}", __config__=config,
+        id=(int, ...), title=(str, ...), tags=(list[tag_model], []), created=(datetime, ...)
+    )
+
+    def post(self, item_id: int, body: body_model) -> result_model:
+        return result_model(id=item_id, title=body.title, tags=body.tags, created=body.created)
+
+    return type(f"Resource{index}", (TypedResource,), {"post": post})
+
+
+def run_child(resource_count: int, warmup: bool):
+    app = Flask(__name__)
+    api = TypedAPI(app)
+    for i in range(resource_count):
+        api.add_resource(make_resource(i), f"/items{i}/<int:item_id>")
+
+    if warmup:
+        api.warmup()
+
+    client = app.test_client()
+    body = {"title": "test", "tags": [{"name": "a"}, {"name": "b", "weight": 2}], "created": "2020-01-01T00:00:00"}
+    latencies = []
+    for i in range(resource_count):
+        begin = time.perf_counter()
+        response = client.post(f"/items{i}/1", json=body)
+        latencies.append(time.perf_counter() - begin)
+        assert response.status_code == 200, response.json
+
+    second = time.perf_counter()
+    client.post("/items0/1", json=body)
+    second = time.perf_counter() - second
+    print(json.dumps({"first": latencies, "second": second}))
+
+
+def measure(resource_count: int, warmup: bool) -> dict:
+    output = subprocess.check_output(
+        [sys.executable, "-m", "benchmarks.bench_warmup", "--child", str(resource_count), str(int(warmup))]
+    )
+    return json.loads(output)
+
+
+def main():
+    if sys.argv[1:2] == ["--child"]:
+        run_child(int(sys.argv[2]), bool(int(sys.argv[3])))
+        return
+
+    resource_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    for warmup in (False, True):
+        result = measure(resource_count, warmup)
+        first = sorted(result["first"])
+        print(
+            f"warmup={str(warmup):5}  first request mean: {sum(first) / len(first) * 1000:7.3f} ms"
+            f"  max: {first[-1] * 1000:7.3f} ms  (warm request: {result['second'] * 1000:.3f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,30 @@
 from .typed_api import TypedAPI
 from .typed_resource import TypedResource
 from flask_typed.docs.utils import docs
+from .json_backend import JsonBackend, StdlibJsonBackend, OrjsonBackend
+from .codecs import Codec, JsonCodec, MsgPackCodec, register_codec
+from .capture import TrafficCapture
+from .coalesce import coalesce
+from .columnar import columnar
+from .concurrency import concurrency_limit, ConcurrencyLimit
+from .contracts import contract_sampling
+from .cors import CorsConfig
+from .deadlines import deadline, Deadline, DeadlinePolicy
+from .fields import sparse_fields
+from .idempotency import idempotent, MemoryIdempotencyStore, SQLiteIdempotencyStore
+from .pagination import Paginated, PageRequest
+from .parsers import memoized
+from .partial import Partial
+from .slow_requests import slow_requests, SlowRequestLog
+from .streaming import NDJSONStream
+from .uploads import UploadedFile, upload_limits
+from .rate_limit import rate_limit, RateLimit, MemoryBucketBackend, SQLiteBucketBackend, client_ip, header_key
+from .background import BackgroundTasks, TaskProgress, TaskAccepted, TaskStatus, TaskState
 from .errors import *
 from .response import *
+
+# numpy is an optional dependency, installed with the arrays extra
+try:
+    from .arrays import ArrayBody, ArrayResponse
+except ImportError:
+    pass
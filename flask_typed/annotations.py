@@ -1,9 +1,13 @@
 from typing import TypeVar, Annotated
 
 from flask_typed.parameter import ParameterLocation
+from flask_typed.uploads import UploadedFile
 
 _T = TypeVar("T")
 
 Query = Annotated[_T, ParameterLocation.QUERY]
 Path = Annotated[_T, ParameterLocation.PATH]
 Header = Annotated[_T, ParameterLocation.HEADER]
+Body = Annotated[_T, ParameterLocation.BODY]
+Form = Annotated[_T, ParameterLocation.FORM]
+File = Annotated[UploadedFile, ParameterLocation.FILE]
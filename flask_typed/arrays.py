@@ -0,0 +1,166 @@
+from typing import ClassVar, Any
+
+import numpy as np
+import openapi_pydantic as openapi
+from flask import Request, current_app, request
+from pydantic import BaseModel
+
+from .errors import HttpError, PayloadTooLargeError, UnsupportedMediaTypeError
+from .json_backend import get_json_backend
+from .parsers import BodyParser
+from .response import BaseResponse
+
+BINARY_MEDIA_TYPE = "application/octet-stream"
+JSON_MEDIA_TYPE = "application/json"
+
+Shape = tuple[int | None, ...]
+
+
+class ArrayValidationError(HttpError):
+    status_code = 422
+
+    class ResponseModel(BaseModel):
+        message: str | None = None
+        dtype: str
+        shape: list[int | None] | None = None
+
+
+def _parametrize(cls, params, cache: dict) -> type:
+    dtype, shape = params if isinstance(params, tuple) else (params, None)
+    dtype = np.dtype(dtype)
+    shape = tuple(shape) if shape is not None else None
+    if shape is not None and shape.count(None) > 1:
+        raise TypeError(f"Only one dimension of an array shape can be unknown: {shape}")
+    if (array_cls := cache.get((cls, dtype, shape))) is None:
+        array_cls = type(f"{cls.__name__}[{dtype.str}, {shape}]", (cls,), {"dtype": dtype, "shape": shape})
+        cache[(cls, dtype, shape)] = array_cls
+    return array_cls
+
+
+def _items_schema(dtype: np.dtype | None) -> openapi.Schema:
+    match dtype.kind if dtype is not None else None:
+        case "b":
+            return openapi.Schema(type="boolean")
+        case "i" | "u":
+            return openapi.Schema(type="integer")
+        case _:
+            return openapi.Schema(type="number")
+
+
+def _json_schema(dtype: np.dtype | None, shape: Shape | None) -> openapi.Schema:
+    schema = _items_schema(dtype)
+    for size in reversed(shape or (None,)):
+        schema = openapi.Schema(type="array", items=schema, minItems=size, maxItems=size)
+    return schema
+
+
+def _binary_schema(dtype: np.dtype | None, shape: Shape | None) -> openapi.Schema:
+    description = "Raw array data in C order" if dtype is None else f"Raw {dtype.str} array data in C order"
+    if shape is not None:
+        description += f", shape {tuple('n' if size is None else size for size in shape)}"
+    return openapi.Schema(type="string", format="binary", description=description)
+
+
+class ArrayBody(BodyParser):
+    dtype: ClassVar[np.dtype] = np.dtype(np.float64)
+    shape: ClassVar[Shape | None] = None
+    max_body_size: ClassVar[int | None] = None
+    errors = [PayloadTooLargeError, UnsupportedMediaTypeError, ArrayValidationError]
+
+    _parametrized: ClassVar[dict[Any, type['ArrayBody']]] = {}
+
+    def __class_getitem__(cls, params) -> type['ArrayBody']:
+        # ArrayBody[np.float32] or ArrayBody[np.float32, (None, 3)], None marks the unknown dimension
+        return _parametrize(cls, params, cls._parametrized)
+
+    @classmethod
+    def _invalid(cls, message: str) -> ArrayValidationError:
+        return ArrayValidationError(
+            message=message, dtype=cls.dtype.str, shape=list(cls.shape) if cls.shape is not None else None
+        )
+
+    @classmethod
+    def parse_request(cls, request: Request) -> np.ndarray:
+        if cls.max_body_size is not None and (request.content_length or 0) > cls.max_body_size:
+            raise PayloadTooLargeError(message=f"Request body exceeds {cls.max_body_size} bytes")
+
+        data = request.get_data()
+        match request.mimetype:
+            case "application/octet-stream":
+                if len(data) % cls.dtype.itemsize:
+                    raise cls._invalid(f"Body size is not a multiple of {cls.dtype.itemsize} bytes")
+                # Read-only view of the request body, the elements are not copied or converted
+                array = np.frombuffer(data, dtype=cls.dtype)
+                if cls.shape is not None and len(cls.shape) > 1:
+                    try:
+                        array = array.reshape(tuple(-1 if size is None else size for size in cls.shape))
+                    except ValueError:
+                        raise cls._invalid(f"Array of {array.size} elements does not match the shape")
+            case "application/json" | "":
+                try:
+                    array = np.asarray(get_json_backend().loads(data), dtype=cls.dtype)
+                except (ValueError, TypeError) as e:
+                    raise cls._invalid(str(e))
+            case other:
+                raise UnsupportedMediaTypeError(message=f"Unsupported media type: {other}")
+
+        if cls.shape is not None and (
+                array.ndim != len(cls.shape)
+                or any(size is not None and size != actual for size, actual in zip(cls.shape, array.shape))
+        ):
+            raise cls._invalid(f"Array shape {array.shape} does not match")
+        return array
+
+    @classmethod
+    def schema(cls) -> openapi.RequestBody:
+        return openapi.RequestBody(
+            content={
+                BINARY_MEDIA_TYPE: openapi.MediaType(schema=_binary_schema(cls.dtype, cls.shape)),
+                JSON_MEDIA_TYPE: openapi.MediaType(schema=_json_schema(cls.dtype, cls.shape)),
+            }
+        )
+
+
+class ArrayResponse(BaseResponse):
+    mime_type = BINARY_MEDIA_TYPE
+    # Without a declared dtype, arrays are sent with their own dtype
+    dtype: ClassVar[np.dtype | None] = None
+    shape: ClassVar[Shape | None] = None
+
+    _parametrized: ClassVar[dict[Any, type['ArrayResponse']]] = {}
+
+    def __class_getitem__(cls, params) -> type['ArrayResponse']:
+        return _parametrize(cls, params, cls._parametrized)
+
+    def __init__(self, array: np.ndarray):
+        self.array = array
+
+    def flask_response(self):
+        array = np.asarray(self.array, dtype=self.dtype)
+        best_match = request.accept_mimetypes.best_match(
+            [BINARY_MEDIA_TYPE, JSON_MEDIA_TYPE], default=BINARY_MEDIA_TYPE
+        )
+        if best_match == JSON_MEDIA_TYPE:
+            response = current_app.response_class(
+                response=get_json_backend().dumps(array.tolist()),
+                status=self.status_code,
+                mimetype=JSON_MEDIA_TYPE,
+            )
+        else:
+            response = current_app.response_class(
+                response=np.ascontiguousarray(array).tobytes(),
+                status=self.status_code,
+                mimetype=BINARY_MEDIA_TYPE,
+            )
+            response.headers["X-Array-Dtype"] = array.dtype.str
+            response.headers["X-Array-Shape"] = ",".join(str(size) for size in array.shape)
+        response.vary.add("Accept")
+        return response
+
+    @classmethod
+    def schema(cls) -> openapi.Schema:
+        return _binary_schema(cls.dtype, cls.shape)
+
+    @classmethod
+    def content_schemas(cls) -> dict[str, openapi.Schema]:
+        return {BINARY_MEDIA_TYPE: cls.schema(), JSON_MEDIA_TYPE: _json_schema(cls.dtype, cls.shape)}
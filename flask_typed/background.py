@@ -0,0 +1,292 @@
+import inspect
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor, Future
+from enum import Enum
+from functools import partial
+from threading import BoundedSemaphore, Lock
+from typing import Any, Generic, Literal, TypeVar, Union
+
+from flask import current_app, request
+from pydantic import BaseModel
+
+from flask_typed.docs.utils import docs
+from .errors import HttpError, NotFoundError, ServiceUnavailableError
+from .parsers import RequestParser
+from .typed_resource import TypedResource, BoundResource, convert_to_openapi_format
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TaskState(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class TaskAccepted(BaseModel):
+    task_id: str
+    status_url: str | None = None
+
+    model_config = {"status_code": 202}
+
+
+class TaskStatus(BaseModel, Generic[T]):
+    task_id: str
+    state: TaskState
+    progress: float | None = None
+    message: str | None = None
+    result: T | None = None
+    error: dict[str, Any] | None = None
+
+
+class _TaskRecord:
+    __slots__ = ("task_id", "state", "progress", "message", "result", "error", "finished_at", "future")
+
+    def __init__(self, task_id: str):
+        self.task_id = task_id
+        self.state = TaskState.PENDING
+        self.progress: float | None = None
+        self.message: str | None = None
+        self.result: Any = None
+        self.error: dict[str, Any] | None = None
+        self.finished_at: float | None = None
+        self.future: Future | None = None
+
+    def to_model(self, status_model: type[TaskStatus]) -> TaskStatus:
+        state = self.state
+        if state == TaskState.PENDING and self.future is not None and self.future.running():
+            # Tasks in other processes can not report it themselves
+            state = TaskState.RUNNING
+        return status_model(
+            task_id=self.task_id,
+            state=state,
+            progress=self.progress,
+            message=self.message,
+            result=self.result,
+            error=self.error,
+        )
+
+
+class TaskProgress(RequestParser):
+
+    def __init__(self):
+        self._record: _TaskRecord | None = None
+
+    @classmethod
+    def parse_request(cls, request) -> 'TaskProgress':
+        return cls()
+
+    def update(self, progress: float, message: str | None = None):
+        # Progress is only tracked for tasks running in a thread pool of the same process
+        if self._record is not None:
+            self._record.progress = progress
+            self._record.message = message
+
+
+def _call_handler(handler, resource_cls, validated_args):
+    return handler(resource_cls(), **validated_args)
+
+
+def _call_handler_in_context(app, record, handler, resource_cls, validated_args):
+    record.state = TaskState.RUNNING
+    with app.app_context():
+        return handler(resource_cls(), **validated_args)
+
+
+class BackgroundTasks:
+
+    def __init__(
+            self,
+            max_workers: int = 4,
+            max_queue: int = 64,
+            rejection_policy: Literal["reject", "caller_runs"] = "reject",
+            result_ttl: float = 3600.0,
+            max_results: int = 10000,
+            use_processes: bool = False,
+    ):
+        if rejection_policy not in ("reject", "caller_runs"):
+            raise ValueError(f"Invalid rejection policy: {rejection_policy}")
+
+        self.rejection_policy = rejection_policy
+        self.result_ttl = result_ttl
+        self.max_results = max_results
+        self.use_processes = use_processes
+        self.response_type = TaskAccepted
+        self.status_path: str | None = None
+
+        self._executor: Executor = (ProcessPoolExecutor if use_processes else ThreadPoolExecutor)(max_workers)
+        self._slots = BoundedSemaphore(max_workers + max_queue)
+        self._records: dict[str, _TaskRecord] = {}
+        # Finished records in the order they finished, so pruning only looks at the oldest ones
+        self._finished: OrderedDict[str, float] = OrderedDict()
+        self._lock = Lock()
+        self._result_types: list = []
+        self._status_model: type[TaskStatus] | None = None
+        self._status_resource: type[TypedResource] | None = None
+
+    def task(self, func):
+        func.background_tasks = self
+        result_type = inspect.signature(func).return_annotation
+        if result_type not in (inspect.Signature.empty, None) and result_type not in self._result_types:
+            self._result_types.append(result_type)
+            self._status_model = self._status_resource = None
+        return func
+
+    @property
+    def status_model(self) -> type[TaskStatus]:
+        if self._status_model is None:
+            if not self._result_types:
+                self._status_model = TaskStatus[Any]
+            else:
+                self._status_model = TaskStatus[Union[tuple(self._result_types)]]
+        return self._status_model
+
+    @property
+    def status_resource(self) -> type[TypedResource]:
+        # Built from the tasks declared so far, so the result is typed with their return types
+        if self._status_resource is None:
+            self._status_resource = self._create_status_resource(self.status_model)
+        return self._status_resource
+
+    def implicit_errors(self) -> list[type[HttpError]]:
+        return [ServiceUnavailableError] if self.rejection_policy == "reject" else []
+
+    def get_status(self, task_id: str) -> TaskStatus | None:
+        with self._lock:
+            self._prune()
+            record = self._records.get(task_id)
+        return record.to_model(self.status_model) if record is not None else None
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+
+    def wrap(self, handler, resource_cls, execute):
+        def submit(validated_args, options):
+            record = self._create_record()
+            for value in validated_args.values():
+                if isinstance(value, TaskProgress):
+                    value._record = record
+
+            if not self._slots.acquire(blocking=False):
+                if self.rejection_policy != "caller_runs":
+                    self._discard_record(record)
+                    raise ServiceUnavailableError(message="Task queue is full")
+                # The request worker runs the task itself, the client still gets the task to poll
+                future = Future()
+                future.set_running_or_notify_cancel()
+                try:
+                    future.set_result(_call_handler_in_context(
+                        current_app._get_current_object(), record, handler, resource_cls, validated_args
+                    ))
+                except BaseException as e:
+                    future.set_exception(e)
+                self._finish(record, future)
+                return self._accepted(record)
+
+            try:
+                if self.use_processes:
+                    # Handlers in worker processes run without an application context
+                    future = self._executor.submit(_call_handler, handler, resource_cls, validated_args)
+                    record.future = future
+                else:
+                    future = self._executor.submit(
+                        _call_handler_in_context,
+                        current_app._get_current_object(), record, handler, resource_cls, validated_args
+                    )
+            except BaseException:
+                self._slots.release()
+                self._discard_record(record)
+                raise
+
+            future.add_done_callback(partial(self._complete, record))
+            return self._accepted(record)
+
+        return submit
+
+    def _accepted(self, record: _TaskRecord):
+        accepted = TaskAccepted(task_id=record.task_id, status_url=self._status_url(record.task_id))
+        return current_app.response_class(
+            response=accepted.model_dump_json(),
+            status=202,
+            mimetype="application/json",
+        )
+
+    def _status_url(self, task_id: str) -> str | None:
+        if self.status_path is None:
+            return None
+        return request.script_root + self.status_path.format(task_id=task_id)
+
+    def _create_record(self) -> _TaskRecord:
+        record = _TaskRecord(uuid.uuid4().hex)
+        with self._lock:
+            self._prune()
+            self._records[record.task_id] = record
+        return record
+
+    def _discard_record(self, record: _TaskRecord):
+        with self._lock:
+            self._records.pop(record.task_id, None)
+
+    def _complete(self, record: _TaskRecord, future: Future):
+        self._slots.release()
+        self._finish(record, future)
+
+    def _finish(self, record: _TaskRecord, future: Future):
+        try:
+            result = future.result()
+        except HttpError as e:
+            record.error = e.response.model_dump(mode="json")
+            record.state = TaskState.FAILED
+        except BaseException:
+            logger.exception("Background task failed: %s", record.task_id)
+            record.error = {"message": "Internal server error"}
+            record.state = TaskState.FAILED
+        else:
+            record.result = result
+            record.progress = 1.0
+            record.state = TaskState.SUCCEEDED
+        with self._lock:
+            record.finished_at = time.monotonic()
+            self._finished[record.task_id] = record.finished_at
+
+    def _prune(self):
+        finished = self._finished
+        expire_before = time.monotonic() - self.result_ttl
+        while finished:
+            task_id, finished_at = next(iter(finished.items()))
+            # Oldest finished records are dropped first, in-flight tasks are always kept
+            if finished_at >= expire_before and len(self._records) < self.max_results:
+                break
+            del finished[task_id]
+            del self._records[task_id]
+
+    def _create_status_resource(self, status_model: type[TaskStatus]) -> type[TypedResource]:
+        tasks = self
+
+        class TaskStatusResource(TypedResource):
+
+            @classmethod
+            def bind(cls, path: str) -> BoundResource:
+                tasks.status_path = convert_to_openapi_format(path)
+                return super().bind(path)
+
+            @docs(errors=[NotFoundError])
+            def get(self, task_id: str) -> status_model:
+                """
+                Retrieves the state of a background task
+
+                :param task_id: Task ID
+                :return: Task state and the result of the task once it is completed
+                :raises NotFoundError: Task does not exist or its result is expired
+                """
+                if (status := tasks.get_status(task_id)) is None:
+                    raise NotFoundError(message="Task not found")
+                return status
+
+        return TaskStatusResource
@@ -0,0 +1,112 @@
+from enum import Enum
+from functools import lru_cache
+from inspect import isclass, Signature
+from typing import Any, NamedTuple
+from urllib.parse import quote
+
+import pydantic
+from pydantic import BaseModel, TypeAdapter
+
+from .errors import HttpError
+from .handler import HttpHandler
+from .json_backend import get_json_backend
+from .parameter import ParameterLocation, ValidationError
+from .response import BaseResponse
+from .typed_resource import _PATH_REGEX
+from .uploads import UploadedFile
+
+
+class EncodedCall(NamedTuple):
+    path: str
+    query: dict[str, str]
+    headers: dict[str, str]
+    body: bytes | None
+    content_type: str | None
+    form: dict[str, str]
+    files: dict[str, tuple[str, bytes, str]]
+
+
+def encode_value(value: Any) -> str:
+    if isinstance(value, BaseModel):
+        return value.model_dump_json(by_alias=True)
+    if isinstance(value, Enum):
+        value = value.value
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _encode_file(name: str, value: Any) -> tuple[str, bytes, str]:
+    if isinstance(value, UploadedFile):
+        value.seek(0)
+        return value.filename or name, value.read(), value.content_type or "application/octet-stream"
+    if isinstance(value, bytes):
+        return name, value, "application/octet-stream"
+    # (filename, data, content type) tuples are passed as they are
+    return value
+
+
+@lru_cache(maxsize=None)
+def _adapter(tp) -> TypeAdapter:
+    return TypeAdapter(tp)
+
+
+def encode_call(handler: HttpHandler, arguments: dict[str, Any]) -> EncodedCall:
+    values = {}
+    query, headers, form, files = {}, {}, {}, {}
+    body = content_type = None
+    for param in handler.parameters:
+        if (value := arguments.get(param.name)) is None:
+            continue
+        match param.location:
+            case ParameterLocation.PATH:
+                values[param.source] = quote(encode_value(value), safe="")
+            case ParameterLocation.QUERY:
+                query[param.source] = encode_value(value)
+            case ParameterLocation.HEADER:
+                headers[param.source] = encode_value(value)
+            case ParameterLocation.BODY:
+                body = _adapter(param.type).dump_json(value, by_alias=True, warnings=False)
+                content_type = "application/json"
+            case ParameterLocation.FORM:
+                form[param.source] = encode_value(value)
+            case ParameterLocation.FILE:
+                files[param.source] = _encode_file(param.source, value)
+
+    missing = [name for name in handler.path.path_parameters if name not in values]
+    if missing:
+        raise TypeError(f"Missing path arguments: {', '.join(missing)}")
+    path = _PATH_REGEX.sub(lambda m: values[m.group("name")], handler.path.path)
+    return EncodedCall(path, query, headers, body, content_type, form, files)
+
+
+def decode_error(handler: HttpHandler, status_code: int, data: bytes) -> HttpError:
+    try:
+        payload = get_json_backend().loads(data) if data else {}
+    except ValueError:
+        payload = {}
+    if not isinstance(payload, dict):
+        payload = {}
+
+    for error_type in (*handler.declared_errors(), ValidationError):
+        if getattr(error_type, "status_code", None) == status_code:
+            try:
+                return error_type(status_code=status_code, **payload)
+            except (TypeError, pydantic.ValidationError):
+                continue
+    return HttpError(status_code=status_code, message=payload.get("message"))
+
+
+def decode_result(handler: HttpHandler, status_code: int, mimetype: str, data: bytes) -> Any:
+    if status_code >= 400:
+        return decode_error(handler, status_code, data)
+
+    is_json = mimetype == "application/json" or mimetype.endswith("+json")
+    return_type = handler.documented_return_type()
+    if return_type is Signature.empty:
+        return get_json_backend().loads(data) if is_json else data.decode()
+    if isclass(return_type) and issubclass(return_type, BaseResponse) and not issubclass(return_type, BaseModel):
+        return data
+    if is_json:
+        return _adapter(return_type).validate_json(data)
+    return _adapter(return_type).validate_python(data.decode())
@@ -0,0 +1,153 @@
+import base64
+import io
+import os
+import random
+import time
+from functools import wraps
+from threading import Lock
+from typing import Iterable, Iterator, NamedTuple
+
+from flask import request, Response
+
+from .json_backend import get_json_backend
+from .metrics import Counter
+
+REDACTED = "[redacted]"
+
+
+class CapturedRequest(NamedTuple):
+    timestamp: float
+    endpoint: str
+    method: str
+    path: str
+    query: str
+    headers: list[tuple[str, str]]
+    body: bytes
+    status: int | None
+    duration: float
+
+
+class TrafficCapture:
+
+    def __init__(
+            self,
+            path: str | os.PathLike,
+            sample_rate: float = 0.01,
+            max_file_size: int = 100 * 1024 * 1024,
+            max_body_size: int = 1024 * 1024,
+            redact_headers: Iterable[str] = ("Authorization", "Cookie", "Proxy-Authorization"),
+    ):
+        if not 0 <= sample_rate <= 1:
+            raise ValueError(f"Sample rate should be between 0 and 1: {sample_rate}")
+        self.path = path
+        self.sample_rate = sample_rate
+        self.max_file_size = max_file_size
+        self.max_body_size = max_body_size
+        self.redact_headers = {header.lower() for header in redact_headers}
+        self.captured = Counter()
+        self.dropped = Counter()
+        self._lock = Lock()
+        self._file = None
+        self._size = os.path.getsize(path) if os.path.exists(path) else 0
+
+    @property
+    def full(self) -> bool:
+        return self._size >= self.max_file_size
+
+    def sample(self) -> bool:
+        return not self.full and random.random() < self.sample_rate
+
+    def _encode(self, record: CapturedRequest) -> bytes:
+        return get_json_backend().dumps({
+            "t": round(record.timestamp, 6),
+            "e": record.endpoint,
+            "m": record.method,
+            "p": record.path,
+            "q": record.query,
+            "h": record.headers,
+            "b": base64.b64encode(record.body).decode(),
+            "s": record.status,
+            "d": round(record.duration, 6),
+        }) + b"\n"
+
+    def write(self, record: CapturedRequest):
+        line = self._encode(record)
+        with self._lock:
+            # Samples which would exceed the size limit are dropped, the file is never rewritten
+            if self._size + len(line) > self.max_file_size:
+                self.dropped.inc()
+                return
+            if self._file is None:
+                self._file = open(self.path, "ab")
+            self._file.write(line)
+            self._file.flush()
+            self._size += len(line)
+        self.captured.inc()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _read_body(self) -> bytes:
+        # Bodies without a declared length, like chunked uploads, are left to the handler rather than buffered
+        if (length := request.content_length) is None or length > self.max_body_size:
+            return b""
+        body = request.get_data()
+        # Parsers reading the raw stream get the same body from the start
+        request.__dict__["stream"] = io.BytesIO(body)
+        return body
+
+    def wrap(self, endpoint: str, view):
+        redact_headers = self.redact_headers
+
+        @wraps(view)
+        def captured(*args, **kwargs):
+            if not self.sample():
+                return view(*args, **kwargs)
+
+            timestamp = time.time()
+            headers = [
+                (name, REDACTED if name.lower() in redact_headers else value)
+                for name, value in request.headers.items()
+            ]
+            body = self._read_body()
+            start = time.perf_counter()
+            response = view(*args, **kwargs)
+            duration = time.perf_counter() - start
+
+            self.write(CapturedRequest(
+                timestamp=timestamp,
+                endpoint=endpoint,
+                method=request.method,
+                path=request.path,
+                query=request.query_string.decode(),
+                headers=headers,
+                body=body,
+                status=response.status_code if isinstance(response, Response) else None,
+                duration=duration,
+            ))
+            return response
+
+        return captured
+
+
+def read_capture(path: str | os.PathLike) -> Iterator[CapturedRequest]:
+    loads = get_json_backend().loads
+    with open(path, "rb") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            record = loads(line)
+            yield CapturedRequest(
+                timestamp=record["t"],
+                endpoint=record["e"],
+                method=record["m"],
+                path=record["p"],
+                query=record["q"],
+                headers=[tuple(header) for header in record["h"]],
+                body=base64.b64decode(record["b"]),
+                status=record["s"],
+                duration=record["d"],
+            )
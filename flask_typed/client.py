@@ -0,0 +1,206 @@
+import asyncio
+import http.client
+import inspect
+import re
+import threading
+import uuid
+from typing import Any, NamedTuple
+from urllib.parse import urlsplit, urlencode
+
+from .calls import EncodedCall, encode_call, decode_result
+from .handler import HttpHandler
+from .metrics import Counter
+from .typed_api import TypedAPI
+from .typed_resource import BoundResource
+
+# Errors of a reused keep-alive connection which was closed by the server in the meantime
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+# The server may have received the request before closing the connection, so only these are sent again
+_RETRIED_METHODS = frozenset(("GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE"))
+
+
+class RawResponse(NamedTuple):
+    status: int
+    mimetype: str
+    data: bytes
+
+
+class ConnectionPool:
+
+    def __init__(self, base_url: str, pool_size: int = 10, timeout: float = 10.0):
+        url = urlsplit(base_url)
+        if url.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {url.scheme}")
+        self.connection_cls = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        self.host = url.hostname
+        self.port = url.port
+        self.prefix = url.path.rstrip("/")
+        self.timeout = timeout
+        self.created = Counter()
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(pool_size)
+
+    def _connect(self) -> http.client.HTTPConnection:
+        self.created.inc()
+        return self.connection_cls(self.host, self.port, timeout=self.timeout)
+
+    def _acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        return self._connect(), False
+
+    def _release(self, connection: http.client.HTTPConnection):
+        with self._lock:
+            self._idle.append(connection)
+
+    def request(self, method: str, path: str, body: bytes | None, headers: dict[str, str]) -> RawResponse:
+        with self._slots:
+            connection, reused = self._acquire()
+            try:
+                try:
+                    response = self._send(connection, method, path, body, headers)
+                except _STALE_CONNECTION_ERRORS:
+                    if not reused or method not in _RETRIED_METHODS:
+                        raise
+                    connection.close()
+                    connection = self._connect()
+                    response = self._send(connection, method, path, body, headers)
+                data = response.read()
+            except BaseException:
+                connection.close()
+                raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(connection)
+            return RawResponse(response.status, response.headers.get_content_type(), data)
+
+    def _send(self, connection, method, path, body, headers) -> http.client.HTTPResponse:
+        connection.request(method, self.prefix + path, body=body, headers=headers)
+        return connection.getresponse()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+
+def _encode_multipart(form: dict[str, str], files: dict[str, tuple[str, bytes, str]]) -> tuple[bytes, str]:
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in form.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+        )
+    for name, (filename, content, content_type) in files.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n'.encode() + content + b"\r\n"
+        )
+    parts.append(f"--{boundary}--\r\n".encode())
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
+
+
+def _request_parts(encoded: EncodedCall) -> tuple[str, bytes | None, dict[str, str]]:
+    path = encoded.path
+    if encoded.query:
+        path = f"{path}?{urlencode(encoded.query)}"
+    headers = {"Accept": "application/json", **encoded.headers}
+    body = encoded.body
+    if encoded.form or encoded.files:
+        body, headers["Content-Type"] = _encode_multipart(encoded.form, encoded.files)
+    elif encoded.content_type is not None:
+        headers["Content-Type"] = encoded.content_type
+    return path, body, headers
+
+
+def _namespace(bound_resource: BoundResource) -> str:
+    name = bound_resource.resource_cls.__name__.removesuffix("Resource") or bound_resource.resource_cls.__name__
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def _with_signature(call, handler: HttpHandler):
+    # Generated methods take the typed handler arguments as keywords, which help() and IDEs show
+    signature = inspect.signature(handler.handler)
+    parameters = [
+        param.replace(kind=inspect.Parameter.KEYWORD_ONLY)
+        for name, param in signature.parameters.items()
+        if name != "self" and name not in handler.request_parsers
+    ]
+    call.__signature__ = signature.replace(parameters=parameters, return_annotation=handler.documented_return_type())
+    call.__name__ = handler.handler.__name__
+    call.__doc__ = handler.handler.__doc__
+    return call
+
+
+class ResourceClient:
+
+    def __init__(self, client: 'TypedClient', bound_resource: BoundResource):
+        for method, handler in bound_resource.methods.items():
+            setattr(self, method.lower(), client._bind_method(handler))
+
+
+class TypedClient:
+
+    def __init__(self, api: TypedAPI, base_url: str, pool_size: int = 10, timeout: float = 10.0):
+        self.pool = ConnectionPool(base_url, pool_size=pool_size, timeout=timeout)
+        self._namespaces = {}
+        for bound_resource in api.resources.values():
+            name = _namespace(bound_resource)
+            if name in self._namespaces:
+                raise ValueError(f"Resource name is used more than once: {name}")
+            self._namespaces[name] = ResourceClient(self, bound_resource)
+
+    def __getattr__(self, name: str) -> ResourceClient:
+        try:
+            return self.__dict__["_namespaces"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def _bind_method(self, handler: HttpHandler):
+        method = handler.handler.__name__.upper()
+
+        def call(**arguments):
+            return self.call(handler, method, arguments)
+
+        return _with_signature(call, handler)
+
+    def call(self, handler: HttpHandler, method: str, arguments: dict[str, Any]) -> Any:
+        # Returns the typed result, or the HttpError returned by the server
+        path, body, headers = _request_parts(encode_call(handler, arguments))
+        response = self.pool.request(method, path, body, headers)
+        return decode_result(handler, response.status, response.mimetype, response.data)
+
+    def close(self):
+        self.pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class AsyncTypedClient(TypedClient):
+
+    def _bind_method(self, handler: HttpHandler):
+        method = handler.handler.__name__.upper()
+
+        async def call(**arguments):
+            return await self.call_async(handler, method, arguments)
+
+        return _with_signature(call, handler)
+
+    async def call_async(self, handler: HttpHandler, method: str, arguments: dict[str, Any]) -> Any:
+        # Blocking calls on the shared pool run in worker threads, the pool size bounds the concurrency
+        return await asyncio.to_thread(self.call, handler, method, arguments)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
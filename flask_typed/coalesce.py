@@ -0,0 +1,105 @@
+from threading import Event, Lock
+from typing import Any, Callable, Hashable
+
+from flask import current_app
+from pydantic import BaseModel
+
+from .errors import GatewayTimeoutError
+
+
+def _hashable(value: Any) -> Hashable:
+    if isinstance(value, BaseModel):
+        return value.__class__, value.model_dump_json()
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def default_key(validated_args: dict[str, Any]) -> Hashable:
+    return tuple((name, _hashable(value)) for name, value in sorted(validated_args.items()))
+
+
+class _InFlightCall:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self._lock = Lock()
+        self._calls: dict[Hashable, _InFlightCall] = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _InFlightCall()
+
+        if is_leader:
+            try:
+                call.result = func()
+            except BaseException as e:
+                call.error = e
+                raise
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+            return call.result
+
+        if not call.done.wait(self.timeout):
+            raise GatewayTimeoutError
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+
+class Coalescer:
+
+    def __init__(self, timeout: float = 10.0, key: Callable[[dict[str, Any]], Hashable] | None = None):
+        self.key = key if key is not None else default_key
+        self.single_flight = SingleFlight(timeout)
+
+    def wrap(self, execute: Callable[[dict[str, Any], Any], Any]) -> Callable[[dict[str, Any], Any], Any]:
+        single_flight = self.single_flight
+        key_func = self.key
+
+        def coalesced(validated_args, options):
+            leader_response = None
+
+            def run():
+                nonlocal leader_response
+                response = current_app.make_response(execute(validated_args, options))
+                if response.is_streamed:
+                    # Streamed and file bodies are not buffered, waiters run the handler themselves
+                    leader_response = response
+                    return None
+                # Waiters rebuild their own response from the serialized response of the leader
+                return response.get_data(), response.status_code, list(response.headers)
+
+            shared = single_flight.do((key_func(validated_args), options.key()), run)
+            if leader_response is not None:
+                return leader_response
+            if shared is None:
+                return execute(validated_args, options)
+            body, status, headers = shared
+            return current_app.response_class(response=body, status=status, headers=headers)
+
+        return coalesced
+
+
+def coalesce(timeout: float = 10.0, key: Callable[[dict[str, Any]], Hashable] | None = None):
+    def coalesce_decorator(func):
+        func.coalescer = Coalescer(timeout=timeout, key=key)
+        return func
+
+    return coalesce_decorator
@@ -0,0 +1,95 @@
+from typing import Any, ClassVar
+
+from pydantic import BaseModel, TypeAdapter
+
+from .json_backend import get_json_backend
+
+
+class Codec:
+    media_type: ClassVar[str]
+
+    def loads(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+    def dumps(self, value: Any) -> bytes:
+        raise NotImplementedError
+
+    def validate(self, adapter: TypeAdapter, data: bytes) -> Any:
+        return adapter.validate_python(self.loads(data))
+
+    def validate_model(self, model_type: type[BaseModel], data: bytes) -> BaseModel:
+        return model_type.model_validate(self.loads(data))
+
+    def dump_model(self, model: BaseModel, **kwargs) -> bytes | str:
+        return self.dumps(model.model_dump(mode="json", **kwargs))
+
+
+class JsonCodec(Codec):
+    media_type = "application/json"
+
+    def loads(self, data: bytes) -> Any:
+        return get_json_backend().loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return get_json_backend().dumps(value)
+
+    def validate(self, adapter: TypeAdapter, data: bytes) -> Any:
+        return adapter.validate_json(data)
+
+    def validate_model(self, model_type: type[BaseModel], data: bytes) -> BaseModel:
+        return model_type.model_validate_json(data)
+
+    def dump_model(self, model: BaseModel, **kwargs) -> str:
+        return model.model_dump_json(**kwargs)
+
+
+class MsgPackCodec(Codec):
+    media_type = "application/msgpack"
+
+    def __init__(self):
+        import msgpack
+        self._packb = msgpack.packb
+        self._unpackb = msgpack.unpackb
+
+    def loads(self, data: bytes) -> Any:
+        return self._unpackb(data, raw=False)
+
+    def dumps(self, value: Any) -> bytes:
+        return self._packb(value, use_bin_type=True)
+
+
+DEFAULT_CODEC = JsonCodec()
+
+CODECS: dict[str, Codec] = {
+    DEFAULT_CODEC.media_type: DEFAULT_CODEC,
+}
+
+
+def register_codec(codec: Codec, *aliases: str):
+    for media_type in (codec.media_type, *aliases):
+        CODECS[media_type] = codec
+
+
+try:
+    register_codec(MsgPackCodec(), "application/x-msgpack")
+except ImportError:
+    pass
+
+
+def media_types() -> list[str]:
+    # Aliases are accepted but only the primary media type of each codec is documented
+    return list({codec.media_type: None for codec in CODECS.values()})
+
+
+def request_codec(media_type: str | None) -> Codec:
+    # Bodies of other media types, like +json types or a missing Content-Type, are parsed as JSON as they always were
+    if not media_type or (codec := CODECS.get(media_type)) is None:
+        return DEFAULT_CODEC
+    return codec
+
+
+def response_codec(accept_mimetypes) -> Codec:
+    if len(CODECS) == 1 or not accept_mimetypes:
+        return DEFAULT_CODEC
+    best_match = accept_mimetypes.best_match(CODECS.keys(), default=DEFAULT_CODEC.media_type)
+    return CODECS[best_match]
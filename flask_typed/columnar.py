@@ -0,0 +1,176 @@
+from typing import Literal, get_origin, get_args
+
+import openapi_pydantic as openapi
+from flask import Request
+from pydantic import BaseModel, TypeAdapter
+
+from .codecs import JsonCodec, DEFAULT_CODEC
+from .json_backend import get_json_backend
+
+COLUMNAR_MEDIA_TYPE = "application/vnd.columnar+json"
+
+
+def _item_model(annotation) -> type[BaseModel] | None:
+    if get_origin(annotation) is list:
+        item_type = get_args(annotation)[0]
+        if isinstance(item_type, type) and issubclass(item_type, BaseModel):
+            return item_type
+    return None
+
+
+def _has_custom_serializers(model_type: type[BaseModel]) -> bool:
+    decorators = model_type.__pydantic_decorators__
+    return bool(decorators.field_serializers or decorators.model_serializers)
+
+
+def _key(name: str, field, by_alias: bool) -> str:
+    return (field.serialization_alias or field.alias or name) if by_alias else name
+
+
+def _as_dict(fields) -> dict | None:
+    # Include and exclude of model_dump are either sets of field names or dicts of nested selections
+    if fields is None or isinstance(fields, dict):
+        return fields
+    return {name: True for name in fields}
+
+
+def _nested(fields: dict | None, name: str):
+    if fields is not None and isinstance(fields.get(name), dict):
+        return _as_dict(fields[name].get("__all__"))
+    return None
+
+
+def _whole(fields, name: str) -> bool:
+    return fields is not None and name in fields and not isinstance(fields[name], (dict, set))
+
+
+class ColumnarCodec(JsonCodec):
+    media_type = COLUMNAR_MEDIA_TYPE
+
+    def __init__(self, layout: Literal["columns", "rows"] = "columns"):
+        self.layout = layout
+        self._list_fields: dict[type[BaseModel], list[tuple[str, type[BaseModel]]]] = {}
+        self._column_adapters: dict[tuple[type[BaseModel], str], TypeAdapter] = {}
+
+    def list_fields(self, model_type: type[BaseModel]) -> list[tuple[str, type[BaseModel]]]:
+        if (fields := self._list_fields.get(model_type)) is None:
+            fields = self._list_fields[model_type] = [
+                (name, item_model) for name, field in model_type.model_fields.items()
+                if (item_model := _item_model(field.annotation)) is not None
+            ]
+        return fields
+
+    def _column_adapter(self, item_model: type[BaseModel], name: str) -> TypeAdapter:
+        if (adapter := self._column_adapters.get((item_model, name))) is None:
+            annotation = item_model.model_fields[name].annotation
+            adapter = self._column_adapters[(item_model, name)] = TypeAdapter(list[annotation])
+        return adapter
+
+    def _encode_items(
+            self, item_model: type[BaseModel], items: list[BaseModel], by_alias: bool, include, exclude
+    ) -> dict:
+        fields = [
+            (name, field) for name, field in item_model.model_fields.items()
+            if (include is None or name in include) and not _whole(exclude, name)
+        ]
+        columns = [_key(name, field, by_alias) for name, field in fields]
+
+        if _has_custom_serializers(item_model) or exclude:
+            # Custom serializers and nested excludes only apply through model_dump, so these rows are dumped one by one
+            rows = [
+                item.model_dump(mode="json", by_alias=by_alias, include=include, exclude=exclude) for item in items
+            ]
+            values = {column: [row[column] for row in rows] for column in columns}
+        else:
+            # One serializer call per column, rather than a model_dump per row
+            values = {
+                column: self._column_adapter(item_model, name).dump_python(
+                    [getattr(item, name) for item in items], mode="json"
+                )
+                for column, (name, field) in zip(columns, fields)
+            }
+
+        if self.layout == "rows":
+            return {"columns": columns, "rows": [list(row) for row in zip(*values.values())]}
+        return {"columns": columns, "data": values}
+
+    def dump_model(self, model: BaseModel, by_alias: bool = False, include: dict | None = None, **kwargs) -> bytes:
+        list_fields = self.list_fields(type(model))
+        if not list_fields:
+            return DEFAULT_CODEC.dumps(model.model_dump(mode="json", by_alias=by_alias, include=include, **kwargs))
+
+        include = _as_dict(include)
+        exclude = _as_dict(kwargs.pop("exclude", None)) or {}
+        data = model.model_dump(
+            mode="json", by_alias=by_alias, include=include,
+            exclude={**exclude, **{name: True for name, _ in list_fields}}, **kwargs
+        )
+        model_fields = type(model).model_fields
+        for name, item_model in list_fields:
+            if (include is not None and name not in include) or _whole(exclude, name):
+                continue
+            data[_key(name, model_fields[name], by_alias)] = self._encode_items(
+                item_model, getattr(model, name), by_alias, _nested(include, name), _nested(exclude, name)
+            )
+        return get_json_backend().dumps(data)
+
+    def schema(self, model_type) -> openapi.Schema | None:
+        if not (isinstance(model_type, type) and issubclass(model_type, BaseModel)):
+            return None
+        if not (list_fields := self.list_fields(model_type)):
+            return None
+
+        properties = {}
+        for name, item_model in list_fields:
+            columns = [_key(column, field, True) for column, field in item_model.model_fields.items()]
+            column_names = openapi.Schema(type="array", items=openapi.Schema(type="string", enum=columns))
+            if self.layout == "rows":
+                values = openapi.Schema(type="array", items=openapi.Schema(type="array"))
+            else:
+                values = openapi.Schema(
+                    type="object", properties={column: openapi.Schema(type="array") for column in columns}
+                )
+            value_key = "rows" if self.layout == "rows" else "data"
+            properties[_key(name, model_type.model_fields[name], True)] = openapi.Schema(
+                type="object",
+                properties={"columns": column_names, value_key: values},
+                required=["columns", value_key],
+            )
+
+        return openapi.Schema(
+            type="object",
+            description=f"{model_type.__name__} with its list fields in columnar form, other fields are unchanged",
+            properties=properties,
+        )
+
+
+class Columnar:
+
+    def __init__(self, query_param: str | None = "columnar", layout: Literal["columns", "rows"] = "columns"):
+        self.query_param = query_param
+        self.codec = ColumnarCodec(layout)
+
+    def requested(self, request: Request) -> bool:
+        if self.query_param is not None and request.args.get(self.query_param) in ("1", "true"):
+            return True
+        accept = request.accept_mimetypes
+        return bool(accept) and accept.best_match(
+            [DEFAULT_CODEC.media_type, COLUMNAR_MEDIA_TYPE], default=DEFAULT_CODEC.media_type
+        ) == COLUMNAR_MEDIA_TYPE
+
+    def to_openapi_parameter(self) -> openapi.Parameter:
+        return openapi.Parameter(
+            name=self.query_param,
+            description=f"Returns list fields in columnar form, same as accepting {COLUMNAR_MEDIA_TYPE}",
+            param_in="query",
+            param_schema=openapi.Schema(type="boolean"),
+            required=False,
+        )
+
+
+def columnar(query_param: str | None = "columnar", layout: Literal["columns", "rows"] = "columns"):
+    def columnar_decorator(func):
+        func.columnar = Columnar(query_param=query_param, layout=layout)
+        return func
+
+    return columnar_decorator
@@ -0,0 +1,91 @@
+from functools import wraps
+from threading import Semaphore, Lock
+
+from .errors import ServiceUnavailableError
+from .metrics import Counter
+
+
+class ConcurrencyLimit:
+
+    def __init__(self, limit: int, max_queue: int = 0, queue_timeout: float = 0.1, retry_after: int = 1):
+        if limit < 1:
+            raise ValueError(f"Concurrency limit should be positive: {limit}")
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+
+
+class ConcurrencyLimiter:
+
+    def __init__(self, config: ConcurrencyLimit):
+        self.config = config
+        self.admitted = Counter()
+        self.queued = Counter()
+        self.shed = Counter()
+        self._semaphore = Semaphore(config.limit)
+        self._lock = Lock()
+        self._waiting = 0
+        self._rejection = ServiceUnavailableError(
+            message="Too many concurrent requests",
+            headers={"Retry-After": str(config.retry_after)}
+        ).precompute()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "admitted": self.admitted.value,
+            "queued": self.queued.value,
+            "shed": self.shed.value,
+        }
+
+    def acquire(self) -> bool:
+        if self._semaphore.acquire(blocking=False):
+            self.admitted.inc()
+            return True
+
+        with self._lock:
+            if self._waiting >= self.config.max_queue:
+                self.shed.inc()
+                return False
+            self._waiting += 1
+        self.queued.inc()
+
+        try:
+            acquired = self._semaphore.acquire(timeout=self.config.queue_timeout)
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+        (self.admitted if acquired else self.shed).inc()
+        return acquired
+
+    def release(self):
+        self._semaphore.release()
+
+    def wrap(self, view):
+        rejection = self._rejection
+
+        @wraps(view)
+        def limited(*args, **kwargs):
+            if not self.acquire():
+                return rejection.flask_response()
+            try:
+                return view(*args, **kwargs)
+            finally:
+                self.release()
+
+        return limited
+
+
+def concurrency_limit(limit: int, max_queue: int = 0, queue_timeout: float = 0.1, retry_after: int = 1):
+    def concurrency_limit_decorator(func):
+        func.concurrency_limit = ConcurrencyLimit(
+            limit=limit,
+            max_queue=max_queue,
+            queue_timeout=queue_timeout,
+            retry_after=retry_after,
+        )
+        return func
+
+    return concurrency_limit_decorator
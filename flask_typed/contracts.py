@@ -0,0 +1,91 @@
+import logging
+import random
+from inspect import isclass, Signature
+from types import UnionType
+from typing import Any, Union, get_origin, get_args
+
+import pydantic
+from flask import Response
+from pydantic import BaseModel, TypeAdapter
+
+from .errors import HttpError
+from .metrics import Counter
+from .response import BaseResponse
+
+logger = logging.getLogger(__name__)
+
+
+def _status_code(response_type) -> int | None:
+    if isinstance(response_type, HttpError):
+        return response_type.status_code
+    if isclass(response_type):
+        if issubclass(response_type, BaseModel):
+            return response_type.model_config.get("status_code", 200)
+        if issubclass(response_type, (BaseResponse, HttpError)):
+            return response_type.status_code
+    return None
+
+
+class ContractChecker:
+
+    def __init__(self, name: str, return_type, sample_rate: float, errors: list[type[HttpError]]):
+        if not 0 <= sample_rate <= 1:
+            raise ValueError(f"Sample rate should be between 0 and 1: {sample_rate}")
+        self.name = name
+        self.sample_rate = sample_rate
+        self.checked = Counter()
+        self.mismatches = Counter()
+
+        types = get_args(return_type) if get_origin(return_type) in (UnionType, Union) else (return_type,)
+        self.response_types = tuple(
+            ty for ty in types if isclass(ty) and issubclass(ty, (BaseResponse, HttpError))
+        )
+        value_types = [ty for ty in types if ty not in self.response_types and ty is not Signature.empty]
+        # Response classes are checked by type and status code, other values against the compiled adapter
+        self.adapter = TypeAdapter(Union[tuple(value_types)]) if value_types else None
+        self.status_codes = {
+            status_code for ty in (*types, *errors) if (status_code := _status_code(ty)) is not None
+        } or {200}
+
+    def sample(self) -> bool:
+        return random.random() < self.sample_rate
+
+    def check(self, response_value: Any, response: Any, include: Any = None):
+        self.checked.inc()
+        try:
+            if isinstance(response_value, BaseResponse):
+                if not isinstance(response_value, self.response_types):
+                    return self._mismatch(f"unexpected response type {type(response_value).__name__}")
+            elif self.adapter is None:
+                return self._mismatch(f"unexpected return value of type {type(response_value).__name__}")
+            elif isinstance(response_value, BaseModel):
+                if include is None and isinstance(response, Response) and response.mimetype == "application/json":
+                    # Validates what the client actually receives, which catches models built without validation
+                    self.adapter.validate_json(response.get_data())
+                else:
+                    self.adapter.validate_python(response_value.model_dump(by_alias=True))
+            else:
+                self.adapter.validate_python(response_value)
+        except pydantic.ValidationError as e:
+            return self._mismatch(str(e))
+
+        status_code = response.status_code if isinstance(response, Response) else 200
+        if status_code not in self.status_codes:
+            self._mismatch(f"undeclared status code {status_code}")
+
+    def check_error(self, error: HttpError):
+        self.checked.inc()
+        if error.status_code not in self.status_codes:
+            self._mismatch(f"undeclared error {type(error).__name__} with status code {error.status_code}")
+
+    def _mismatch(self, details: str):
+        self.mismatches.inc()
+        logger.warning("Response of %s does not match its declared type: %s", self.name, details)
+
+
+def contract_sampling(sample_rate: float):
+    def contract_sampling_decorator(func):
+        func.contract_sample_rate = sample_rate
+        return func
+
+    return contract_sampling_decorator
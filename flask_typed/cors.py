@@ -0,0 +1,95 @@
+from functools import wraps
+from typing import Iterable
+
+from flask import request, current_app
+
+from .response import PrecomputedResponse
+
+
+class CorsConfig:
+
+    def __init__(
+            self,
+            origins: str | list[str] = "*",
+            allow_headers: Iterable[str] = ("Content-Type", "Authorization"),
+            expose_headers: Iterable[str] = (),
+            allow_credentials: bool = False,
+            max_age: int | None = 86400,
+    ):
+        if origins == "*" and allow_credentials:
+            raise ValueError("Credentials can not be allowed for any origin, list the allowed origins instead")
+        self.origins = origins
+        self.allow_headers = list(allow_headers)
+        self.expose_headers = list(expose_headers)
+        self.allow_credentials = allow_credentials
+        self.max_age = max_age
+
+
+class CorsPolicy:
+
+    def __init__(self, config: CorsConfig, methods: Iterable[str]):
+        self.config = config
+        self.allow_methods = ", ".join(sorted({*methods, "OPTIONS"}))
+        self.any_origin = config.origins == "*"
+
+        origins = [None] if self.any_origin else config.origins
+        # Headers of every allowed origin are built once, requests only look them up
+        self._response_headers = {origin: self._headers(origin) for origin in origins}
+        self._preflight = {
+            origin: PrecomputedResponse(b"", 204, "text/plain", self._preflight_headers(headers))
+            for origin, headers in self._response_headers.items()
+        }
+        self._rejected_preflight = PrecomputedResponse(b"", 204, "text/plain", {"Allow": self.allow_methods})
+
+    def _headers(self, origin: str | None) -> dict[str, str]:
+        config = self.config
+        headers = {"Access-Control-Allow-Origin": origin or "*"}
+        if origin is not None:
+            headers["Vary"] = "Origin"
+        if config.allow_credentials:
+            headers["Access-Control-Allow-Credentials"] = "true"
+        if config.expose_headers:
+            headers["Access-Control-Expose-Headers"] = ", ".join(config.expose_headers)
+        return headers
+
+    def _preflight_headers(self, headers: dict[str, str]) -> dict[str, str]:
+        config = self.config
+        headers = {**headers, "Allow": self.allow_methods, "Access-Control-Allow-Methods": self.allow_methods}
+        headers.pop("Access-Control-Expose-Headers", None)
+        if config.allow_headers:
+            headers["Access-Control-Allow-Headers"] = ", ".join(config.allow_headers)
+        if config.max_age is not None:
+            headers["Access-Control-Max-Age"] = str(config.max_age)
+        return headers
+
+    def _origin_key(self) -> str | None:
+        return None if self.any_origin else request.headers.get("Origin")
+
+    def preflight_view(self):
+        preflight = self._preflight
+        rejected = self._rejected_preflight
+
+        def preflight_response(*_args, **_kwargs):
+            return preflight.get(self._origin_key(), rejected).flask_response()
+
+        return preflight_response
+
+    def wrap(self, view):
+        response_headers = self._response_headers
+
+        @wraps(view)
+        def with_cors(*args, **kwargs):
+            response_value = view(*args, **kwargs)
+            if "Origin" not in request.headers:
+                return response_value
+            if (headers := response_headers.get(self._origin_key())) is None:
+                return response_value
+            response = current_app.make_response(response_value)
+            for name, value in headers.items():
+                if name == "Vary":
+                    response.vary.add(value)
+                else:
+                    response.headers[name] = value
+            return response
+
+        return with_cors
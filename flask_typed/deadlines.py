@@ -0,0 +1,119 @@
+import time
+from functools import wraps
+
+from flask import Request, request, g
+
+from .errors import GatewayTimeoutError
+from .metrics import Counter, Timer
+from .parsers import RequestParser
+
+
+def _parse_timestamp(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        timestamp = float(value.removeprefix("t="))
+    except ValueError:
+        return None
+    # Proxies send the request start time in seconds, milliseconds or microseconds
+    while timestamp > 1e11:
+        timestamp /= 1000
+    return timestamp
+
+
+class Deadline(RequestParser):
+
+    def __init__(self, expires_at: float | None):
+        self.expires_at = expires_at
+
+    @classmethod
+    def parse_request(cls, request: Request) -> 'Deadline':
+        return g.get("deadline") or cls(None)
+
+    def remaining(self) -> float | None:
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.time())
+
+    def timeout(self, default: float) -> float:
+        # Timeout for a downstream call, bounded by the remaining budget
+        remaining = self.remaining()
+        return default if remaining is None else min(default, remaining)
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.time() >= self.expires_at
+
+
+class DeadlinePolicy:
+
+    def __init__(
+            self,
+            budget: float | None = None,
+            deadline_header: str | None = "X-Request-Deadline",
+            start_header: str | None = "X-Request-Start",
+    ):
+        self.budget = budget
+        self.deadline_header = deadline_header
+        self.start_header = start_header
+
+
+class DeadlineEnforcer:
+
+    def __init__(self, policy: DeadlinePolicy):
+        self.policy = policy
+        self.admitted = Counter()
+        self.rejected = Counter()
+        self.rejected_age = Timer()
+        self._rejection = GatewayTimeoutError(message="Request deadline exceeded").precompute()
+
+    def deadline(self, now: float) -> tuple[float, float | None]:
+        policy = self.policy
+        headers = request.headers
+        start = None
+        if policy.start_header is not None:
+            start = _parse_timestamp(headers.get(policy.start_header))
+        if start is None or start > now:
+            start = now
+
+        expires_at = None
+        if policy.deadline_header is not None:
+            expires_at = _parse_timestamp(headers.get(policy.deadline_header))
+        if policy.budget is not None:
+            budget_expires_at = start + policy.budget
+            expires_at = budget_expires_at if expires_at is None else min(expires_at, budget_expires_at)
+        return start, expires_at
+
+    def wrap(self, view):
+        rejection = self._rejection
+
+        @wraps(view)
+        def with_deadline(*args, **kwargs):
+            now = time.time()
+            start, expires_at = self.deadline(now)
+            if expires_at is not None and now >= expires_at:
+                self.rejected.inc()
+                self.rejected_age.record(now - start)
+                return rejection.flask_response()
+
+            self.admitted.inc()
+            g.deadline = Deadline(expires_at)
+            return view(*args, **kwargs)
+
+        return with_deadline
+
+
+def deadline(
+        budget: float | None = None,
+        deadline_header: str | None = "X-Request-Deadline",
+        start_header: str | None = "X-Request-Start",
+):
+    def deadline_decorator(func):
+        func.deadline_policy = DeadlinePolicy(
+            budget=budget,
+            deadline_header=deadline_header,
+            start_header=start_header,
+        )
+        return func
+
+    return deadline_decorator
@@ -7,6 +7,7 @@ import openapi_pydantic as openapi
 from openapi_pydantic.util import PydanticSchema
 from pydantic import BaseModel
 
+from flask_typed.codecs import DEFAULT_CODEC, media_types
 from flask_typed.errors import HttpError
 from flask_typed.response import BaseResponse
 
@@ -18,11 +19,14 @@ class ResponseInfo(NamedTuple):
 
 class ResponsesDocsBuilder:
 
-    def __init__(self, return_type, docstring, docs):
+    def __init__(self, return_type, docstring, docs, errors=None, alternative_codecs=None):
         self.responses = defaultdict(lambda: defaultdict(list))
         self.return_type = return_type
         self.docs = docs
         self.docstring = docstring
+        self.errors = errors if errors is not None else []
+        # Handler specific codecs, which document their own schema for the model responses they can encode
+        self.alternative_codecs = alternative_codecs if alternative_codecs is not None else []
 
     def build(self) -> dict[str, openapi.Response]:
         origin_type = get_origin(self.return_type)
@@ -34,8 +38,12 @@ class ResponsesDocsBuilder:
         for response_type in types:
             self._add_response(response_type)
 
-        if self.docs:
-            for error_model in self.docs.errors:
+        documented_errors = self.docs.errors if self.docs else []
+        for error_model in documented_errors:
+            self._add_response(error_model)
+
+        for error_model in self.errors:
+            if error_model not in documented_errors:
                 self._add_response(error_model)
 
         return self._merge_responses()
@@ -44,29 +52,46 @@ class ResponsesDocsBuilder:
         if isclass(response_type):
             description = self._get_return_description(response_type)
             if issubclass(response_type, BaseModel):
-                status_code = response_type.model_config.get("status_code", 200)
-                self.responses[status_code]["application/json"].append(
-                    ResponseInfo(
-                        schema=PydanticSchema(schema_class=response_type),
-                        description=description
+                if issubclass(response_type, BaseResponse):
+                    # Model responses keep their own media type in place of the default codec
+                    status_code = response_type.status_code
+                    documented_types = [
+                        response_type.mime_type if media_type == DEFAULT_CODEC.media_type else media_type
+                        for media_type in media_types()
+                    ]
+                else:
+                    status_code = response_type.model_config.get("status_code", 200)
+                    documented_types = media_types()
+                for media_type in documented_types:
+                    self.responses[status_code][media_type].append(
+                        ResponseInfo(
+                            schema=PydanticSchema(schema_class=response_type),
+                            description=description
+                        )
                     )
-                )
+                for codec in self.alternative_codecs:
+                    if (schema := codec.schema(response_type)) is not None:
+                        self.responses[status_code][codec.media_type].append(
+                            ResponseInfo(
+                                schema=schema,
+                                description=description
+                            )
+                        )
             elif issubclass(response_type, BaseResponse):
                 status_code = response_type.status_code
-                mime_type = response_type.mime_type
-                schema = response_type.schema()
-                if not isinstance(schema, openapi.Schema):
-                    raise TypeError(
-                        f"Response type {response_type} extending BaseResponse"
-                        f" does not implement schema() method properly: {schema}"
+                for mime_type, schema in response_type.content_schemas().items():
+                    if not isinstance(schema, openapi.Schema):
+                        raise TypeError(
+                            f"Response type {response_type} extending BaseResponse"
+                            f" does not implement schema() method properly: {schema}"
+                        )
+
+                    self.responses[status_code][mime_type].append(
+                        ResponseInfo(
+                            schema=schema,
+                            description=description
+                        )
                     )
-
-                self.responses[status_code][mime_type].append(
-                    ResponseInfo(
-                        schema=schema,
-                        description=description
-                    )
-                )
             elif issubclass(response_type, HttpError):
                 self.responses[response_type.status_code]["application/json"].append(
                     ResponseInfo(
@@ -5,7 +5,7 @@ from flask import current_app
 from pydantic import BaseModel
 
 from http import HTTPStatus
-from .response import BaseResponse
+from .response import BaseResponse, PrecomputedResponse
 
 
 class BaseHttpError(Exception, BaseResponse, ABC):
@@ -24,9 +24,10 @@ class HttpError(BaseHttpError):
                 f"ResponseModel should inherit pydantic BaseModel: {cls.__name__}"
             )
 
-    def __init__(self, status_code: int | None = None, **kwargs):
+    def __init__(self, status_code: int | None = None, headers: dict[str, str] | None = None, **kwargs):
         cls = self.__class__
         self.status_code = cls.status_code if status_code is None else status_code
+        self.headers = headers
         self.response = cls.ResponseModel(**kwargs)
 
     def flask_response(self):
@@ -34,11 +35,20 @@ class HttpError(BaseHttpError):
             response=self.json(),
             status=self.status_code,
             mimetype=self.mime_type,
+            headers=self.headers,
         )
 
     def json(self) -> str:
         return self.response.model_dump_json()
 
+    def precompute(self) -> PrecomputedResponse:
+        return PrecomputedResponse(
+            body=self.json().encode(),
+            status_code=self.status_code,
+            mime_type=self.mime_type,
+            headers=self.headers,
+        )
+
     @classmethod
     def schema(cls) -> openapi.Schema:
         return openapi.Schema.model_validate(cls.ResponseModel.model_json_schema())
@@ -74,6 +84,11 @@ class ConflictError(HttpError):
     message = "Conflict"
 
 
+class PayloadTooLargeError(HttpError):
+    status_code = HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    message = "Payload too large"
+
+
 class UnsupportedMediaTypeError(HttpError):
     status_code = HTTPStatus.UNSUPPORTED_MEDIA_TYPE
     message = "Unsupported media type"
@@ -92,3 +107,14 @@ class TooManyRequestsError(HttpError):
 class InternalServerError(HttpError):
     status_code = HTTPStatus.INTERNAL_SERVER_ERROR
     message = "Internal server error"
+
+
+class ServiceUnavailableError(HttpError):
+    status_code = HTTPStatus.SERVICE_UNAVAILABLE
+    message = "Service unavailable"
+
+
+class GatewayTimeoutError(HttpError):
+    status_code = HTTPStatus.GATEWAY_TIMEOUT
+    message = "Gateway timeout"
+
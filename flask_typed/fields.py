@@ -0,0 +1,138 @@
+from functools import lru_cache, partial
+from inspect import isclass
+from types import UnionType, NoneType
+from typing import Any, get_origin, get_args, Union
+
+import openapi_pydantic as openapi
+from pydantic import BaseModel
+
+from .errors import BadRequestError
+
+_COLLECTION_TYPES = (list, set, frozenset, tuple)
+
+
+class _FieldNode:
+    __slots__ = ("name", "is_collection", "children")
+
+    def __init__(self, name: str, is_collection: bool, children: dict[str, '_FieldNode'] | None):
+        self.name = name
+        self.is_collection = is_collection
+        self.children = children
+
+
+def _unwrap(annotation) -> tuple[Any, bool]:
+    is_collection = False
+    while True:
+        origin = get_origin(annotation)
+        if origin in (UnionType, Union):
+            args = [arg for arg in get_args(annotation) if arg is not NoneType]
+            if len(args) != 1:
+                return annotation, is_collection
+            annotation = args[0]
+        elif origin in _COLLECTION_TYPES:
+            annotation = get_args(annotation)[0]
+            is_collection = True
+        elif origin is dict:
+            annotation = get_args(annotation)[1]
+            is_collection = True
+        else:
+            return annotation, is_collection
+
+
+def _build_tree(model: type[BaseModel], depth: int) -> dict[str, _FieldNode]:
+    tree = {}
+    for name, field in model.model_fields.items():
+        annotation, is_collection = _unwrap(field.annotation)
+        children = None
+        if depth > 1 and isclass(annotation) and issubclass(annotation, BaseModel):
+            children = _build_tree(annotation, depth - 1)
+        alias = field.serialization_alias or field.alias or name
+        tree[alias] = _FieldNode(name, is_collection, children)
+    return tree
+
+
+def _paths(tree: dict[str, _FieldNode], prefix: str = "") -> list[str]:
+    paths = []
+    for alias, node in tree.items():
+        paths.append(prefix + alias)
+        if node.children:
+            paths.extend(_paths(node.children, f"{prefix}{alias}."))
+    return paths
+
+
+class FieldSelector:
+
+    def __init__(self, model: type[BaseModel], query_param: str = "fields", max_depth: int = 3, cache_size: int = 1024):
+        if not (isclass(model) and issubclass(model, BaseModel)):
+            raise TypeError(f"Sparse fieldsets require a pydantic model return type: {model}")
+        self.model = model
+        self.query_param = query_param
+        self._tree = _build_tree(model, max_depth)
+        self.allowed_fields = _paths(self._tree)
+        # Include sets are cached per distinct selector string
+        self.parse = lru_cache(maxsize=cache_size)(self._parse)
+
+    def from_request(self, request) -> tuple[str | None, dict | None]:
+        selector = request.args.get(self.query_param)
+        if not selector:
+            return None, None
+        return selector, self.parse(selector)
+
+    def _parse(self, selector: str) -> dict:
+        include = {}
+        unknown = []
+        for path in selector.split(","):
+            path = path.strip()
+            if path and not self._add_path(include, path):
+                unknown.append(path)
+
+        if unknown:
+            raise BadRequestError(message=f"Unknown fields: {', '.join(unknown)}")
+        return include
+
+    def _add_path(self, include: dict, path: str) -> bool:
+        tree = self._tree
+        target = include
+        segments = path.split(".")
+        for i, segment in enumerate(segments):
+            if tree is None or (node := tree.get(segment)) is None:
+                return False
+
+            is_last = i == len(segments) - 1
+            if is_last:
+                target[node.name] = True
+                return True
+
+            current = target.get(node.name)
+            if current is True:
+                # Parent field is already included as a whole
+                return True
+            if current is None:
+                current = target[node.name] = {}
+            if node.is_collection:
+                current = current.setdefault("__all__", {})
+            target = current
+            tree = node.children
+        return True
+
+    def to_openapi_parameter(self) -> openapi.Parameter:
+        return openapi.Parameter(
+            name=self.query_param,
+            description="Comma separated list of fields to include in the response",
+            param_in="query",
+            param_schema=openapi.Schema(
+                type="array",
+                items=openapi.Schema(type="string", enum=self.allowed_fields),
+            ),
+            style="form",
+            explode=False,
+            required=False,
+        )
+
+
+def sparse_fields(query_param: str = "fields", max_depth: int = 3, cache_size: int = 1024):
+    def sparse_fields_decorator(func):
+        func.sparse_fields = partial(FieldSelector, query_param=query_param, max_depth=max_depth, cache_size=cache_size)
+        return func
+
+    return sparse_fields_decorator
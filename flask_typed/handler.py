@@ -4,31 +4,242 @@ from typing import Any, get_origin, Annotated, get_args, Type
 
 import openapi_pydantic as openapi
 from flask import request, current_app
+from flask.json.provider import DefaultJSONProvider
 from pydantic import BaseModel
 
 from flask_typed.docs.responses import ResponsesDocsBuilder
 from flask_typed.docs.utils import Docstring
-from .errors import HttpError
+from .capture import TrafficCapture
+from .coalesce import default_key
+from .codecs import Codec, CODECS, DEFAULT_CODEC, response_codec
+from .concurrency import ConcurrencyLimit, ConcurrencyLimiter
+from .contracts import ContractChecker
+from .deadlines import DeadlinePolicy, DeadlineEnforcer
+from .errors import (
+    HttpError, BadRequestError, GatewayTimeoutError, ServiceUnavailableError,
+    TooManyRequestsError, PayloadTooLargeError
+)
+from .fields import FieldSelector
+from .json_backend import EXTENSION_NAME as JSON_EXTENSION
 from .parameter import ParameterLocation, Parameter, ParameterValidationError, ValidationError
-from .parsers import RequestParser
-from .response import BaseResponse
+from .pagination import Paginated, PageResult
+from .parsers import RequestParser, BodyParser, QueryParser, HeaderParser
+from .rate_limit import RateLimiter
+from .slow_requests import PhaseTimings, SlowRequestLog, SlowRequestTracker
+from .response import BaseResponse, ModelResponse
+from .uploads import UploadConfig, DEFAULT_UPLOAD_CONFIG
+
+
+def warmup_type(param_type, visited: set | None = None):
+    if visited is None:
+        visited = set()
+    # Self referencing models would otherwise be walked forever
+    if isclass(param_type):
+        if param_type in visited:
+            return
+        visited.add(param_type)
+    for arg in get_args(param_type):
+        warmup_type(arg, visited)
+    if isclass(param_type) and issubclass(param_type, BaseModel):
+        # Builds validators and serializers of models that defer building to their first use
+        param_type.model_rebuild()
+        for field in param_type.model_fields.values():
+            warmup_type(field.annotation, visited)
+    elif isclass(param_type) and issubclass(param_type, HttpError):
+        warmup_type(param_type.ResponseModel, visited)
+
+
+class ResponseOptions:
+    __slots__ = ("fields", "include", "codec", "timings")
+
+    def __init__(self):
+        self.fields: str | None = None
+        self.include: dict | None = None
+        self.codec: Codec = DEFAULT_CODEC
+        self.timings: PhaseTimings | None = None
+
+    def key(self) -> tuple:
+        return self.fields, self.codec.media_type
+
+
+class HandlerDocs:
+    __slots__ = ("docstring", "docs_metadata", "responses")
+
+    def __init__(self, handler, return_type, errors: list[Type[HttpError]]):
+        docstring = getattr(handler, "__doc__", None)
+        self.docstring = Docstring(docstring) if docstring else None
+        self.docs_metadata = getattr(handler, "docs_metadata", None)
+        columnar = getattr(handler, "columnar", None)
+        self.responses = ResponsesDocsBuilder(
+            return_type=return_type,
+            docstring=self.docstring,
+            docs=self.docs_metadata,
+            errors=errors,
+            alternative_codecs=[columnar.codec] if columnar is not None else None
+        ).build()
+
+    def get_parameter_description(self, param_name) -> str:
+        return "" if self.docstring is None else self.docstring.get_parameter_description(param_name)
 
 
 class HttpHandler:
+    __slots__ = (
+        "resource_cls", "path", "handler", "return_type", "parameters", "request_parsers", "concurrency_limiter",
+        "rate_limiter", "field_selector", "contract_checker", "deadline_enforcer", "traffic_capture",
+        "slow_requests", "_docs"
+    )
 
     def __init__(self, path, resource_cls, handler):
         self.resource_cls = resource_cls
         self.path = path
         self.handler = handler
-        docstring = getattr(handler, "__doc__", None)
-        self.docstring = Docstring(docstring) if docstring else None
-        self.docs_metadata = getattr(handler, "docs_metadata", None)
-        self.responses = None
+        self.return_type = None
         self.parameters: list[Parameter] = []
         self.request_parsers: dict[str, Type[RequestParser]] = {}
+        self.concurrency_limiter: ConcurrencyLimiter | None = None
+        self.rate_limiter: RateLimiter | None = None
+        self.field_selector: FieldSelector | None = None
+        self.contract_checker: ContractChecker | None = None
+        self.deadline_enforcer: DeadlineEnforcer | None = None
+        self.traffic_capture: TrafficCapture | None = None
+        self.slow_requests: SlowRequestTracker | None = None
+        self._docs: HandlerDocs | None = None
+
+        if (policy := getattr(handler, "deadline_policy", None)) is not None:
+            self.set_deadline_policy(policy)
+        if (limit := getattr(handler, "concurrency_limit", None)) is not None:
+            self.set_concurrency_limit(limit)
+        if (limit := getattr(handler, "rate_limit", None)) is not None:
+            self.rate_limiter = RateLimiter(limit, scope=handler.__qualname__)
 
         self._process_annotations()
 
+        if (coalescer := getattr(handler, "coalescer", None)) is not None and coalescer.key is default_key \
+                and self.request_parsers:
+            # Parsed request objects have no value identity, every request would get its own key
+            raise ValueError(
+                f"Coalesced handler '{handler.__qualname__}' takes request parsers "
+                f"({', '.join(self.request_parsers)}), an explicit key function is required"
+            )
+        if getattr(handler, "idempotency", None) is not None \
+                and (streamed := [name for name, parser in self.request_parsers.items() if parser.reads_stream]):
+            # Fingerprinting the request would consume the body before the handler reads it
+            raise ValueError(
+                f"Idempotent handler '{handler.__qualname__}' streams the request body ({', '.join(streamed)})"
+            )
+
+        if (field_selector := getattr(handler, "sparse_fields", None)) is not None:
+            self.field_selector = field_selector(self.return_type)
+        if (sample_rate := getattr(handler, "contract_sample_rate", None)) is not None:
+            self.set_contract_sampling(sample_rate)
+
+    @property
+    def docs(self) -> HandlerDocs:
+        # Docs data is only needed while generating the OpenAPI document, so it is built on demand
+        # and can be dropped afterwards with release_docs()
+        if self._docs is None:
+            self._docs = HandlerDocs(self.handler, self.documented_return_type(), self._implicit_errors())
+        return self._docs
+
+    def documented_return_type(self):
+        if (background := getattr(self.handler, "background_tasks", None)) is not None:
+            return background.response_type
+        return self.return_type
+
+    def paginated_type(self) -> type[Paginated] | None:
+        # Page results returned by the handler are converted into this model
+        if isclass(self.return_type) and issubclass(self.return_type, Paginated):
+            return self.return_type
+        return None
+
+    def _implicit_errors(self) -> list[Type[HttpError]]:
+        errors = [error for parser in self.request_parsers.values() for error in parser.errors]
+        if (background := getattr(self.handler, "background_tasks", None)) is not None:
+            errors.extend(background.implicit_errors())
+        if getattr(self.handler, "coalescer", None) is not None or self.deadline_enforcer is not None:
+            errors.append(GatewayTimeoutError)
+        if self.concurrency_limiter is not None:
+            errors.append(ServiceUnavailableError)
+        if self.rate_limiter is not None:
+            errors.append(TooManyRequestsError)
+        if self._upload_config() is not None:
+            errors.append(PayloadTooLargeError)
+        if self.field_selector is not None:
+            errors.append(BadRequestError)
+        if (idempotency := getattr(self.handler, "idempotency", None)) is not None:
+            errors.extend(idempotency.implicit_errors())
+        return errors
+
+    def declared_errors(self) -> list[Type[HttpError]]:
+        docs_metadata = getattr(self.handler, "docs_metadata", None)
+        declared = [
+            error if isclass(error) else type(error) for error in (docs_metadata.errors if docs_metadata else [])
+        ]
+        return [*declared, *self._implicit_errors()]
+
+    def release_docs(self):
+        self._docs = None
+
+    def set_concurrency_limit(self, limit: ConcurrencyLimit):
+        self.concurrency_limiter = ConcurrencyLimiter(limit)
+
+    def set_deadline_policy(self, policy: DeadlinePolicy):
+        self.deadline_enforcer = DeadlineEnforcer(policy)
+
+    def set_slow_request_log(self, log: SlowRequestLog):
+        self.slow_requests = SlowRequestTracker(
+            log=log,
+            endpoint=f"{self.handler.__name__.upper()} {self.path.path}",
+            threshold=getattr(self.handler, "slow_request_threshold", None),
+            redact={**log.redact, **getattr(self.handler, "slow_request_redact", {})},
+        )
+
+    def set_contract_sampling(self, sample_rate: float):
+        self.contract_checker = ContractChecker(
+            name=self.handler.__qualname__,
+            return_type=self.return_type,
+            sample_rate=sample_rate,
+            errors=self.declared_errors(),
+        )
+
+    def warmup(self):
+        for param in self.parameters:
+            warmup_type(param.type)
+        for parser in self.request_parsers.values():
+            parser.warmup()
+        warmup_type(self.return_type)
+        warmup_type(ValidationError)
+
+    def validate_arguments(self, arguments: dict[str, Any], request) -> dict[str, Any]:
+        # Counterpart of the request validation for already typed arguments, used by the test client
+        expected = {param.name for param in self.parameters} | self.request_parsers.keys()
+        if unexpected := arguments.keys() - expected:
+            raise TypeError(f"Unexpected arguments for {self.handler.__qualname__}: {', '.join(sorted(unexpected))}")
+
+        validated_args = {}
+        validation_errors = []
+        for param in self.parameters:
+            try:
+                validated_args[param.name] = param.validate_value(arguments.get(param.name))
+            except ParameterValidationError as e:
+                validation_errors.append(e)
+
+        for name, parser in self.request_parsers.items():
+            if isinstance(value := arguments.get(name), parser):
+                validated_args[name] = value
+                continue
+            try:
+                validated_args[name] = parser.parse_request(request)
+            except ParameterValidationError as e:
+                validation_errors.append(e)
+
+        if validation_errors:
+            raise ValidationError(errors=[
+                err.to_model() for err in validation_errors
+            ])
+
+        return validated_args
+
     def _process_annotations(self):
         handler_signature = inspect.signature(self.handler)
         for parameter in handler_signature.parameters.values():
@@ -74,46 +285,110 @@ class HttpHandler:
                 source=source_name,
                 location=location,
                 param_type=param_type,
-                description=self._get_parameter_description(parameter.name),
                 default_value=default_value
             )
 
             self.parameters.append(parameter)
 
-        self.responses = ResponsesDocsBuilder(
-            return_type=handler_signature.return_annotation,
-            docstring=self.docstring,
-            docs=self.docs_metadata
-        ).build()
+        self.return_type = handler_signature.return_annotation
 
     def generate_operation(self) -> openapi.Operation:
+        docs = self.docs
         doc_parameters = []
         request_body = None
+        form_parameters = []
         for param in self.parameters:
             match param.location:
                 case ParameterLocation.QUERY | ParameterLocation.PATH | ParameterLocation.HEADER:
-                    doc_parameters.extend(param.to_openapi_parameters())
+                    doc_parameters.extend(
+                        param.to_openapi_parameters(docs.get_parameter_description(param.name))
+                    )
                 case ParameterLocation.BODY:
                     request_body = param.to_openapi_request_body()
+                case ParameterLocation.FORM | ParameterLocation.FILE:
+                    form_parameters.append(param)
+
+        if self.field_selector is not None:
+            doc_parameters.append(self.field_selector.to_openapi_parameter())
+        if (idempotency := getattr(self.handler, "idempotency", None)) is not None:
+            doc_parameters.append(idempotency.to_openapi_parameter())
+        if (columnar := getattr(self.handler, "columnar", None)) is not None and columnar.query_param is not None:
+            doc_parameters.append(columnar.to_openapi_parameter())
+
+        if form_parameters:
+            request_body = self._multipart_request_body(form_parameters, docs)
+
+        for parser in self.request_parsers.values():
+            # Parsers without a schema are left out of the documentation
+            try:
+                if issubclass(parser, BodyParser):
+                    request_body = parser.schema()
+                elif issubclass(parser, (QueryParser, HeaderParser)):
+                    doc_parameters.extend(parser.schema())
+            except NotImplementedError:
+                pass
 
         return openapi.Operation(
             parameters=doc_parameters,
-            responses=self.responses,
+            responses=docs.responses,
             requestBody=request_body,
-            summary=self.docstring.short_description if self.docstring else "",
-            description=self.docstring.long_description if self.docstring else "",
+            summary=docs.docstring.short_description if docs.docstring else "",
+            description=docs.docstring.long_description if docs.docstring else "",
         )
 
+    @staticmethod
+    def _multipart_request_body(parameters: list[Parameter], docs: HandlerDocs) -> openapi.RequestBody:
+        properties = {}
+        for param in parameters:
+            schema = param.to_openapi_property()
+            if description := docs.get_parameter_description(param.name):
+                schema = schema.model_copy(update={"description": description})
+            properties[param.source] = schema
+
+        return openapi.RequestBody(
+            content={
+                "multipart/form-data": openapi.MediaType(
+                    schema=openapi.Schema(
+                        type="object",
+                        properties=properties,
+                        required=[param.source for param in parameters if not param.is_optional] or None
+                    )
+                )
+            }
+        )
+
+    def _upload_config(self) -> UploadConfig | None:
+        if not any(param.location in (ParameterLocation.FORM, ParameterLocation.FILE) for param in self.parameters):
+            return None
+        return getattr(self.handler, "upload_config", DEFAULT_UPLOAD_CONFIG)
+
     def get_handler(self):
         parameters = self.parameters
         parsers = self.request_parsers
         handler = self.handler
         resource_cls = self.resource_cls
+        coalescer = getattr(handler, "coalescer", None)
+        idempotency = getattr(handler, "idempotency", None)
+        columnar = getattr(handler, "columnar", None)
+        background = getattr(handler, "background_tasks", None)
+        concurrency_limiter = self.concurrency_limiter
+        rate_limiter = self.rate_limiter
+        deadline_enforcer = self.deadline_enforcer
+        traffic_capture = self.traffic_capture
+        slow_requests = self.slow_requests
+        paginated = self.paginated_type()
+        upload_config = self._upload_config()
+        field_selector = self.field_selector
+        negotiate = len(CODECS) > 1 or columnar is not None
+        contract_checker = self.contract_checker
 
         def perform_validation(kwargs) -> dict[str, Any]:
             validated_args = {}
             validation_errors = []
 
+            if upload_config is not None:
+                upload_config.prepare_request(request)
+
             for param in parameters:
                 try:
                     validated_args[param.name] = param.validate(request, kwargs)
@@ -133,29 +408,101 @@ class HttpHandler:
 
             return validated_args
 
-        def validated(*_args, **kwargs):
+        def make_response(response_value, options: ResponseOptions):
+            if isinstance(response_value, ModelResponse):
+                response = response_value.flask_response(include=options.include, codec=options.codec)
+            elif isinstance(response_value, BaseResponse):
+                return response_value.flask_response()
+            elif isinstance(response_value, BaseModel):
+                codec = options.codec
+                response = current_app.response_class(
+                    response=codec.dump_model(response_value, by_alias=True, include=options.include),
+                    status=response_value.model_config.get("status_code", 200),
+                    mimetype=codec.media_type,
+                )
+            elif isinstance(response_value, (dict, list)) and type(current_app.json) is DefaultJSONProvider \
+                    and (provider := current_app.extensions.get(JSON_EXTENSION)) is not None:
+                # Plain values use the JSON backend of the API, unless the application has its own JSON provider
+                return provider.response(response_value)
+            else:
+                return response_value
+            if negotiate:
+                response.vary.add("Accept")
+            return response
+
+        def execute(validated_args, options: ResponseOptions):
+            sampled = contract_checker is not None and contract_checker.sample()
+            timings = options.timings
             try:
-                validated_args = perform_validation(kwargs)
+                response_value = handler(resource_cls(), **validated_args)
             except HttpError as e:
+                if sampled:
+                    contract_checker.check_error(e)
                 return e.flask_response()
 
+            if paginated is not None and isinstance(response_value, PageResult):
+                # Rows are fetched from the handler's iterator here, the next cursor comes from the last row
+                response_value = response_value.to_model(paginated)
+            if timings is not None:
+                timings.mark("handler")
+            response = make_response(response_value, options)
+            if timings is not None:
+                timings.mark("serialization")
+            if sampled:
+                contract_checker.check(response_value, response, options.include)
+            return response
+
+        if background is not None:
+            execute = background.wrap(handler, resource_cls, execute)
+        if coalescer is not None:
+            execute = coalescer.wrap(execute)
+        if idempotency is not None:
+            execute = idempotency.wrap(f"{handler.__name__.upper()} {self.path.path}", execute)
+
+        def negotiate_options(options: ResponseOptions):
+            if field_selector is not None:
+                options.fields, options.include = field_selector.from_request(request)
+            if columnar is not None and columnar.requested(request):
+                options.codec = columnar.codec
+            elif negotiate:
+                options.codec = response_codec(request.accept_mimetypes)
+
+        def validated(*_args, **kwargs):
             try:
-                response_value = handler(resource_cls(), **validated_args)
+                options = ResponseOptions()
+                negotiate_options(options)
+                return execute(perform_validation(kwargs), options)
             except HttpError as e:
                 return e.flask_response()
 
-            if isinstance(response_value, BaseResponse):
-                return response_value.flask_response()
-            if isinstance(response_value, BaseModel):
-                return current_app.response_class(
-                    response=response_value.model_dump_json(by_alias=True),
-                    status=response_value.model_config.get("status_code", 200),
-                    mimetype='application/json',
-                )
-            else:
-                return response_value
+        def timed(*_args, **kwargs):
+            # Same as validated, with the time of each phase recorded for the slow request log
+            options = ResponseOptions()
+            options.timings = timings = PhaseTimings()
+            validated_args = None
+            try:
+                negotiate_options(options)
+                validated_args = perform_validation(kwargs)
+                timings.mark("validation")
+                response = execute(validated_args, options)
+            except HttpError as e:
+                response = e.flask_response()
+            slow_requests.observe(timings, validated_args, response)
+            return response
 
-        return validated
+        if slow_requests is not None:
+            validated = timed
 
-    def _get_parameter_description(self, param_name) -> str:
-        return "" if self.docstring is None else self.docstring.get_parameter_description(param_name)
+        if concurrency_limiter is not None:
+            # Requests are admitted or shed before spending any time on validation
+            validated = concurrency_limiter.wrap(validated)
+        if rate_limiter is not None:
+            validated = rate_limiter.wrap(validated)
+        if deadline_enforcer is not None:
+            # Requests past their deadline are rejected first, without waiting for any limiter
+            validated = deadline_enforcer.wrap(validated)
+        if traffic_capture is not None:
+            # Rejected requests are captured as well, they are part of the real traffic
+            validated = traffic_capture.wrap(f"{handler.__name__.upper()} {self.path.path}", validated)
+
+        return validated
@@ -0,0 +1,212 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, NamedTuple
+
+import openapi_pydantic as openapi
+from flask import request, current_app
+
+from .cache import LRUCache
+from .coalesce import SingleFlight
+from .errors import BadRequestError, UnprocessableContentError, GatewayTimeoutError, HttpError
+from .json_backend import get_json_backend
+
+
+class StoredResponse(NamedTuple):
+    fingerprint: str
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+
+
+class IdempotencyStore:
+
+    def get(self, key: str) -> StoredResponse | None:
+        raise NotImplementedError
+
+    def set(self, key: str, response: StoredResponse, ttl: float):
+        raise NotImplementedError
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+
+    def __init__(self, maxsize: int = 10000):
+        self._cache = LRUCache(maxsize=maxsize)
+
+    def get(self, key: str) -> StoredResponse | None:
+        return self._cache.get(key, None)
+
+    def set(self, key: str, response: StoredResponse, ttl: float):
+        self._cache.set(key, response, ttl=ttl)
+
+
+class SQLiteIdempotencyStore(IdempotencyStore):
+    # Stored responses are shared by the processes using the file, but duplicates are only held back while
+    # the first request is in flight within the same process: concurrent duplicates sent to different workers
+    # can both run the handler, the response stored last is then replayed
+
+    def __init__(self, path: str, timeout: float = 5.0, purge_interval: int = 1000):
+        self.path = path
+        self.timeout = timeout
+        self.purge_interval = purge_interval
+        self._writes = 0
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS idempotency_responses "
+                "(key TEXT PRIMARY KEY, fingerprint TEXT, status INTEGER, headers TEXT, body BLOB, expires REAL)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        if (connection := getattr(self._local, "connection", None)) is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> StoredResponse | None:
+        row = self._connection().execute(
+            "SELECT fingerprint, status, headers, body FROM idempotency_responses WHERE key = ? AND expires > ?",
+            (key, time.time())
+        ).fetchone()
+        if row is None:
+            return None
+        fingerprint, status, headers, body = row
+        return StoredResponse(fingerprint, status, [tuple(header) for header in get_json_backend().loads(headers)], body)
+
+    def set(self, key: str, response: StoredResponse, ttl: float):
+        connection = self._connection()
+        now = time.time()
+        connection.execute(
+            "INSERT OR REPLACE INTO idempotency_responses (key, fingerprint, status, headers, body, expires) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, response.fingerprint, response.status, get_json_backend().dumps(response.headers), response.body,
+             now + ttl)
+        )
+        self._writes += 1
+        if self._writes % self.purge_interval == 0:
+            # Expired rows are never read, they are only deleted from time to time to keep the file small
+            connection.execute("DELETE FROM idempotency_responses WHERE expires <= ?", (now,))
+
+
+def request_fingerprint() -> str:
+    digest = hashlib.sha256()
+    digest.update(request.method.encode())
+    digest.update(b"\0")
+    digest.update(request.full_path.encode())
+    digest.update(b"\0")
+    digest.update(request.get_data())
+    if "form" in request.__dict__:
+        # Form bodies are consumed by the form parser, so the parsed fields and uploaded files are hashed instead
+        for name, value in request.form.items(multi=True):
+            digest.update(b"\0%s\0%s" % (name.encode(), value.encode()))
+        for name, storage in request.files.items(multi=True):
+            digest.update(b"\0%s\0%s\0" % (name.encode(), (storage.filename or "").encode()))
+            _update_from_stream(digest, storage.stream)
+    return digest.hexdigest()
+
+
+def _update_from_stream(digest, stream, chunk_size: int = 65536):
+    position = stream.tell()
+    stream.seek(0)
+    try:
+        while chunk := stream.read(chunk_size):
+            digest.update(chunk)
+    finally:
+        stream.seek(position)
+
+
+class Idempotency:
+
+    def __init__(
+            self,
+            store: IdempotencyStore | None = None,
+            ttl: float = 86400,
+            header: str = "Idempotency-Key",
+            required: bool = False,
+            timeout: float = 10.0,
+    ):
+        self.store = store if store is not None else MemoryIdempotencyStore()
+        self.ttl = ttl
+        self.header = header
+        self.required = required
+        self.single_flight = SingleFlight(timeout)
+        self._missing_key = BadRequestError(message=f"{header} header is required").precompute()
+        self._mismatch = UnprocessableContentError(
+            message=f"{header} has already been used for a different request"
+        ).precompute()
+
+    def implicit_errors(self) -> list[type[HttpError]]:
+        # Duplicates waiting on the first request time out with 504
+        errors = [UnprocessableContentError, GatewayTimeoutError]
+        return [BadRequestError, *errors] if self.required else errors
+
+    def to_openapi_parameter(self) -> openapi.Parameter:
+        return openapi.Parameter(
+            name=self.header,
+            description="Retries with the same key receive the response of the first request",
+            param_in="header",
+            param_schema=openapi.Schema(type="string"),
+            required=self.required,
+        )
+
+    def wrap(self, scope: str, execute: Callable[[dict[str, Any], Any], Any]) -> Callable[[dict[str, Any], Any], Any]:
+        store = self.store
+        single_flight = self.single_flight
+
+        def replay(stored: StoredResponse, fingerprint: str, replayed: bool):
+            if stored.fingerprint != fingerprint:
+                return self._mismatch.flask_response()
+            response = current_app.response_class(response=stored.body, status=stored.status, headers=stored.headers)
+            if replayed:
+                response.headers["Idempotent-Replayed"] = "true"
+            return response
+
+        def idempotent(validated_args, options):
+            if (idempotency_key := request.headers.get(self.header)) is None:
+                if self.required:
+                    return self._missing_key.flask_response()
+                return execute(validated_args, options)
+
+            key = f"{scope}:{idempotency_key}"
+            fingerprint = request_fingerprint()
+            if (stored := store.get(key)) is not None:
+                return replay(stored, fingerprint, replayed=True)
+
+            executed = False
+
+            def run():
+                nonlocal executed
+                # A duplicate arriving just as the first request finished missed the response in the store above
+                if (stored_response := store.get(key)) is not None:
+                    return stored_response
+                executed = True
+                response = current_app.make_response(execute(validated_args, options))
+                stored_response = StoredResponse(
+                    fingerprint, response.status_code, list(response.headers), response.get_data()
+                )
+                # Server errors are not stored, so a retry can still succeed
+                if response.status_code < 500:
+                    store.set(key, stored_response, self.ttl)
+                return stored_response
+
+            # Concurrent duplicates wait for the first request rather than running the handler again
+            stored = single_flight.do(key, run)
+            return replay(stored, fingerprint, replayed=not executed)
+
+        return idempotent
+
+
+def idempotent(
+        store: IdempotencyStore | None = None,
+        ttl: float = 86400,
+        header: str = "Idempotency-Key",
+        required: bool = False,
+        timeout: float = 10.0,
+):
+    def idempotent_decorator(func):
+        func.idempotency = Idempotency(store=store, ttl=ttl, header=header, required=required, timeout=timeout)
+        return func
+
+    return idempotent_decorator
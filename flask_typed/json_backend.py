@@ -0,0 +1,91 @@
+import json
+from typing import Any, Callable
+
+from flask import Flask, current_app, has_app_context
+from flask.json.provider import DefaultJSONProvider
+
+
+class JsonBackend:
+
+    def loads(self, data: bytes | str) -> Any:
+        raise NotImplementedError
+
+    def dumps(
+            self,
+            value: Any,
+            default: Callable[[Any], Any] | None = None,
+            sort_keys: bool = False,
+            indent: bool = False
+    ) -> bytes:
+        raise NotImplementedError
+
+
+class StdlibJsonBackend(JsonBackend):
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(self, value, default=None, sort_keys=False, indent=False) -> bytes:
+        return json.dumps(
+            value,
+            default=default,
+            sort_keys=sort_keys,
+            indent=2 if indent else None,
+            separators=None if indent else (",", ":"),
+        ).encode()
+
+
+class OrjsonBackend(JsonBackend):
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+        # Datetimes and dataclasses are passed to the default function, as json.dumps would do
+        self._options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+        self._fallback = StdlibJsonBackend()
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, value, default=None, sort_keys=False, indent=False) -> bytes:
+        options = self._options
+        if sort_keys:
+            options |= self._orjson.OPT_SORT_KEYS
+        if indent:
+            options |= self._orjson.OPT_INDENT_2
+        try:
+            return self._orjson.dumps(value, default=default, option=options)
+        except TypeError:
+            # Values orjson does not support, like integers over 64 bits, are still serialized as json.dumps does
+            return self._fallback.dumps(value, default=default, sort_keys=sort_keys, indent=indent)
+
+
+EXTENSION_NAME = "flask_typed.json"
+
+# orjson is opt-in with TypedAPI(json_backend=OrjsonBackend()) rather than picked when it is installed:
+# it writes NaN and Infinity as null where json.dumps writes them as they are, so installing it
+# as a dependency of another package must not change the responses of an app
+DEFAULT_JSON_BACKEND: JsonBackend = StdlibJsonBackend()
+
+
+def get_json_backend() -> JsonBackend:
+    # Each application has its own backend, the standard library is used outside of an application context
+    if has_app_context() and (provider := current_app.extensions.get(EXTENSION_NAME)) is not None:
+        return provider.backend
+    return DEFAULT_JSON_BACKEND
+
+
+class BackendJSONProvider(DefaultJSONProvider):
+
+    def __init__(self, app: Flask, backend: JsonBackend):
+        super().__init__(app)
+        self.backend = backend
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        # Serialized bytes are passed to the response as they are, without decoding them to str
+        return self._app.response_class(
+            self.backend.dumps(obj, default=self.default, sort_keys=self.sort_keys, indent=indent) + b"\n",
+            mimetype=self.mimetype
+        )
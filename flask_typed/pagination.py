@@ -0,0 +1,129 @@
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, ClassVar, Generic, Iterable, TypeVar, get_origin
+from urllib.parse import urlencode
+
+import openapi_pydantic as openapi
+from flask import Request, current_app, request
+from itsdangerous import BadSignature, URLSafeSerializer
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import to_jsonable_python
+
+from .errors import BadRequestError
+from .parsers import QueryParser
+
+T = TypeVar("T")
+
+
+def _serializer(endpoint: str | None) -> URLSafeSerializer:
+    if not current_app.secret_key:
+        raise RuntimeError("Pagination cursors are signed with the application SECRET_KEY, which is not set")
+    # Cursors of one endpoint are not accepted by another one
+    return URLSafeSerializer(current_app.secret_key, salt=f"flask-typed.cursor.{endpoint}")
+
+
+@lru_cache(maxsize=None)
+def _key_adapter(key_type: Any) -> TypeAdapter:
+    # Keys of a single value are stored in the cursor as a tuple of one item
+    return TypeAdapter(key_type if get_origin(key_type) is tuple else tuple[key_type])
+
+
+class Paginated(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
+    next: str | None = None
+
+
+class PageRequest(QueryParser):
+    cursor_param: ClassVar[str] = "cursor"
+    limit_param: ClassVar[str] = "limit"
+    default_limit: ClassVar[int] = 20
+    max_limit: ClassVar[int] = 100
+    # Type of the row keys, required for keys which are not JSON values like datetimes, so cursors decode back to it
+    key_type: ClassVar[Any] = None
+    errors = [BadRequestError]
+
+    def __init__(self, limit: int, after: tuple | None):
+        self.limit = limit
+        self.after = after
+
+    @property
+    def fetch_limit(self) -> int:
+        # One more row than the page tells whether there is a next page, without counting the rows
+        return self.limit + 1
+
+    @classmethod
+    def parse_request(cls, request: Request) -> 'PageRequest':
+        args = request.args
+        limit = cls.default_limit
+        if (raw_limit := args.get(cls.limit_param)) is not None:
+            try:
+                limit = int(raw_limit)
+            except ValueError:
+                raise BadRequestError(message=f"Invalid {cls.limit_param}: {raw_limit}")
+            if limit < 1:
+                raise BadRequestError(message=f"{cls.limit_param} should be positive")
+            limit = min(limit, cls.max_limit)
+
+        after = None
+        if cursor := args.get(cls.cursor_param):
+            try:
+                after = tuple(_serializer(request.endpoint).loads(cursor))
+                if cls.key_type is not None:
+                    after = _key_adapter(cls.key_type).validate_python(after)
+            except (BadSignature, ValidationError):
+                raise BadRequestError(message="Invalid cursor")
+        return cls(limit, after)
+
+    @classmethod
+    def schema(cls) -> list[openapi.Parameter]:
+        return [
+            openapi.Parameter(
+                name=cls.cursor_param,
+                description="Opaque cursor of the next page, taken from the previous response",
+                param_in="query",
+                param_schema=openapi.Schema(type="string"),
+                required=False,
+            ),
+            openapi.Parameter(
+                name=cls.limit_param,
+                description="Number of items in the page",
+                param_in="query",
+                param_schema=openapi.Schema(
+                    type="integer", minimum=1, maximum=cls.max_limit, default=cls.default_limit
+                ),
+                required=False,
+            ),
+        ]
+
+    def results(self, rows: Iterable[T], key: Callable[[T], Any]) -> 'PageResult[T]':
+        return PageResult(self, rows, key)
+
+
+class PageResult(Generic[T]):
+    __slots__ = ("page", "rows", "key")
+
+    def __init__(self, page: PageRequest, rows: Iterable[T], key: Callable[[T], Any]):
+        self.page = page
+        self.rows = rows
+        self.key = key
+
+    def to_model(self, model_type: type[Paginated]) -> Paginated:
+        page = self.page
+        rows = list(islice(self.rows, page.fetch_limit))
+        if len(rows) <= page.limit:
+            return model_type(items=rows)
+
+        items = rows[:page.limit]
+        key = self.key(items[-1])
+        key = key if isinstance(key, tuple) else (key,)
+        if page.key_type is not None:
+            values = _key_adapter(page.key_type).dump_python(key, mode="json")
+        elif (values := to_jsonable_python(key)) != list(key):
+            raise TypeError(
+                f"Key {key!r} of {type(page).__name__} would not be decoded back from the cursor, set its key_type"
+            )
+        cursor = _serializer(request.endpoint).dumps(values)
+        args = request.args.copy()
+        args[page.cursor_param] = cursor
+        return model_type(items=items, next_cursor=cursor, next=f"{request.path}?{urlencode(list(args.items(multi=True)))}")
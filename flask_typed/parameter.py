@@ -1,8 +1,7 @@
-import json
 from enum import IntEnum
 from inspect import isclass
 from types import UnionType, NoneType
-from typing import Type, Any, get_origin, get_args, Sequence
+from typing import Type, Any, get_origin, get_args, Sequence, NamedTuple
 
 import openapi_pydantic as openapi
 import pydantic
@@ -10,6 +9,7 @@ from openapi_pydantic.util import PydanticSchema
 from pydantic import BaseModel
 
 from flask_typed.docs.utils import get_builtin_type
+from .codecs import Codec, request_codec, media_types
 from .errors import HttpError
 from .parsers import QueryParser, HeaderParser
 from .validators import VALIDATORS
@@ -20,9 +20,55 @@ class ParameterLocation(IntEnum):
     QUERY = 2
     BODY = 3
     HEADER = 4
+    FORM = 5
+    FILE = 6
+
+
+def _get_query_param(param, request, _path_params):
+    return request.args.get(param.source)
+
+
+def _get_header_param(param, request, _path_params):
+    return request.headers.get(param.source)
+
+
+def _get_path_param(param, _request, path_params):
+    return path_params.get(param.source)
+
+
+class RawBody(NamedTuple):
+    codec: Codec
+    data: bytes
+
+
+def _get_body_param(_param, request, _path_params):
+    if not (data := request.get_data()):
+        return None
+    return RawBody(request_codec(request.mimetype), data)
+
+
+def _get_form_param(param, request, _path_params):
+    return request.form.get(param.source)
+
+
+def _get_file_param(param, request, _path_params):
+    return request.files.get(param.source)
+
+
+_DATA_GETTERS = {
+    ParameterLocation.QUERY: _get_query_param,
+    ParameterLocation.HEADER: _get_header_param,
+    ParameterLocation.PATH: _get_path_param,
+    ParameterLocation.BODY: _get_body_param,
+    ParameterLocation.FORM: _get_form_param,
+    ParameterLocation.FILE: _get_file_param,
+}
 
 
 class Parameter:
+    __slots__ = (
+        "name", "source", "location", "is_optional", "type", "default_value", "validator", "_get_data", "_adapter"
+    )
 
     def __init__(
             self,
@@ -30,16 +76,15 @@ class Parameter:
             source: str,
             location: ParameterLocation,
             param_type: Type,
-            description: str,
             default_value: Any,
     ):
         self.name = name
         self.source = source
         self.location = location
-        self.description = description
         self.is_optional = False
         self.type = param_type
         self.default_value = default_value
+        self._adapter = None
 
         self._init_types(param_type)
         self._init_data_getter()
@@ -66,53 +111,69 @@ class Parameter:
             self.is_optional = True
 
     def _init_data_getter(self):
-        match self.location:
-            case ParameterLocation.QUERY:
-                def get_query_param(request, _path_params):
-                    return request.args.get(self.source)
-                self.get_data = get_query_param
-            case ParameterLocation.HEADER:
-                def get_header_param(request, _path_params):
-                    return request.headers.get(self.source)
-                self.get_data = get_header_param
-            case ParameterLocation.PATH:
-                def get_path_param(_request, path_params):
-                    return path_params.get(self.source)
-                self.get_data = get_path_param
-            case ParameterLocation.BODY:
-                def get_body_param(request, _path_params):
-                    return request.data
-                self.get_data = get_body_param
-            case _:
-                raise ValueError(f"Invalid parameter location: {self.location}")
+        # Getters are shared module level functions rather than per instance closures
+        if (getter := _DATA_GETTERS.get(self.location)) is None:
+            raise ValueError(f"Invalid parameter location: {self.location}")
+        self._get_data = getter
+
+    def get_data(self, request, path_params):
+        return self._get_data(self, request, path_params)
 
     def _init_validator(self, param_type):
-        if issubclass(param_type, BaseModel):
-            def model_validator(value):
-                return param_type.model_validate(
-                    json.loads(value)
-                )
-            self.validator = model_validator
+        if self.location == ParameterLocation.BODY:
+            if isclass(param_type) and issubclass(param_type, BaseModel):
+                def model_validator(body: RawBody):
+                    return body.codec.validate_model(param_type, body.data)
+                self.validator = model_validator
+            else:
+                adapter = pydantic.TypeAdapter(param_type)
+
+                def body_validator(body: RawBody):
+                    return body.codec.validate(adapter, body.data)
+                self.validator = body_validator
+        elif issubclass(param_type, BaseModel):
+            self.validator = param_type.model_validate_json
         elif validator := VALIDATORS.get(param_type):
             self.validator = validator
         else:
             self.validator = param_type
 
+    def _value_validator(self):
+        # Already typed values skip decoding, but are still validated against the same type
+        if self._adapter is None:
+            if isclass(self.type) and issubclass(self.type, BaseModel):
+                self._adapter = self.type.model_validate
+            elif self.location == ParameterLocation.FILE:
+                self._adapter = self._file_validator
+            else:
+                self._adapter = pydantic.TypeAdapter(self.type).validate_python
+        return self._adapter
+
+    def _file_validator(self, value):
+        return value if isinstance(value, self.type) else self.validator(value)
+
     def validate(self, request, path_params):
-        value = self.get_data(request, path_params)
+        return self._validate(self._get_data(self, request, path_params), self.validator)
+
+    def validate_value(self, value):
+        return self._validate(value, self._value_validator())
+
+    def _validate(self, value, validator):
         if value is None:
             if self.is_optional is True:
                 return self.default_value
             else:
                 raise ParameterValidationError(self, errors=["Parameter is not optional"])
         try:
-            return self.validator(value)
+            return validator(value)
+        except HttpError:
+            raise
         except pydantic.ValidationError as e:
             raise ParameterValidationError(self, errors=[e])
         except Exception as e:
             raise ParameterValidationError(self, errors=[str(e)])
 
-    def to_openapi_parameters(self) -> list[openapi.Parameter]:
+    def to_openapi_parameters(self, description: str = "") -> list[openapi.Parameter]:
         location = self.location.name.lower()
         parameters = []
         if isclass(self.type) and issubclass(self.type, BaseModel):
@@ -137,7 +198,7 @@ class Parameter:
             parameters.append(
                 openapi.Parameter(
                     name=self.source,
-                    description=self.description,
+                    description=description,
                     param_in=location,
                     param_schema=schema,
                     required=not self.is_optional
@@ -145,19 +206,30 @@ class Parameter:
             )
         return parameters
 
+    def to_openapi_property(self) -> openapi.Schema:
+        if self.location == ParameterLocation.FILE:
+            return openapi.Schema(type="string", format="binary")
+        if isclass(self.type) and issubclass(self.type, BaseModel):
+            return PydanticSchema(schema_class=self.type)
+
+        schema = get_builtin_type(self.type)
+        if schema is None:
+            raise TypeError(f"Unsupported type for parameter '{self.name}': {self.type}")
+        if self.default_value is not Ellipsis:
+            schema.default = self.default_value
+        return schema
+
     def to_openapi_request_body(self) -> openapi.RequestBody:
         if isclass(self.type) and issubclass(self.type, BaseModel):
             schema = PydanticSchema(schema_class=self.type)
-        else:
-            schema = get_builtin_type(self.type)
-            if schema is None:
-                raise TypeError(f"Unsupported type for parameter '{self.name}': {self.type}")
+        elif (schema := get_builtin_type(self.type)) is None:
+            schema = openapi.Schema.model_validate(pydantic.TypeAdapter(self.type).json_schema())
 
         return openapi.RequestBody(
             content={
-                "application/json": openapi.MediaType(
+                media_type: openapi.MediaType(
                     schema=schema
-                )
+                ) for media_type in media_types()
             }
         )
 
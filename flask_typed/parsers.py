@@ -1,19 +1,29 @@
 from abc import ABC
-from typing import TypeVar
+from typing import TypeVar, ClassVar
 
 import openapi_pydantic as openapi
 from flask import Request
 from werkzeug.datastructures import MultiDict, Headers
 
+from .cache import LRUCache, MISSING
+
 T = TypeVar("T")
 
 
 class RequestParser(ABC):
 
+    errors: ClassVar[list] = []
+    # Parsers consuming the request stream themselves, the body can not be read before the handler runs
+    reads_stream: ClassVar[bool] = False
+
     @classmethod
     def parse_request(cls, request: Request) -> 'Self':
         raise NotImplementedError
 
+    @classmethod
+    def warmup(cls):
+        pass
+
 
 class QueryParser(RequestParser, ABC):
 
@@ -58,3 +68,37 @@ class BodyParser(RequestParser, ABC):
     @classmethod
     def parse_request(cls, request: Request) -> 'Self':
         return cls.parse(request.data)
+
+
+def memoized(
+        query: tuple[str, ...] = (),
+        headers: tuple[str, ...] = (),
+        maxsize: int = 1024,
+        ttl: float | None = 60.0,
+):
+    # Results are shared between requests with the same raw values, handlers should not mutate them
+    if not query and not headers:
+        raise ValueError("Memoized parsers should declare the query parameters or headers they read")
+
+    def memoized_decorator(parser_cls: type[RequestParser]) -> type[RequestParser]:
+        cache = LRUCache(maxsize=maxsize, ttl=ttl)
+        parse_request = parser_cls.parse_request.__func__
+
+        def memoized_parse_request(cls, request: Request):
+            args = request.args
+            request_headers = request.headers
+            key = (
+                cls,
+                tuple(tuple(args.getlist(name)) for name in query),
+                tuple(request_headers.get(name) for name in headers),
+            )
+            if (result := cache.get(key)) is MISSING:
+                result = parse_request(cls, request)
+                cache.set(key, result)
+            return result
+
+        parser_cls.parse_request = classmethod(memoized_parse_request)
+        parser_cls.parse_cache = cache
+        return parser_cls
+
+    return memoized_decorator
@@ -0,0 +1,65 @@
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, create_model, field_validator
+from pydantic.fields import FieldInfo
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class PartialModel(BaseModel):
+
+    def changes(self) -> dict[str, Any]:
+        # Only the fields present in the request
+        return self.model_dump(exclude_unset=True)
+
+    def apply(self, target: ModelT) -> ModelT:
+        # Present fields are already validated, so they are copied over as they are
+        return target.model_copy(update={name: getattr(self, name) for name in self.model_fields_set})
+
+
+def _drop_default(schema: dict[str, Any]):
+    schema.pop("default", None)
+
+
+def _unbound(func):
+    return getattr(func, "__func__", func)
+
+
+def _validators(model: type[BaseModel]) -> dict[str, Any]:
+    # Field validators of the model are declared again on the partial variant and only run for sent fields.
+    # Model validators are left out, they check the complete model and would see None for every absent field
+    validators = {}
+    for name, decorator in model.__pydantic_decorators__.field_validators.items():
+        info = decorator.info
+        validators[name] = field_validator(*info.fields, mode=info.mode, check_fields=False)(_unbound(decorator.func))
+    return validators
+
+
+@lru_cache(maxsize=None)
+def partial_model(model: type[BaseModel]) -> type[PartialModel]:
+    fields = {}
+    for name, field in model.model_fields.items():
+        # Absent fields default to None without being validated, explicit nulls are still rejected
+        # unless the original field is nullable
+        partial_field = FieldInfo.merge_field_infos(
+            field, default=None, default_factory=None, json_schema_extra=field.json_schema_extra or _drop_default
+        )
+        fields[name] = (field.annotation, partial_field)
+
+    return create_model(
+        f"Partial{model.__name__}",
+        __base__=PartialModel,
+        __module__=model.__module__,
+        __doc__=model.__doc__,
+        __validators__=_validators(model),
+        **fields,
+    )
+
+
+class Partial:
+
+    def __class_getitem__(cls, model: type[BaseModel]) -> type[PartialModel]:
+        if not (isinstance(model, type) and issubclass(model, BaseModel)):
+            raise TypeError(f"Partial requires a pydantic model: {model}")
+        return partial_model(model)
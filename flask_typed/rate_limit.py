@@ -0,0 +1,181 @@
+import math
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, NamedTuple
+
+from flask import Request, request
+
+from .errors import TooManyRequestsError
+from .metrics import Counter
+
+KeyFunction = Callable[[Request], str | None]
+
+
+def client_ip(req: Request) -> str | None:
+    return req.remote_addr
+
+
+def header_key(name: str) -> KeyFunction:
+    def get_header_key(req: Request) -> str | None:
+        return req.headers.get(name)
+
+    return get_header_key
+
+
+class BucketState(NamedTuple):
+    allowed: bool
+    remaining: float
+    retry_after: float
+    reset_after: float
+
+
+def _refill(tokens: float, updated: float, now: float, rate: float, burst: int) -> BucketState:
+    tokens = min(burst, tokens + (now - updated) * rate)
+    allowed = tokens >= 1
+    if allowed:
+        tokens -= 1
+    return BucketState(
+        allowed=allowed,
+        remaining=tokens,
+        retry_after=0.0 if allowed else (1 - tokens) / rate,
+        reset_after=(burst - tokens) / rate,
+    )
+
+
+class BucketBackend:
+
+    def consume(self, key: str, rate: float, burst: int) -> BucketState:
+        raise NotImplementedError
+
+
+class MemoryBucketBackend(BucketBackend):
+
+    def __init__(self, shards: int = 64, max_keys_per_shard: int = 4096):
+        self.max_keys_per_shard = max_keys_per_shard
+        self._shards = [(threading.Lock(), OrderedDict()) for _ in range(shards)]
+
+    def consume(self, key: str, rate: float, burst: int) -> BucketState:
+        lock, buckets = self._shards[hash(key) % len(self._shards)]
+        now = time.time()
+        with lock:
+            tokens, updated = buckets.pop(key, (burst, now))
+            state = _refill(tokens, updated, now, rate, burst)
+            buckets[key] = (state.remaining, now)
+            if len(buckets) > self.max_keys_per_shard:
+                # Least recently seen clients are forgotten, which at worst gives them a full bucket again
+                buckets.popitem(last=False)
+        return state
+
+
+class SQLiteBucketBackend(BucketBackend):
+
+    def __init__(self, path: str, timeout: float = 5.0):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets (key TEXT PRIMARY KEY, tokens REAL, updated REAL)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        if (connection := getattr(self._local, "connection", None)) is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+        return connection
+
+    def consume(self, key: str, rate: float, burst: int) -> BucketState:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            row = connection.execute(
+                "SELECT tokens, updated FROM rate_limit_buckets WHERE key = ?", (key,)
+            ).fetchone()
+            tokens, updated = row if row is not None else (burst, now)
+            state = _refill(tokens, updated, now, rate, burst)
+            connection.execute(
+                "INSERT OR REPLACE INTO rate_limit_buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                (key, state.remaining, now)
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return state
+
+
+class RateLimit:
+
+    def __init__(
+            self,
+            rate: float,
+            burst: int | None = None,
+            key: KeyFunction = client_ip,
+            backend: BucketBackend | None = None,
+    ):
+        if rate <= 0:
+            raise ValueError(f"Rate should be positive: {rate}")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, math.ceil(rate))
+        self.key = key
+        self.backend = backend if backend is not None else MemoryBucketBackend()
+
+
+class RateLimiter:
+
+    def __init__(self, config: RateLimit, scope: str):
+        self.config = config
+        self.scope = scope
+        self.allowed = Counter()
+        self.rejected = Counter()
+
+    def check(self) -> TooManyRequestsError | None:
+        config = self.config
+        if (client_key := config.key(request)) is not None:
+            bucket = f"{self.scope}:{client_key}"
+        else:
+            # Requests without a key, like anonymous clients of a header key, are limited per remote address
+            bucket = f"{self.scope}@{request.remote_addr}"
+
+        state = config.backend.consume(bucket, config.rate, config.burst)
+        if state.allowed:
+            self.allowed.inc()
+            return None
+
+        self.rejected.inc()
+        return TooManyRequestsError(
+            message="Too many requests",
+            headers={
+                "Retry-After": str(math.ceil(state.retry_after)),
+                "RateLimit-Limit": str(config.burst),
+                "RateLimit-Remaining": str(int(state.remaining)),
+                "RateLimit-Reset": str(math.ceil(state.reset_after)),
+            }
+        )
+
+    def wrap(self, view):
+        @wraps(view)
+        def rate_limited(*args, **kwargs):
+            if (error := self.check()) is not None:
+                return error.flask_response()
+            return view(*args, **kwargs)
+
+        return rate_limited
+
+
+def rate_limit(
+        rate: float,
+        burst: int | None = None,
+        key: KeyFunction = client_ip,
+        backend: BucketBackend | None = None,
+):
+    def rate_limit_decorator(func):
+        func.rate_limit = RateLimit(rate=rate, burst=burst, key=key, backend=backend)
+        return func
+
+    return rate_limit_decorator
@@ -0,0 +1,123 @@
+"""
+Replays a traffic capture through an application and reports throughput and latency per endpoint.
+
+Usage: python -m flask_typed.replay CAPTURE_FILE MODULE:APP [--pacing max|recorded] [--speed 1.0] [--repeat 1]
+"""
+import argparse
+import importlib
+import time
+from collections import defaultdict, Counter as StatusCounter
+from typing import Iterable, NamedTuple
+
+from flask import Flask
+
+from .capture import CapturedRequest, read_capture
+
+
+class EndpointReport(NamedTuple):
+    endpoint: str
+    requests: int
+    throughput: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+    statuses: dict[int, int]
+
+
+def _percentile(sorted_values: list[float], percentile: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(percentile / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def replay(
+        app: Flask,
+        records: Iterable[CapturedRequest],
+        pacing: str = "max",
+        speed: float = 1.0,
+        repeat: int = 1,
+) -> list[EndpointReport]:
+    if pacing not in ("max", "recorded"):
+        raise ValueError(f"Unknown pacing: {pacing}")
+    records = list(records)
+    client = app.test_client()
+    latencies: dict[str, list[float]] = defaultdict(list)
+    statuses: dict[str, StatusCounter] = defaultdict(StatusCounter)
+    busy: dict[str, float] = defaultdict(float)
+
+    for _ in range(repeat):
+        first_timestamp = records[0].timestamp if records else 0
+        started = time.perf_counter()
+        for record in records:
+            if pacing == "recorded":
+                # Requests are sent at the recorded offsets, scaled by the speed factor
+                delay = (record.timestamp - first_timestamp) / speed - (time.perf_counter() - started)
+                if delay > 0:
+                    time.sleep(delay)
+
+            start = time.perf_counter()
+            response = client.open(
+                record.path,
+                method=record.method,
+                query_string=record.query,
+                # Length is set again from the replayed body
+                headers=[(name, value) for name, value in record.headers if name.lower() != "content-length"],
+                data=record.body,
+            )
+            response.get_data()
+            elapsed = time.perf_counter() - start
+            response.close()
+
+            latencies[record.endpoint].append(elapsed)
+            statuses[record.endpoint][response.status_code] += 1
+            busy[record.endpoint] += elapsed
+
+    reports = []
+    for endpoint, values in sorted(latencies.items()):
+        values.sort()
+        reports.append(EndpointReport(
+            endpoint=endpoint,
+            requests=len(values),
+            throughput=len(values) / busy[endpoint] if busy[endpoint] else 0.0,
+            p50=_percentile(values, 50),
+            p95=_percentile(values, 95),
+            p99=_percentile(values, 99),
+            max=values[-1],
+            statuses=dict(statuses[endpoint]),
+        ))
+    return reports
+
+
+def format_report(reports: list[EndpointReport]) -> str:
+    lines = [f"{'endpoint':40} {'requests':>8} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}  statuses"]
+    for report in reports:
+        lines.append(
+            f"{report.endpoint:40} {report.requests:8d} {report.throughput:9.1f}"
+            f" {report.p50 * 1000:8.3f} {report.p95 * 1000:8.3f} {report.p99 * 1000:8.3f}"
+            f"  {', '.join(f'{status}: {count}' for status, count in sorted(report.statuses.items()))}"
+        )
+    return "\n".join(lines)
+
+
+def _load_app(spec: str) -> Flask:
+    module_name, _, attribute = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attribute or "app")
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Replays captured traffic through a Flask application")
+    parser.add_argument("capture", help="Capture file written by TrafficCapture")
+    parser.add_argument("app", help="Application as MODULE:ATTRIBUTE")
+    parser.add_argument("--pacing", choices=["max", "recorded"], default="max")
+    parser.add_argument("--speed", type=float, default=1.0, help="Speed factor of recorded pacing")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    reports = replay(
+        _load_app(args.app), read_capture(args.capture), pacing=args.pacing, speed=args.speed, repeat=args.repeat
+    )
+    print(format_report(reports))
+
+
+if __name__ == "__main__":
+    main()
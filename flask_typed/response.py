@@ -1,10 +1,14 @@
-from typing import Generator, ClassVar, TypedDict, NotRequired
+import mimetypes
+import os
+from typing import Generator, ClassVar, TypedDict, NotRequired, IO
 
 import openapi_pydantic as openapi
-from flask import current_app, stream_with_context
+from flask import current_app, stream_with_context, send_file
 from openapi_pydantic.util import PydanticSchema
 from pydantic import BaseModel, RootModel
 
+from .codecs import DEFAULT_CODEC
+
 _pydantic_export_config_fields = [
     "include",
     "exclude",
@@ -43,12 +47,17 @@ class BaseResponse:
     def schema(cls) -> openapi.Schema:
         raise NotImplementedError
 
+    @classmethod
+    def content_schemas(cls) -> dict[str, openapi.Schema]:
+        # Responses which can be negotiated into other media types document each of them
+        return {cls.mime_type: cls.schema()}
+
 
 class ModelResponse(BaseResponse):
 
     json_config: ClassVar[dict] = {}
 
-    mime_type = "application/json"
+    mime_type = DEFAULT_CODEC.media_type
 
     def __init_subclass__(cls: type[BaseModel], **kwargs):
         if not issubclass(cls, BaseModel):
@@ -57,10 +66,19 @@ class ModelResponse(BaseResponse):
 
         super().__init_subclass__(**kwargs)
 
-    def flask_response(self):
+    def flask_response(self, include: dict | None = None, codec=None):
+        # Sparse fieldsets of the request replace the include set of the JSON config,
+        # a negotiated codec other than JSON replaces the media type of the response
+        json_config = self.json_config if include is None else {**self.json_config, "include": include}
+        if codec is None or codec.media_type == DEFAULT_CODEC.media_type:
+            return current_app.response_class(
+                response=self.model_dump_json(**json_config),
+                mimetype=self.mime_type,
+                status=self.status_code
+            )
         return current_app.response_class(
-            response=self.model_dump_json(**self.json_config),
-            mimetype=self.mime_type,
+            response=codec.dump_model(self, **json_config),
+            mimetype=codec.media_type,
             status=self.status_code
         )
 
@@ -107,4 +125,81 @@ class StreamingResponse(BaseResponse):
 
     @classmethod
     def schema(cls) -> openapi.Schema:
-        return openapi.Schema(type="string")
\ No newline at end of file
+        return openapi.Schema(type="string")
+
+
+class FileResponse(BaseResponse):
+    status_code = 200
+    mime_type = "application/octet-stream"
+
+    def __init__(
+            self,
+            path_or_file: str | os.PathLike | IO[bytes],
+            mime_type: str | None = None,
+            download_name: str | None = None,
+            as_attachment: bool = False,
+            use_x_sendfile: bool | None = None,
+            accel_redirect: str | None = None,
+            max_age: int | None = None,
+    ):
+        self._path_or_file = path_or_file
+        self._mime_type = mime_type
+        self._download_name = download_name
+        self._as_attachment = as_attachment
+        self._use_x_sendfile = use_x_sendfile
+        self._accel_redirect = accel_redirect
+        self._max_age = max_age
+
+    def _guess_mime_type(self) -> str:
+        if self._mime_type is not None:
+            return self._mime_type
+        name = self._download_name
+        if name is None and not hasattr(self._path_or_file, "read"):
+            name = os.fspath(self._path_or_file)
+        # Files without a recognizable name are sent with the media type of the response class
+        return (mimetypes.guess_type(name)[0] if name is not None else None) or self.mime_type
+
+    def flask_response(self):
+        mime_type = self._guess_mime_type()
+        if self._accel_redirect is not None:
+            # Front proxy serves the file (including ranges) from its internal location
+            response = current_app.response_class(mimetype=mime_type)
+            response.headers["X-Accel-Redirect"] = self._accel_redirect
+            return response
+        if self._use_x_sendfile and not hasattr(self._path_or_file, "read"):
+            # Front server sends the file, regardless of the USE_X_SENDFILE setting of the application
+            response = current_app.response_class(mimetype=mime_type)
+            response.headers["X-Sendfile"] = os.path.join(current_app.root_path, os.fspath(self._path_or_file))
+            return response
+
+        # File body is passed to the server through wsgi.file_wrapper (sendfile where supported),
+        # Range and If-Range requests are answered with 206 partial content
+        return send_file(
+            self._path_or_file,
+            mimetype=mime_type,
+            as_attachment=self._as_attachment,
+            download_name=self._download_name,
+            conditional=True,
+            max_age=self._max_age,
+        )
+
+    @classmethod
+    def schema(cls) -> openapi.Schema:
+        return openapi.Schema(type="string", format="binary")
+
+
+class PrecomputedResponse(BaseResponse):
+
+    def __init__(self, body: bytes, status_code: int, mime_type: str, headers: dict[str, str] | None = None):
+        self.body = body
+        self.status_code = status_code
+        self.mime_type = mime_type
+        self.headers = headers
+
+    def flask_response(self):
+        return current_app.response_class(
+            response=self.body,
+            status=self.status_code,
+            mimetype=self.mime_type,
+            headers=self.headers,
+        )
@@ -0,0 +1,130 @@
+import logging
+import time
+from collections import deque
+from threading import Lock
+from typing import Any, Callable
+
+from flask import Response, request
+from pydantic import BaseModel
+
+from .metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+REDACTED = "[redacted]"
+
+# Parameter name to a function returning the value to log, or None to hide the value completely
+RedactRules = dict[str, Callable[[Any], Any] | None]
+
+
+class PhaseTimings:
+    __slots__ = ("start", "validation", "handler", "serialization", "_last")
+
+    def __init__(self):
+        self.start = self._last = time.perf_counter()
+        # Phases a request never went through stay None, like the handler of a coalesced duplicate
+        self.validation: float | None = None
+        self.handler: float | None = None
+        self.serialization: float | None = None
+
+    def mark(self, phase: str):
+        now = time.perf_counter()
+        setattr(self, phase, now - self._last)
+        self._last = now
+
+
+def _loggable(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, dict):
+        return {str(key): _loggable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_loggable(item) for item in value]
+    text = repr(value)
+    return text if len(text) <= 200 else text[:200] + "..."
+
+
+class SlowRequestLog:
+
+    def __init__(self, threshold: float = 1.0, max_entries: int = 100, redact: RedactRules | None = None):
+        self.threshold = threshold
+        self.redact = redact if redact is not None else {}
+        self.slow = Counter()
+        self._entries: deque[dict[str, Any]] = deque(maxlen=max_entries)
+        self._lock = Lock()
+
+    def entries(self) -> list[dict[str, Any]]:
+        # Most recent first
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def add(self, entry: dict[str, Any]):
+        self.slow.inc()
+        with self._lock:
+            self._entries.append(entry)
+        logger.warning(
+            "Slow request %s took %.3fs", entry["endpoint"], entry["duration"], extra={"slow_request": entry}
+        )
+
+
+class SlowRequestTracker:
+
+    def __init__(self, log: SlowRequestLog, endpoint: str, threshold: float | None, redact: RedactRules):
+        self.log = log
+        self.endpoint = endpoint
+        self.threshold = threshold
+        self.redact = redact
+
+    def _redacted_args(self, validated_args: dict[str, Any] | None) -> dict[str, Any] | None:
+        if validated_args is None:
+            return None
+        args = {}
+        for name, value in validated_args.items():
+            if name not in self.redact:
+                args[name] = _loggable(value)
+            elif (rule := self.redact[name]) is None:
+                args[name] = REDACTED
+            else:
+                args[name] = _loggable(rule(value))
+        return args
+
+    def observe(self, timings: PhaseTimings, validated_args: dict[str, Any] | None, response: Any):
+        duration = time.perf_counter() - timings.start
+        # Routes without their own threshold follow the threshold of the log, which can be changed at runtime
+        if duration < (self.log.threshold if self.threshold is None else self.threshold):
+            return
+
+        is_response = isinstance(response, Response)
+        phases = {
+            "validation": timings.validation,
+            "handler": timings.handler,
+            "serialization": timings.serialization,
+        }
+        try:
+            args = self._redacted_args(validated_args)
+        except Exception:
+            # A failing redact rule must not fail a request that was already handled
+            logger.exception("Could not log the arguments of slow request %s", self.endpoint)
+            args = None
+        self.log.add({
+            "time": time.time(),
+            "endpoint": self.endpoint,
+            "path": request.path,
+            "duration": duration,
+            "phases": {phase: elapsed for phase, elapsed in phases.items() if elapsed is not None},
+            "args": args,
+            "status": response.status_code if is_response else None,
+            "response_size": response.calculate_content_length() if is_response else None,
+        })
+
+
+def slow_requests(threshold: float | None = None, redact: RedactRules | None = None):
+    # Route level settings of the SlowRequestLog configured on the TypedAPI
+    def slow_requests_decorator(func):
+        func.slow_request_threshold = threshold
+        func.slow_request_redact = redact if redact is not None else {}
+        return func
+
+    return slow_requests_decorator
@@ -0,0 +1,123 @@
+from typing import ClassVar, Iterator, Any, BinaryIO
+
+import openapi_pydantic as openapi
+import pydantic
+from flask import Request
+from openapi_pydantic.util import PydanticSchema
+from pydantic import BaseModel, TypeAdapter
+
+from flask_typed.docs.utils import get_builtin_type
+from .errors import HttpError, PayloadTooLargeError
+from .parameter import repr_pydantic_validation_error
+from .parsers import BodyParser
+
+
+class StreamItemValidationError(HttpError):
+    status_code = 422
+
+    class ResponseModel(BaseModel):
+        message: str | None = None
+        line: int
+        details: list[str]
+
+
+class NDJSONStream(BodyParser):
+    mime_type: ClassVar[str] = "application/x-ndjson"
+    item_type: ClassVar[Any] = None
+    max_body_size: ClassVar[int | None] = None
+    max_items: ClassVar[int | None] = None
+    chunk_size: ClassVar[int] = 64 * 1024
+    errors = [PayloadTooLargeError, StreamItemValidationError]
+    reads_stream = True
+
+    _adapter: ClassVar[TypeAdapter | None] = None
+    _parametrized: ClassVar[dict[Any, type['NDJSONStream']]] = {}
+
+    def __class_getitem__(cls, item_type) -> type['NDJSONStream']:
+        if (stream_cls := cls._parametrized.get((cls, item_type))) is None:
+            name = getattr(item_type, "__name__", str(item_type))
+            stream_cls = type(f"{cls.__name__}[{name}]", (cls,), {"item_type": item_type})
+            cls._parametrized[(cls, item_type)] = stream_cls
+        return stream_cls
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self._consumed = False
+
+    @classmethod
+    def adapter(cls) -> TypeAdapter:
+        # Stored on each parametrized class, rather than inherited from the parent
+        if cls.__dict__.get("_adapter") is None:
+            if cls.item_type is None:
+                raise TypeError(f"No item type is provided for {cls.__name__}")
+            cls._adapter = TypeAdapter(cls.item_type)
+        return cls._adapter
+
+    @classmethod
+    def warmup(cls):
+        cls.adapter()
+
+    @classmethod
+    def parse_request(cls, request: Request) -> 'NDJSONStream':
+        if cls.max_body_size is not None and (request.content_length or 0) > cls.max_body_size:
+            raise PayloadTooLargeError(message=f"Request body exceeds {cls.max_body_size} bytes")
+        return cls(request.stream)
+
+    @classmethod
+    def schema(cls) -> openapi.RequestBody:
+        if isinstance(cls.item_type, type) and issubclass(cls.item_type, BaseModel):
+            schema = PydanticSchema(schema_class=cls.item_type)
+        elif (schema := get_builtin_type(cls.item_type)) is None:
+            schema = openapi.Schema.model_validate(cls.adapter().json_schema())
+
+        return openapi.RequestBody(
+            content={
+                cls.mime_type: openapi.MediaType(
+                    schema=schema
+                )
+            }
+        )
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._consumed:
+            raise RuntimeError("Request stream can only be iterated once")
+        self._consumed = True
+
+        validate_json = self.adapter().validate_json
+        line_number = 0
+        item_count = 0
+        for line in self._read_lines():
+            line_number += 1
+            if not line.strip():
+                continue
+
+            item_count += 1
+            if self.max_items is not None and item_count > self.max_items:
+                raise PayloadTooLargeError(message=f"Request body exceeds {self.max_items} items")
+
+            try:
+                yield validate_json(line)
+            except pydantic.ValidationError as e:
+                raise StreamItemValidationError(
+                    message="Invalid item",
+                    line=line_number,
+                    details=list(repr_pydantic_validation_error(e))
+                )
+
+    def _read_lines(self) -> Iterator[bytes]:
+        read = self._stream.read
+        max_body_size = self.max_body_size
+        chunk_size = self.chunk_size
+        body_size = 0
+        pending = b""
+        while chunk := read(chunk_size):
+            body_size += len(chunk)
+            if max_body_size is not None and body_size > max_body_size:
+                raise PayloadTooLargeError(message=f"Request body exceeds {max_body_size} bytes")
+
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            yield from lines
+
+        if pending:
+            yield pending
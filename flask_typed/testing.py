@@ -0,0 +1,99 @@
+import io
+from typing import Any, Type
+
+from flask import request
+
+from .calls import encode_call, decode_result
+from .errors import HttpError
+from .handler import HttpHandler
+from .pagination import PageResult
+from .typed_api import TypedAPI
+from .typed_resource import TypedResource
+
+
+class TypedTestClient:
+
+    def __init__(self, api: TypedAPI, full_stack: bool = False):
+        if api.app is None:
+            raise ValueError("TypedAPI is not initialized with a Flask application")
+        self.api = api
+        self.full_stack = full_stack
+        self._client = api.app.test_client() if full_stack else None
+
+    def handler(self, resource: str | Type[TypedResource], method: str) -> HttpHandler:
+        if isinstance(resource, str):
+            bound_resource = self.api.resources[resource]
+        else:
+            bound_resource = next(
+                bound for bound in self.api.resources.values() if bound.resource_cls is resource
+            )
+        return bound_resource.methods[method.upper()]
+
+    def call(
+            self,
+            resource: str | Type[TypedResource],
+            method: str,
+            headers: dict[str, str] | None = None,
+            query_string: dict[str, str] | None = None,
+            **arguments
+    ) -> Any:
+        # Returns the typed result of the handler, or the HttpError it raised.
+        # Raw headers and query string are only needed for request parsers which read the request themselves.
+        handler = self.handler(resource, method)
+        encoded = encode_call(handler, arguments)
+        headers = {**encoded.headers, **(headers or {})}
+        query_string = {**encoded.query, **(query_string or {})}
+
+        if self.full_stack:
+            return self._call_full_stack(handler, method, encoded, headers, query_string)
+
+        # Handlers still run in a request context, but typed arguments skip the WSGI round trip and serialization
+        with self.api.app.test_request_context(
+                encoded.path, method=method.upper(), headers=headers, query_string=query_string
+        ):
+            try:
+                validated_args = handler.validate_arguments(arguments, request)
+                result = handler.handler(handler.resource_cls(), **validated_args)
+                if (paginated := handler.paginated_type()) is not None and isinstance(result, PageResult):
+                    return result.to_model(paginated)
+                return result
+            except HttpError as e:
+                return e
+
+    def _call_full_stack(self, handler: HttpHandler, method: str, encoded, headers, query_string) -> Any:
+        data = encoded.body
+        content_type = encoded.content_type
+        if encoded.form or encoded.files:
+            data = {
+                **encoded.form,
+                **{
+                    name: (io.BytesIO(content), filename, file_type)
+                    for name, (filename, content, file_type) in encoded.files.items()
+                }
+            }
+            content_type = "multipart/form-data"
+
+        response = self._client.open(
+            encoded.path,
+            method=method.upper(),
+            headers=headers,
+            query_string=query_string,
+            data=data,
+            content_type=content_type,
+        )
+        return decode_result(handler, response.status_code, response.mimetype, response.get_data())
+
+    def get(self, resource: str | Type[TypedResource], **kwargs) -> Any:
+        return self.call(resource, "GET", **kwargs)
+
+    def post(self, resource: str | Type[TypedResource], **kwargs) -> Any:
+        return self.call(resource, "POST", **kwargs)
+
+    def put(self, resource: str | Type[TypedResource], **kwargs) -> Any:
+        return self.call(resource, "PUT", **kwargs)
+
+    def patch(self, resource: str | Type[TypedResource], **kwargs) -> Any:
+        return self.call(resource, "PATCH", **kwargs)
+
+    def delete(self, resource: str | Type[TypedResource], **kwargs) -> Any:
+        return self.call(resource, "DELETE", **kwargs)
@@ -1,4 +1,4 @@
-import json
+import gc
 from typing import Type
 
 from flask import Flask, render_template_string
@@ -6,6 +6,13 @@ from openapi_pydantic import OpenAPI, Info
 from openapi_pydantic.util import construct_open_api_with_schema_class
 
 from flask_typed.docs.utils import redoc_template
+from .capture import TrafficCapture
+from .concurrency import ConcurrencyLimit
+from .cors import CorsConfig
+from .deadlines import DeadlinePolicy
+from .json_backend import JsonBackend, StdlibJsonBackend, BackendJSONProvider, get_json_backend, EXTENSION_NAME
+from .rate_limit import RateLimit
+from .slow_requests import SlowRequestLog
 from .typed_resource import BoundResource, TypedResource
 
 
@@ -30,7 +37,15 @@ class TypedAPI:
             version: str = "v0.0.1",
             description: str = "",
             openapi_path: str = "/openapi",
-            docs_path: str = "/docs"
+            docs_path: str = "/docs",
+            keep_handler_docs: bool = False,
+            warmup_resources: bool = False,
+            json_backend: JsonBackend | None = None,
+            contract_sample_rate: float | None = None,
+            cors: CorsConfig | None = None,
+            traffic_capture: TrafficCapture | None = None,
+            slow_request_log: SlowRequestLog | None = None,
+            slow_requests_path: str | None = None
      ):
         self.app = app
         self.docs = OpenAPI(
@@ -43,6 +58,15 @@ class TypedAPI:
         self.resources: dict[str, BoundResource] = {}
         self.openapi_path = openapi_path
         self.docs_path = docs_path
+        self.keep_handler_docs = keep_handler_docs
+        self.warmup_resources = warmup_resources
+        self.contract_sample_rate = contract_sample_rate
+        self.cors = cors
+        self.traffic_capture = traffic_capture
+        self.slow_request_log = slow_request_log
+        self.slow_requests_path = slow_requests_path
+        self.json_backend = json_backend
+        self._openapi_json: str | None = None
 
         if app is not None:
             self.init_app(app)
@@ -51,11 +75,17 @@ class TypedAPI:
         if app is None:
             raise ValueError("No valid Flask instance is provided")
         self.app = app
+        # The backend is kept on the application, routes outside of the API keep using app.json
+        if self.json_backend is not None or EXTENSION_NAME not in app.extensions:
+            app.extensions[EXTENSION_NAME] = BackendJSONProvider(app, self.json_backend or StdlibJsonBackend())
+
         for url, resource in self.resources.items():
             self._register_resource(resource)
 
         def get_openapi_schema():
-            return self.get_openapi_schema()
+            if self._openapi_json is None:
+                self._openapi_json = self._dump_openapi_schema()
+            return app.response_class(self._openapi_json, mimetype="application/json")
 
         def redoc():
             return render_template_string(
@@ -66,12 +96,51 @@ class TypedAPI:
         app.add_url_rule(self.docs_path, view_func=redoc)
         app.add_url_rule(self.openapi_path, view_func=get_openapi_schema)
 
-    def add_resource(self, resource: Type[TypedResource], path: str):
+        if self.slow_requests_path is not None:
+            if self.slow_request_log is None:
+                raise ValueError("Slow requests endpoint requires a slow request log")
+
+            def slow_requests():
+                # Not part of the API docs, the application is expected to restrict access to it
+                return app.response_class(
+                    get_json_backend().dumps(self.slow_request_log.entries()), mimetype="application/json"
+                )
+
+            app.add_url_rule(self.slow_requests_path, view_func=slow_requests)
+
+    def add_resource(
+            self,
+            resource: Type[TypedResource],
+            path: str,
+            concurrency_limit: ConcurrencyLimit | None = None,
+            rate_limit: RateLimit | None = None,
+            deadline: DeadlinePolicy | None = None,
+            cors: CorsConfig | None = None,
+            traffic_capture: TrafficCapture | None = None
+    ):
         if path in self.resources:
             raise Exception(f"URL is already registered: {path}")
         bound_resource = resource.bind(path)
+        if concurrency_limit is not None:
+            bound_resource.set_concurrency_limit(concurrency_limit)
+        if rate_limit is not None:
+            bound_resource.set_rate_limit(rate_limit)
+        if deadline is not None:
+            bound_resource.set_deadline_policy(deadline)
+        if self.contract_sample_rate is not None:
+            bound_resource.set_contract_sampling(self.contract_sample_rate)
+        if (cors := cors or self.cors) is not None:
+            bound_resource.set_cors(cors)
+        if (traffic_capture := traffic_capture or self.traffic_capture) is not None:
+            bound_resource.set_traffic_capture(traffic_capture)
+        if self.slow_request_log is not None:
+            bound_resource.set_slow_request_log(self.slow_request_log)
         self.resources[path] = bound_resource
         self.docs.paths[bound_resource.path.openapi_path] = bound_resource.generate_path_item()
+        self._openapi_json = None
+        if not self.keep_handler_docs:
+            # Path item is already part of the OpenAPI document, handlers do not need docs data anymore
+            bound_resource.release_docs()
 
         if self.app is not None:
             self._register_resource(bound_resource)
@@ -81,16 +150,49 @@ class TypedAPI:
             full_path = join_path(url_prefix, path)
             self.add_resource(resource, full_path)
 
+    def warmup(self, freeze: bool = False):
+        for resource in self.resources.values():
+            resource.warmup()
+
+        if self.app is not None:
+            # Compiles the URL matcher, which is otherwise done while matching the first request
+            self.app.url_map.update()
+            self.app.json.dumps({})
+
+        if freeze:
+            # Keeps forked workers from touching (and copying) pages of the preloaded objects during GC
+            gc.collect()
+            gc.freeze()
+
     def _register_resource(self, bound_resource: BoundResource):
+        if self.warmup_resources:
+            bound_resource.warmup()
+        endpoint = bound_resource.resource_cls.__name__.lower()
+        cors = bound_resource.cors
         for method, handler in bound_resource.methods.items():
+            view = handler.get_handler()
+            if cors is not None:
+                view = cors.wrap(view)
             self.app.add_url_rule(
                 bound_resource.path.path,
-                bound_resource.resource_cls.__name__.lower() + method,
-                handler.get_handler(),
+                endpoint + method,
+                view,
                 methods=[method],
                 provide_automatic_options=False
             )
+        if cors is not None and "OPTIONS" not in bound_resource.methods:
+            # Preflight requests are answered with the precomputed response, they never reach a handler
+            self.app.add_url_rule(
+                bound_resource.path.path,
+                endpoint + "OPTIONS",
+                cors.preflight_view(),
+                methods=["OPTIONS"],
+                provide_automatic_options=False
+            )
 
     def get_openapi_schema(self):
+        return get_json_backend().loads(self._dump_openapi_schema())
+
+    def _dump_openapi_schema(self) -> str:
         open_api = construct_open_api_with_schema_class(self.docs)
-        return json.loads(open_api.model_dump_json(by_alias=True, exclude_none=True))
+        return open_api.model_dump_json(by_alias=True, exclude_none=True)
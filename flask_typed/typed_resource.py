@@ -3,7 +3,13 @@ import re
 import openapi_pydantic as openapi
 from flask.views import http_method_funcs
 
+from .capture import TrafficCapture
+from .concurrency import ConcurrencyLimit
+from .cors import CorsConfig, CorsPolicy
+from .deadlines import DeadlinePolicy
 from .handler import HttpHandler
+from .rate_limit import RateLimit, RateLimiter
+from .slow_requests import SlowRequestLog
 
 _PATH_REGEX = re.compile("<(?:(?P<converter>[A-Za-z_]\\w*):)?(?P<name>[A-Za-z_]\\w*)>")
 
@@ -18,6 +24,7 @@ def convert_to_openapi_format(path) -> str:
 
 
 class Path:
+    __slots__ = ("path", "path_parameters", "openapi_path")
 
     def __init__(self, path: str):
         self.path = path
@@ -26,11 +33,13 @@ class Path:
 
 
 class BoundResource:
+    __slots__ = ("resource_cls", "path", "methods", "cors")
 
     def __init__(self, resource_cls, path: Path, methods: dict[str, HttpHandler]):
         self.resource_cls = resource_cls
         self.path = path
         self.methods = methods
+        self.cors: CorsPolicy | None = None
 
     def generate_path_item(self) -> openapi.PathItem:
         docs = openapi.PathItem()
@@ -39,6 +48,50 @@ class BoundResource:
             setattr(docs, method.lower(), operation)
         return docs
 
+    def release_docs(self):
+        for handler in self.methods.values():
+            handler.release_docs()
+
+    def warmup(self):
+        for handler in self.methods.values():
+            handler.warmup()
+
+    def set_concurrency_limit(self, limit: ConcurrencyLimit):
+        # Limits declared on the handler take precedence
+        for handler in self.methods.values():
+            if handler.concurrency_limiter is None:
+                handler.set_concurrency_limit(limit)
+
+    def set_cors(self, config: CorsConfig):
+        # Allowed methods of the preflight response come from the methods the resource implements
+        self.cors = CorsPolicy(config, self.methods)
+
+    def set_deadline_policy(self, policy: DeadlinePolicy):
+        for handler in self.methods.values():
+            if handler.deadline_enforcer is None:
+                handler.set_deadline_policy(policy)
+
+    def set_traffic_capture(self, capture: TrafficCapture):
+        for handler in self.methods.values():
+            if handler.traffic_capture is None:
+                handler.traffic_capture = capture
+
+    def set_slow_request_log(self, log: SlowRequestLog):
+        for handler in self.methods.values():
+            handler.set_slow_request_log(log)
+
+    def set_contract_sampling(self, sample_rate: float):
+        for handler in self.methods.values():
+            if handler.contract_checker is None:
+                handler.set_contract_sampling(sample_rate)
+
+    def set_rate_limit(self, limit: RateLimit):
+        # All methods of the resource share the same budget, unless they declare their own
+        limiter = RateLimiter(limit, scope=self.path.path)
+        for handler in self.methods.values():
+            if handler.rate_limiter is None:
+                handler.rate_limiter = limiter
+
 
 class TypedResource:
 
@@ -0,0 +1,152 @@
+import mmap
+from tempfile import SpooledTemporaryFile
+from typing import IO
+
+from werkzeug.datastructures import FileStorage
+from werkzeug.formparser import FormDataParser
+
+from .errors import PayloadTooLargeError
+
+
+class SpooledUpload(SpooledTemporaryFile):
+
+    def __init__(self, spool_threshold: int, max_file_size: int | None, spool_dir: str | None = None):
+        super().__init__(max_size=spool_threshold, mode="w+b", dir=spool_dir)
+        self.max_file_size = max_file_size
+        self.size = 0
+
+    def write(self, data) -> int:
+        # Limit is enforced while the multipart parser streams the file, before it is fully received
+        self.size += len(data)
+        if self.max_file_size is not None and self.size > self.max_file_size:
+            # Removes the temporary file the upload may already be spooled to
+            self.close()
+            raise PayloadTooLargeError(message=f"Uploaded file exceeds {self.max_file_size} bytes")
+        return super().write(data)
+
+    @property
+    def in_memory(self) -> bool:
+        return not self._rolled
+
+    def memory_map(self) -> mmap.mmap | bytes:
+        if self.in_memory:
+            return _read_all(self)
+        return mmap.mmap(self.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _read_all(stream: IO[bytes]) -> bytes:
+    position = stream.tell()
+    stream.seek(0)
+    try:
+        return stream.read()
+    finally:
+        stream.seek(position)
+
+
+class UploadedFile:
+
+    def __init__(self, storage: FileStorage):
+        self.storage = storage
+
+    @property
+    def filename(self) -> str | None:
+        return self.storage.filename
+
+    @property
+    def content_type(self) -> str | None:
+        return self.storage.content_type
+
+    @property
+    def stream(self) -> IO[bytes]:
+        return self.storage.stream
+
+    @property
+    def size(self) -> int:
+        if isinstance(self.stream, SpooledUpload):
+            return self.stream.size
+        position = self.stream.tell()
+        size = self.stream.seek(0, 2)
+        self.stream.seek(position)
+        return size
+
+    def read(self, size: int = -1) -> bytes:
+        return self.stream.read(size)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self.stream.seek(offset, whence)
+
+    def __iter__(self):
+        return iter(self.stream)
+
+    def mmap(self) -> mmap.mmap | bytes:
+        # Read-only memory map of uploads spooled to disk, small uploads held in memory are copied
+        stream = self.stream
+        if isinstance(stream, SpooledUpload):
+            return stream.memory_map()
+        try:
+            fileno = stream.fileno()
+        except (AttributeError, OSError):
+            return _read_all(stream)
+        return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+
+    def save(self, destination, buffer_size: int = 16384):
+        self.seek(0)
+        self.storage.save(destination, buffer_size)
+
+
+class UploadConfig:
+
+    def __init__(
+            self,
+            spool_threshold: int = 512 * 1024,
+            max_file_size: int | None = None,
+            max_content_length: int | None = None,
+            spool_dir: str | None = None,
+    ):
+        self.spool_threshold = spool_threshold
+        self.max_file_size = max_file_size
+        self.max_content_length = max_content_length
+        self.spool_dir = spool_dir
+
+    def stream_factory(self, total_content_length, content_type, filename=None, content_length=None) -> IO[bytes]:
+        return SpooledUpload(self.spool_threshold, self.max_file_size, self.spool_dir)
+
+    def prepare_request(self, request):
+        if self.max_content_length is not None and (request.content_length or 0) > self.max_content_length:
+            raise PayloadTooLargeError(message=f"Request body exceeds {self.max_content_length} bytes")
+        if "form" in request.__dict__ or not request.want_form_data_parsed:
+            return
+        # Files are streamed into the configured spooled storage, the parsed form is cached on the request
+        # the same way werkzeug caches it on first access
+        parser = FormDataParser(
+            stream_factory=self.stream_factory,
+            max_form_memory_size=request.max_form_memory_size,
+            max_content_length=request.max_content_length,
+            cls=request.parameter_storage_class,
+            max_form_parts=request.max_form_parts,
+        )
+        stream, form, files = parser.parse(
+            request.stream, request.mimetype, request.content_length, request.mimetype_params
+        )
+        request.__dict__.update(stream=stream, form=form, files=files)
+
+
+DEFAULT_UPLOAD_CONFIG = UploadConfig()
+
+
+def upload_limits(
+        spool_threshold: int = 512 * 1024,
+        max_file_size: int | None = None,
+        max_content_length: int | None = None,
+        spool_dir: str | None = None,
+):
+    def upload_limits_decorator(func):
+        func.upload_config = UploadConfig(
+            spool_threshold=spool_threshold,
+            max_file_size=max_file_size,
+            max_content_length=max_content_length,
+            spool_dir=spool_dir,
+        )
+        return func
+
+    return upload_limits_decorator
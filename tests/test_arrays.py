@@ -0,0 +1,79 @@
+import pytest
+from flask import Flask
+
+np = pytest.importorskip("numpy")
+
+from flask_typed import TypedAPI, TypedResource, ArrayBody, ArrayResponse  # noqa: E402
+
+received = {}
+
+
+class ScoreResource(TypedResource):
+
+    def post(self, vector: ArrayBody[np.float32, (None,)]) -> ArrayResponse[np.float32]:
+        received["vector"] = vector
+        return ArrayResponse[np.float32](vector * 2)
+
+
+class MatrixResource(TypedResource):
+
+    def post(self, matrix: ArrayBody[np.int32, (None, 3)]) -> ArrayResponse:
+        return ArrayResponse(matrix.sum(axis=1, dtype=np.int32))
+
+
+@pytest.fixture()
+def api():
+    app = Flask("arrays_app")
+    api = TypedAPI(app)
+    api.add_resource(ScoreResource, "/score")
+    api.add_resource(MatrixResource, "/matrix")
+    return api
+
+
+def post_binary(client, url, array, **kwargs):
+    return client.post(url, data=array.tobytes(), content_type="application/octet-stream", **kwargs)
+
+
+def test_binary_body_is_not_copied(api):
+    vector = np.arange(5, dtype=np.float32)
+    response = post_binary(api.app.test_client(), "/score", vector)
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/octet-stream"
+    assert response.headers["X-Array-Dtype"] == "<f4"
+    assert response.headers["X-Array-Shape"] == "5"
+    assert np.array_equal(np.frombuffer(response.data, dtype=np.float32), vector * 2)
+    assert not received["vector"].flags.owndata
+    assert not received["vector"].flags.writeable
+
+
+def test_json_fallback(api):
+    response = api.app.test_client().post("/score", json=[1, 2.5], headers={"Accept": "application/json"})
+
+    assert response.status_code == 200
+    assert response.json == [2, 5]
+    assert received["vector"].dtype == np.float32
+
+
+def test_shape_is_checked(api):
+    client = api.app.test_client()
+
+    matrix = post_binary(client, "/matrix", np.arange(6, dtype=np.int32))
+    assert np.array_equal(np.frombuffer(matrix.data, dtype=np.int32), [3, 12])
+    assert matrix.headers["X-Array-Dtype"] == "<i4"
+
+    assert post_binary(client, "/matrix", np.arange(5, dtype=np.int32)).status_code == 422
+    assert client.post("/matrix", json=[[1, 2]]).status_code == 422
+    assert client.post("/score", data=b"\x00" * 3, content_type="application/octet-stream").status_code == 422
+    assert client.post("/score", data=b"1", content_type="text/csv").status_code == 415
+
+
+def test_array_docs(api):
+    operation = api.get_openapi_schema()["paths"]["/score"]["post"]
+    request_content = operation["requestBody"]["content"]
+    response_content = operation["responses"]["200"]["content"]
+
+    assert request_content["application/octet-stream"]["schema"]["format"] == "binary"
+    assert request_content["application/json"]["schema"] == {"type": "array", "items": {"type": "number"}}
+    assert response_content.keys() == {"application/octet-stream", "application/json"}
+    assert "422" in operation["responses"]
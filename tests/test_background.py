@@ -0,0 +1,189 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from flask import Flask
+from pydantic import BaseModel
+
+from flask_typed import TypedAPI, TypedResource, BackgroundTasks, TaskProgress, BadRequestError
+
+tasks = BackgroundTasks(max_workers=1, max_queue=1)
+release = threading.Event()
+
+
+class ExportRequest(BaseModel):
+    name: str
+
+
+class ExportResult(BaseModel):
+    name: str
+    rows: int
+
+
+class ExportResource(TypedResource):
+
+    @tasks.task
+    def post(self, export: ExportRequest, progress: TaskProgress) -> ExportResult:
+        progress.update(0.5, "halfway")
+        release.wait(5)
+        if export.name == "invalid":
+            raise BadRequestError(message="Invalid export")
+        return ExportResult(name=export.name, rows=42)
+
+
+@pytest.fixture()
+def background_client():
+    release.clear()
+    app = Flask("background_app")
+    api = TypedAPI(app)
+    api.add_resource(ExportResource, "/exports")
+    api.add_resource(tasks.status_resource, "/tasks/<task_id>")
+    yield app.test_client()
+    release.set()
+
+
+def wait_for_state(client, status_url, state):
+    for _ in range(100):
+        status = client.get(status_url).json
+        if status["state"] == state:
+            return status
+        time.sleep(0.01)
+    raise AssertionError(f"Task did not reach state {state}: {status}")
+
+
+def test_background_task_result(background_client):
+    response = background_client.post("/exports", json={"name": "users"})
+    assert response.status_code == 202
+
+    status_url = response.json["status_url"]
+    assert status_url == f"/tasks/{response.json['task_id']}"
+
+    status = wait_for_state(background_client, status_url, "running")
+    assert status["progress"] == 0.5
+    assert status["message"] == "halfway"
+
+    release.set()
+    status = wait_for_state(background_client, status_url, "succeeded")
+    assert status["result"] == {"name": "users", "rows": 42}
+
+
+def test_background_task_error(background_client):
+    release.set()
+    response = background_client.post("/exports", json={"name": "invalid"})
+
+    status = wait_for_state(background_client, response.json["status_url"], "failed")
+    assert status["error"] == {"message": "Invalid export"}
+
+
+def test_background_task_queue_full(background_client):
+    statuses = [background_client.post("/exports", json={"name": "users"}).status_code for _ in range(3)]
+
+    assert statuses == [202, 202, 503]
+
+
+def test_unknown_task(background_client):
+    assert background_client.get("/tasks/unknown").status_code == 404
+
+
+def test_background_task_docs(background_client):
+    responses = background_client.get("/openapi").json["paths"]["/exports"]["post"]["responses"]
+
+    assert responses["202"]["content"]["application/json"]["schema"]["$ref"] == "#/components/schemas/TaskAccepted"
+    assert "503" in responses
+
+
+def test_task_status_docs_result_type(background_client):
+    schema = background_client.get("/openapi").json
+    status_schema = schema["paths"]["/tasks/{task_id}"]["get"]["responses"]["200"]["content"]["application/json"]
+
+    assert status_schema["schema"]["$ref"] == "#/components/schemas/TaskStatus_ExportResult_"
+    result = schema["components"]["schemas"]["TaskStatus_ExportResult_"]["properties"]["result"]
+    assert {"$ref": "#/components/schemas/ExportResult"} in result["anyOf"]
+
+
+def test_finished_records_are_pruned_oldest_first():
+    pruned = BackgroundTasks(max_workers=1, max_results=2)
+    app = Flask("background_prune_app")
+
+    class PruneResource(TypedResource):
+
+        @pruned.task
+        def post(self, export: ExportRequest) -> ExportResult:
+            return ExportResult(name=export.name, rows=1)
+
+    TypedAPI(app).add_resource(PruneResource, "/prune")
+    client = app.test_client()
+
+    task_ids = []
+    for name in ("a", "b", "c"):
+        task_ids.append(client.post("/prune", json={"name": name}).json["task_id"])
+        for _ in range(100):
+            if (status := pruned.get_status(task_ids[-1])) is not None and status.state == "succeeded":
+                break
+            time.sleep(0.01)
+    pruned.shutdown()
+
+    assert pruned.get_status(task_ids[0]) is None
+    assert pruned.get_status(task_ids[2]).result == ExportResult(name="c", rows=1)
+
+
+process_tasks = BackgroundTasks(max_workers=1, use_processes=True)
+caller_runs_tasks = BackgroundTasks(max_workers=1, max_queue=0, rejection_policy="caller_runs")
+
+
+class ProcessExportResource(TypedResource):
+
+    @process_tasks.task
+    def post(self, export: ExportRequest) -> ExportResult:
+        return ExportResult(name=export.name, rows=os.getpid())
+
+
+class CallerRunsResource(TypedResource):
+
+    @caller_runs_tasks.task
+    def post(self, export: ExportRequest) -> ExportResult:
+        if export.name == "queued":
+            release.wait(5)
+        return ExportResult(name=export.name, rows=threading.get_ident())
+
+
+def test_process_pool_task():
+    app = Flask("background_process_app")
+    api = TypedAPI(app)
+    api.add_resource(ProcessExportResource, "/exports")
+    api.add_resource(process_tasks.status_resource, "/tasks/<task_id>")
+    client = app.test_client()
+
+    response = client.post("/exports", json={"name": "users"})
+    assert response.status_code == 202
+
+    status = wait_for_state(client, response.json["status_url"], "succeeded")
+    assert status["result"]["name"] == "users"
+    assert status["result"]["rows"] != os.getpid()
+
+
+def test_caller_runs_returns_accepted_task(background_client):
+    app = Flask("background_caller_runs_app")
+    api = TypedAPI(app)
+    api.add_resource(CallerRunsResource, "/exports")
+    api.add_resource(caller_runs_tasks.status_resource, "/tasks/<task_id>")
+    client = app.test_client()
+
+    release.clear()
+    queued = ThreadPoolExecutor(1).submit(client.post, "/exports", json={"name": "queued"})
+    for _ in range(100):
+        if caller_runs_tasks._records:
+            break
+        time.sleep(0.01)
+    wait_for_state(client, f"/tasks/{next(iter(caller_runs_tasks._records))}", "running")
+
+    response = client.post("/exports", json={"name": "inline"})
+    release.set()
+
+    assert queued.result().status_code == 202
+    assert response.status_code == 202
+    status = client.get(response.json["status_url"]).json
+    assert status["state"] == "succeeded"
+    assert status["result"] == {"name": "inline", "rows": threading.get_ident()}
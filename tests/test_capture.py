@@ -0,0 +1,128 @@
+import io
+import json
+
+import pytest
+from flask import Flask
+
+from flask_typed import TypedAPI, TrafficCapture
+from flask_typed.capture import read_capture, REDACTED
+from flask_typed.replay import replay, format_report, main
+from tests.test_data.events import EventsResource
+from tests.test_data.simple_user import UserResource
+from tests.test_test_client import NoteResource
+
+
+def make_app(capture: TrafficCapture) -> Flask:
+    app = Flask("capture_app")
+    api = TypedAPI(app, traffic_capture=capture)
+    api.add_resource(UserResource, "/users")
+    api.add_resource(NoteResource, "/notes/<int:note_id>")
+    api.add_resource(EventsResource, "/events")
+    return app
+
+
+@pytest.fixture()
+def capture_path(tmp_path):
+    return tmp_path / "traffic.ndjson"
+
+
+def test_requests_are_captured(capture_path):
+    capture = TrafficCapture(capture_path, sample_rate=1.0)
+    client = make_app(capture).test_client()
+
+    client.get("/users?user_id=3", headers={"Authorization": "Bearer secret"})
+    client.put("/notes/1", json={"title": "todo"}, headers={"Revision": "2"})
+    capture.close()
+
+    records = list(read_capture(capture_path))
+    assert [record.endpoint for record in records] == ["GET /users", "PUT /notes/<int:note_id>"]
+    assert records[0].query == "user_id=3"
+    assert ("Authorization", REDACTED) in records[0].headers
+    assert json.loads(records[1].body) == {"title": "todo"}
+    assert [record.status for record in records] == [200, 200]
+    assert capture.captured.value == 2
+
+
+def test_streamed_body_is_still_readable(capture_path):
+    capture = TrafficCapture(capture_path, sample_rate=1.0)
+    body = b'{"name": "a", "time": "2020-01-01T00:00:00"}\n{"name": "b", "time": "2020-01-01T00:00:01"}\n'
+    response = make_app(capture).test_client().post(
+        "/events", data=body, content_type="application/x-ndjson"
+    )
+    capture.close()
+
+    assert response.status_code == 200
+    assert next(read_capture(capture_path)).body == body
+
+
+def test_sampling_and_size_limit(capture_path):
+    unsampled = TrafficCapture(capture_path, sample_rate=0.0)
+    make_app(unsampled).test_client().get("/users")
+    assert not capture_path.exists()
+
+    bounded = TrafficCapture(capture_path, sample_rate=1.0, max_file_size=600)
+    client = make_app(bounded).test_client()
+    for _ in range(5):
+        client.get("/users")
+    bounded.close()
+
+    assert capture_path.stat().st_size <= 600
+    assert bounded.captured.value == len(list(read_capture(capture_path)))
+    assert bounded.full or bounded.dropped.value > 0
+
+
+def test_replay_reports_per_endpoint(capture_path):
+    capture = TrafficCapture(capture_path, sample_rate=1.0)
+    client = make_app(capture).test_client()
+    for user_id in range(3):
+        client.get(f"/users?user_id={user_id}")
+    client.get("/notes/2")
+    capture.close()
+
+    replay_app = make_app(None)
+    reports = replay(replay_app, read_capture(capture_path), repeat=2)
+
+    by_endpoint = {report.endpoint: report for report in reports}
+    assert by_endpoint["GET /users"].requests == 6
+    assert by_endpoint["GET /users"].statuses == {200: 6}
+    assert by_endpoint["GET /notes/<int:note_id>"].statuses == {404: 2}
+    assert all(report.p50 <= report.p99 <= report.max for report in reports)
+    assert "GET /users" in format_report(reports)
+
+
+def test_recorded_pacing(capture_path):
+    capture = TrafficCapture(capture_path, sample_rate=1.0)
+    client = make_app(capture).test_client()
+    client.get("/users")
+    client.get("/users")
+    capture.close()
+
+    reports = replay(make_app(None), read_capture(capture_path), pacing="recorded", speed=10)
+    assert reports[0].requests == 2
+
+
+def test_replay_command(capture_path, capsys, monkeypatch):
+    capture = TrafficCapture(capture_path, sample_rate=1.0)
+    make_app(capture).test_client().get("/users")
+    capture.close()
+
+    monkeypatch.setattr("tests.test_capture.replay_target", make_app(None), raising=False)
+    main([str(capture_path), "tests.test_capture:replay_target"])
+
+    assert "GET /users" in capsys.readouterr().out
+
+
+def test_body_without_length_is_not_captured(capture_path):
+    capture = TrafficCapture(capture_path, sample_rate=1.0)
+    body = b'{"name": "a", "time": "2020-01-01T00:00:00"}\n'
+    response = make_app(capture).test_client().post(
+        "/events",
+        input_stream=io.BytesIO(body),
+        content_type="application/x-ndjson",
+        headers={"Transfer-Encoding": "chunked"},
+        environ_overrides={"wsgi.input_terminated": True},
+    )
+    capture.close()
+
+    assert response.json["count"] == 1
+    assert next(read_capture(capture_path)).body == b""
@@ -0,0 +1,126 @@
+import asyncio
+import http.client
+import inspect
+import threading
+
+import pytest
+from flask import Flask
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from flask_typed import TypedAPI, NotFoundError
+from flask_typed.client import TypedClient, AsyncTypedClient, ConnectionPool
+from flask_typed.parameter import ValidationError
+from tests.test_data.jobs import JobsResource
+from tests.test_data.simple_user import UserResource
+from tests.test_test_client import NoteResource, Note
+
+
+def keep_alive_server(app: Flask) -> ThreadingHTTPServer:
+    # The werkzeug development server closes every connection, this one keeps them open
+    client = app.test_client()
+
+    class KeepAliveRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def handle_request(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            response = client.open(self.path, method=self.command, headers=dict(self.headers), data=body)
+            data = response.get_data()
+            self.send_response(response.status_code)
+            for name, value in response.headers.items():
+                if name.lower() != "content-length":
+                    self.send_header(name, value)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = handle_request
+
+        def log_message(self, *args):
+            pass
+
+    return ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveRequestHandler)
+
+
+@pytest.fixture(scope="module")
+def server():
+    app = Flask("client_app")
+    api = TypedAPI(app)
+    api.add_resource(UserResource, "/users")
+    api.add_resource(JobsResource, "/jobs/<int:job_id>/<string:job_date>")
+    api.add_resource(NoteResource, "/notes/<int:note_id>")
+
+    http_server = keep_alive_server(app)
+    thread = threading.Thread(target=http_server.serve_forever, daemon=True)
+    thread.start()
+    yield api, f"http://127.0.0.1:{http_server.server_port}"
+    http_server.shutdown()
+
+
+def test_typed_calls_reuse_connection(server):
+    api, base_url = server
+    with TypedClient(api, base_url, pool_size=2) as client:
+        notes = [client.note.get(note_id=1) for _ in range(5)]
+        user = client.user.get(user_id=7)
+
+        assert notes == [Note(title="first")] * 5
+        assert user.id == 7
+        assert client.pool.created.value == 1
+
+
+def test_body_header_and_path(server):
+    api, base_url = server
+    with TypedClient(api, base_url) as client:
+        note = client.note.put(note_id=4, note=Note(title="todo"), revision=1)
+        job = client.jobs.post(job_id=2, job_date="2000-01-02")
+
+    assert note == Note(title="todo #4.1")
+    assert job.id == 2
+
+
+def test_errors_are_decoded(server):
+    api, base_url = server
+    with TypedClient(api, base_url) as client:
+        missing = client.note.get(note_id=3)
+        invalid = client.note.put(note_id=1, note=Note(title="x"))
+
+    assert isinstance(missing, NotFoundError)
+    assert missing.response.message == "No such note"
+    assert isinstance(invalid, ValidationError)
+
+
+def test_generated_signature(server):
+    api, base_url = server
+    client = TypedClient(api, base_url)
+    signature = inspect.signature(client.note.put)
+
+    assert list(signature.parameters) == ["note_id", "note", "revision"]
+    assert signature.return_annotation is Note
+
+
+def test_async_client(server):
+    api, base_url = server
+
+    async def fetch():
+        async with AsyncTypedClient(api, base_url, pool_size=4) as client:
+            return await asyncio.gather(*(client.note.get(note_id=1) for _ in range(8)))
+
+    assert asyncio.run(fetch()) == [Note(title="first")] * 8
+
+
+@pytest.mark.parametrize("method, attempts", [("GET", 2), ("PUT", 2), ("POST", 1), ("PATCH", 1)])
+def test_stale_connection_retries(method, attempts):
+    pool = ConnectionPool("http://127.0.0.1:1")
+    sent = []
+
+    def send(connection, *args):
+        sent.append(connection)
+        raise http.client.RemoteDisconnected("closed")
+
+    pool._send = send
+    pool._idle.append(pool._connect())
+    with pytest.raises(http.client.RemoteDisconnected):
+        pool.request(method, "/notes/1", None, {})
+
+    assert len(sent) == attempts
@@ -0,0 +1,137 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from flask import Flask
+from pydantic import BaseModel
+
+from flask_typed import TypedAPI, TypedResource, NotFoundError, PageRequest, StreamingResponse, coalesce
+
+
+class Report(BaseModel):
+    key: str
+    generation: int
+
+
+class ReportResource(TypedResource):
+    calls = 0
+    lock = threading.Lock()
+
+    @coalesce(timeout=5)
+    def get(self, key: str, delay: float = 0.2) -> Report:
+        with ReportResource.lock:
+            ReportResource.calls += 1
+            generation = ReportResource.calls
+        time.sleep(delay)
+        if key == "missing":
+            raise NotFoundError(message="No report")
+        return Report(key=key, generation=generation)
+
+
+class SlowResource(TypedResource):
+
+    @coalesce(timeout=0.05)
+    def get(self) -> Report:
+        time.sleep(0.3)
+        return Report(key="slow", generation=0)
+
+
+@pytest.fixture()
+def coalesce_app():
+    ReportResource.calls = 0
+    app = Flask("coalesce_app")
+    api = TypedAPI(app)
+    api.add_resource(ReportResource, "/reports")
+    api.add_resource(SlowResource, "/slow")
+    return app
+
+
+def fetch_concurrently(app, url, count=8):
+    def fetch(_):
+        response = app.test_client().get(url)
+        return response.status_code, response.get_data()
+
+    with ThreadPoolExecutor(count) as executor:
+        return list(executor.map(fetch, range(count)))
+
+
+def test_identical_requests_are_coalesced(coalesce_app):
+    results = fetch_concurrently(coalesce_app, "/reports?key=a")
+
+    assert ReportResource.calls == 1
+    assert len(set(results)) == 1
+    assert results[0][0] == 200
+
+
+def test_different_keys_are_not_coalesced(coalesce_app):
+    fetch_concurrently(coalesce_app, "/reports?key=a", count=2)
+    fetch_concurrently(coalesce_app, "/reports?key=b", count=2)
+
+    assert ReportResource.calls == 2
+
+
+def test_leader_error_is_propagated_to_waiters(coalesce_app):
+    results = fetch_concurrently(coalesce_app, "/reports?key=missing")
+
+    assert ReportResource.calls == 1
+    assert all(status == 404 for status, _ in results)
+    assert all(b"No report" in body for _, body in results)
+
+
+def test_waiter_timeout(coalesce_app):
+    results = fetch_concurrently(coalesce_app, "/slow", count=3)
+
+    assert sorted(status for status, _ in results) == [200, 504, 504]
+
+
+def test_timeout_is_documented(coalesce_app):
+    docs = coalesce_app.test_client().get("/openapi").json
+
+    assert "504" in docs["paths"]["/slow"]["get"]["responses"]
+
+
+def test_request_parsers_require_explicit_key():
+    class ParserResource(TypedResource):
+
+        @coalesce()
+        def get(self, page: PageRequest) -> Report:
+            return Report(key="page", generation=page.limit)
+
+    api = TypedAPI(Flask("coalesce_parser_app"))
+    with pytest.raises(ValueError, match="explicit key"):
+        api.add_resource(ParserResource, "/pages")
+
+
+def test_request_parsers_with_explicit_key():
+    class KeyedParserResource(TypedResource):
+
+        @coalesce(key=lambda args: args["page"].limit)
+        def get(self, page: PageRequest) -> Report:
+            return Report(key="page", generation=page.limit)
+
+    app = Flask("coalesce_keyed_parser_app")
+    TypedAPI(app).add_resource(KeyedParserResource, "/pages")
+
+    assert app.test_client().get("/pages?limit=3").json == {"key": "page", "generation": 3}
+
+
+class StreamedReportResource(TypedResource):
+    calls = 0
+
+    @coalesce(timeout=5)
+    def get(self) -> StreamingResponse:
+        StreamedReportResource.calls += 1
+        time.sleep(0.1)
+        return StreamingResponse(iter([b"part-1,", b"part-2"]))
+
+
+def test_streamed_responses_are_not_shared():
+    StreamedReportResource.calls = 0
+    app = Flask("coalesce_streamed_app")
+    TypedAPI(app).add_resource(StreamedReportResource, "/streamed")
+
+    results = fetch_concurrently(app, "/streamed", count=4)
+
+    assert results == [(200, b"part-1,part-2")] * 4
+    assert StreamedReportResource.calls == 4
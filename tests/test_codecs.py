@@ -0,0 +1,109 @@
+import json
+from datetime import date
+
+import pytest
+from flask import Flask
+from pydantic import BaseModel
+
+from flask_typed import TypedAPI, TypedResource
+from flask_typed.response import BaseModelResponse
+
+msgpack = pytest.importorskip("msgpack")
+
+
+class Measurement(BaseModel):
+    sensor: str
+    day: date
+    values: list[float]
+
+
+class MeasurementsResource(TypedResource):
+
+    def post(self, measurement: Measurement) -> Measurement:
+        return measurement
+
+
+@pytest.fixture()
+def codec_client():
+    app = Flask("codec_app")
+    api = TypedAPI(app)
+    api.add_resource(MeasurementsResource, "/measurements")
+    return app.test_client()
+
+
+MEASUREMENT = {"sensor": "a", "day": "2020-01-01", "values": [1.5, 2.5]}
+
+
+def test_msgpack_request_and_response(codec_client):
+    response = codec_client.post(
+        "/measurements",
+        data=msgpack.packb(MEASUREMENT),
+        content_type="application/msgpack",
+        headers={"Accept": "application/msgpack"},
+    )
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/msgpack"
+    assert "Accept" in response.vary
+    assert msgpack.unpackb(response.get_data()) == MEASUREMENT
+
+
+def test_json_is_default(codec_client):
+    response = codec_client.post("/measurements", json=MEASUREMENT, headers={"Accept": "*/*"})
+
+    assert response.mimetype == "application/json"
+    assert response.json == MEASUREMENT
+
+
+@pytest.mark.parametrize("content_type", ["text/plain", "application/vnd.measurement+json", "application/x-unknown"])
+def test_other_media_types_are_parsed_as_json(codec_client, content_type):
+    response = codec_client.post("/measurements", data=json.dumps(MEASUREMENT), content_type=content_type)
+
+    assert response.status_code == 200
+    assert response.json == MEASUREMENT
+
+
+def test_other_media_types_are_validated_as_json(codec_client):
+    response = codec_client.post("/measurements", data=b"<xml/>", content_type="application/xml")
+
+    assert response.status_code == 422
+
+
+def test_negotiated_media_types_are_documented(codec_client):
+    operation = codec_client.get("/openapi").json["paths"]["/measurements"]["post"]
+
+    assert set(operation["requestBody"]["content"]) == {"application/json", "application/msgpack"}
+    assert set(operation["responses"]["200"]["content"]) == {"application/json", "application/msgpack"}
+
+
+class MeasurementCreated(BaseModelResponse):
+    status_code = 201
+    mime_type = "application/vnd.measurement+json"
+
+    sensor: str
+    day: date
+
+
+class CreatedMeasurementsResource(TypedResource):
+
+    def post(self, measurement: Measurement) -> MeasurementCreated:
+        return MeasurementCreated(sensor=measurement.sensor, day=measurement.day)
+
+
+def test_model_response_is_negotiated():
+    app = Flask("model_response_codec_app")
+    api = TypedAPI(app)
+    api.add_resource(CreatedMeasurementsResource, "/created")
+    client = app.test_client()
+
+    response = client.post("/created", json=MEASUREMENT, headers={"Accept": "application/msgpack"})
+    assert response.status_code == 201
+    assert response.mimetype == "application/msgpack"
+    assert msgpack.unpackb(response.get_data()) == {"sensor": "a", "day": "2020-01-01"}
+
+    response = client.post("/created", json=MEASUREMENT)
+    assert response.mimetype == "application/vnd.measurement+json"
+    assert "Accept" in response.vary
+
+    responses = api.get_openapi_schema()["paths"]["/created"]["post"]["responses"]
+    assert set(responses["201"]["content"]) == {"application/vnd.measurement+json", "application/msgpack"}
@@ -0,0 +1,117 @@
+import json
+from datetime import datetime
+
+import pytest
+from flask import Flask
+from pydantic import BaseModel, Field
+
+from flask_typed import TypedAPI, TypedResource, columnar, sparse_fields
+
+
+class Post(BaseModel):
+    id: int
+    title: str
+    created: datetime = Field(alias="createdAt")
+
+
+class PostList(BaseModel):
+    count: int
+    items: list[Post]
+
+
+def make_posts() -> PostList:
+    return PostList(count=2, items=[
+        Post(id=1, title="first", createdAt=datetime(2020, 1, 1)),
+        Post(id=2, title="second", createdAt=datetime(2020, 1, 2)),
+    ])
+
+
+class PostsResource(TypedResource):
+
+    @columnar()
+    def get(self) -> PostList:
+        return make_posts()
+
+
+class PostRowsResource(TypedResource):
+
+    @sparse_fields()
+    @columnar(query_param=None, layout="rows")
+    def get(self) -> PostList:
+        return make_posts()
+
+
+@pytest.fixture()
+def api():
+    app = Flask("columnar_app")
+    api = TypedAPI(app)
+    api.add_resource(PostsResource, "/posts")
+    api.add_resource(PostRowsResource, "/rows")
+    return api
+
+
+COLUMNS = {
+    "count": 2,
+    "items": {
+        "columns": ["id", "title", "createdAt"],
+        "data": {
+            "id": [1, 2],
+            "title": ["first", "second"],
+            "createdAt": ["2020-01-01T00:00:00", "2020-01-02T00:00:00"],
+        }
+    }
+}
+
+
+def test_row_objects_by_default(api):
+    response = api.app.test_client().get("/posts")
+
+    assert response.mimetype == "application/json"
+    assert response.json["items"][0] == {"id": 1, "title": "first", "createdAt": "2020-01-01T00:00:00"}
+
+
+def test_columnar_by_accept_and_query_flag(api):
+    client = api.app.test_client()
+    by_accept = client.get("/posts", headers={"Accept": "application/vnd.columnar+json"})
+    by_query = client.get("/posts?columnar=true")
+
+    assert by_accept.mimetype == by_query.mimetype == "application/vnd.columnar+json"
+    assert by_accept.json == by_query.json == COLUMNS
+    assert "Accept" in by_accept.headers["Vary"]
+
+
+def test_rows_layout_with_sparse_fields(api):
+    response = api.app.test_client().get(
+        "/rows?fields=items.id,items.title", headers={"Accept": "application/vnd.columnar+json"}
+    )
+
+    assert response.json == {"items": {"columns": ["id", "title"], "rows": [[1, "first"], [2, "second"]]}}
+
+
+def test_columnar_docs(api):
+    schema = api.get_openapi_schema()
+    operation = schema["paths"]["/posts"]["get"]
+    content = operation["responses"]["200"]["content"]
+    items = content["application/vnd.columnar+json"]["schema"]["properties"]["items"]
+
+    assert content["application/json"]["schema"]["$ref"].endswith("/PostList")
+    assert items["properties"]["columns"]["items"]["enum"] == ["id", "title", "createdAt"]
+    assert set(items["properties"]["data"]["properties"]) == {"id", "title", "createdAt"}
+    assert operation["parameters"][0]["name"] == "columnar"
+    assert "parameters" not in schema["paths"]["/rows"]["get"] or all(
+        param["name"] != "columnar" for param in schema["paths"]["/rows"]["get"]["parameters"]
+    )
+
+
+def test_codec_include_set_and_exclude():
+    codec = PostsResource.get.columnar.codec
+
+    assert json.loads(codec.dump_model(make_posts(), by_alias=True, include={"items"})) == {"items": COLUMNS["items"]}
+    assert json.loads(codec.dump_model(make_posts(), by_alias=True, exclude={"count"})) == {"items": COLUMNS["items"]}
+    assert json.loads(codec.dump_model(make_posts(), by_alias=True, exclude={"items": {"__all__": {"title"}}})) == {
+        "count": 2,
+        "items": {
+            "columns": ["id", "createdAt"],
+            "data": {"id": [1, 2], "createdAt": ["2020-01-01T00:00:00", "2020-01-02T00:00:00"]},
+        }
+    }
@@ -0,0 +1,84 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from flask import Flask
+
+from flask_typed import TypedAPI, TypedResource, concurrency_limit, ConcurrencyLimit
+
+release = threading.Event()
+
+
+class SlowResource(TypedResource):
+
+    @concurrency_limit(1, max_queue=1, queue_timeout=5, retry_after=3)
+    def get(self) -> str:
+        release.wait(5)
+        return "done"
+
+
+class LimitedResource(TypedResource):
+
+    def get(self) -> str:
+        release.wait(5)
+        return "done"
+
+
+@pytest.fixture()
+def limited_app():
+    release.clear()
+    app = Flask("concurrency_app")
+    api = TypedAPI(app)
+    api.add_resource(SlowResource, "/slow")
+    api.add_resource(LimitedResource, "/limited", concurrency_limit=ConcurrencyLimit(1))
+    yield app, api
+    release.set()
+
+
+def request_concurrently(app, url, count, settle):
+    executor = ThreadPoolExecutor(count)
+    futures = [executor.submit(app.test_client().get, url) for _ in range(count)]
+    settle()
+    release.set()
+    responses = [future.result() for future in futures]
+    executor.shutdown()
+    return responses
+
+
+def test_requests_over_limit_and_queue_are_shed(limited_app):
+    app, api = limited_app
+    limiter = api.resources["/slow"].methods["GET"].concurrency_limiter
+
+    def settle():
+        while limiter.shed.value < 2:
+            threading.Event().wait(0.01)
+
+    responses = request_concurrently(app, "/slow", 4, settle)
+
+    statuses = sorted(response.status_code for response in responses)
+    assert statuses == [200, 200, 503, 503]
+    shed = [response for response in responses if response.status_code == 503]
+    assert shed[0].headers["Retry-After"] == "3"
+    assert shed[0].json["message"] == "Too many concurrent requests"
+    assert limiter.stats == {"admitted": 2, "queued": 1, "shed": 2}
+
+
+def test_limit_from_add_resource(limited_app):
+    app, api = limited_app
+    limiter = api.resources["/limited"].methods["GET"].concurrency_limiter
+
+    def settle():
+        while limiter.shed.value < 1:
+            threading.Event().wait(0.01)
+
+    responses = request_concurrently(app, "/limited", 2, settle)
+
+    assert sorted(response.status_code for response in responses) == [200, 503]
+
+
+def test_shedding_is_documented(limited_app):
+    app, _ = limited_app
+    docs = app.test_client().get("/openapi").json
+
+    assert "503" in docs["paths"]["/slow"]["get"]["responses"]
+    assert "503" in docs["paths"]["/limited"]["get"]["responses"]
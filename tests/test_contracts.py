@@ -0,0 +1,78 @@
+import logging
+
+import pytest
+from flask import Flask
+from pydantic import BaseModel
+
+from flask_typed import TypedAPI, TypedResource, contract_sampling, ConflictError
+
+
+class Account(BaseModel):
+    id: int
+    balance: float
+
+
+class AccountResource(TypedResource):
+
+    def get(self, drift: bool = False) -> Account:
+        if drift:
+            # Built without validation, the way contract drift sneaks in
+            return Account.model_construct(id="not a number", balance=1.0)
+        return Account(id=1, balance=1.0)
+
+    @contract_sampling(1.0)
+    def post(self, conflict: bool = False) -> dict[str, int]:
+        if conflict:
+            raise ConflictError
+        return {"id": "unexpected"}
+
+
+@pytest.fixture()
+def contract_app():
+    app = Flask("contract_app")
+    api = TypedAPI(app, contract_sample_rate=1.0)
+    api.add_resource(AccountResource, "/accounts")
+    return app, api
+
+
+def test_valid_responses_are_not_reported(contract_app, caplog):
+    app, api = contract_app
+    checker = api.resources["/accounts"].methods["GET"].contract_checker
+
+    assert app.test_client().get("/accounts").status_code == 200
+    assert checker.checked.value == 1
+    assert checker.mismatches.value == 0
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_model_drift_is_reported_without_failing(contract_app, caplog):
+    app, api = contract_app
+    checker = api.resources["/accounts"].methods["GET"].contract_checker
+
+    with caplog.at_level(logging.WARNING, logger="flask_typed.contracts"):
+        response = app.test_client().get("/accounts?drift=true")
+
+    assert response.status_code == 200
+    assert checker.mismatches.value == 1
+    assert "AccountResource.get" in caplog.text
+
+
+def test_plain_values_and_errors_are_checked(contract_app):
+    app, api = contract_app
+    checker = api.resources["/accounts"].methods["POST"].contract_checker
+
+    assert app.test_client().post("/accounts").status_code == 200
+    assert app.test_client().post("/accounts?conflict=true").status_code == 409
+    assert checker.checked.value == 2
+    assert checker.mismatches.value == 2
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_sampling_rate():
+    app = Flask("contract_app")
+    api = TypedAPI(app, contract_sample_rate=0.0)
+    api.add_resource(AccountResource, "/accounts")
+
+    app.test_client().get("/accounts?drift=true")
+
+    assert api.resources["/accounts"].methods["GET"].contract_checker.checked.value == 0
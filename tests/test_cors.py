@@ -0,0 +1,76 @@
+import pytest
+from flask import Flask
+
+from flask_typed import TypedAPI, CorsConfig
+from tests.test_data.jobs import JobsResource
+from tests.test_data.simple_user import UserResource
+from tests.test_test_client import NoteResource
+
+
+@pytest.fixture()
+def cors_client():
+    app = Flask("cors_app")
+    api = TypedAPI(app, cors=CorsConfig(max_age=600))
+    api.add_resource(UserResource, "/users")
+    api.add_resource(
+        NoteResource,
+        "/notes/<int:note_id>",
+        cors=CorsConfig(origins=["https://app.example.com"], allow_credentials=True, expose_headers=["ETag"])
+    )
+    api.add_resource(JobsResource, "/jobs/<int:job_id>/<string:job_date>")
+    return app.test_client()
+
+
+def test_preflight_methods_from_resource(cors_client):
+    response = cors_client.options("/users", headers={
+        "Origin": "https://any.example.com",
+        "Access-Control-Request-Method": "POST",
+    })
+
+    assert response.status_code == 204
+    assert response.headers["Access-Control-Allow-Methods"] == "GET, OPTIONS, POST"
+    assert response.headers["Access-Control-Allow-Origin"] == "*"
+    assert response.headers["Access-Control-Max-Age"] == "600"
+    assert response.headers["Access-Control-Allow-Headers"] == "Content-Type, Authorization"
+
+    jobs = cors_client.options("/jobs/1/2000-01-01", headers={"Origin": "https://any.example.com"})
+    assert jobs.headers["Access-Control-Allow-Methods"] == "OPTIONS, POST"
+
+
+def test_preflight_with_listed_origins(cors_client):
+    allowed = cors_client.options("/notes/1", headers={"Origin": "https://app.example.com"})
+    rejected = cors_client.options("/notes/1", headers={"Origin": "https://evil.example.com"})
+
+    assert allowed.headers["Access-Control-Allow-Origin"] == "https://app.example.com"
+    assert allowed.headers["Access-Control-Allow-Credentials"] == "true"
+    assert allowed.headers["Access-Control-Allow-Methods"] == "GET, OPTIONS, PUT"
+    assert allowed.headers["Vary"] == "Origin"
+    assert "Access-Control-Allow-Origin" not in rejected.headers
+    assert rejected.headers["Allow"] == "GET, OPTIONS, PUT"
+
+
+def test_actual_response_headers(cors_client):
+    response = cors_client.get("/notes/1", headers={"Origin": "https://app.example.com"})
+    not_found = cors_client.get("/notes/2", headers={"Origin": "https://app.example.com"})
+    same_origin = cors_client.get("/users")
+
+    assert response.json == {"title": "first", "tags": []}
+    assert response.headers["Access-Control-Allow-Origin"] == "https://app.example.com"
+    assert response.headers["Access-Control-Expose-Headers"] == "ETag"
+    assert "Origin" in response.headers["Vary"]
+    assert not_found.status_code == 404
+    assert not_found.headers["Access-Control-Allow-Origin"] == "https://app.example.com"
+    assert "Access-Control-Allow-Origin" not in same_origin.headers
+
+
+def test_credentials_require_listed_origins():
+    with pytest.raises(ValueError):
+        CorsConfig(allow_credentials=True)
+
+
+def test_without_cors_options_is_not_routed():
+    app = Flask("no_cors_app")
+    api = TypedAPI(app)
+    api.add_resource(UserResource, "/users")
+
+    assert app.test_client().options("/users").status_code == 405
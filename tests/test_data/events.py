@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from flask_typed import TypedResource, NDJSONStream
+
+
+class Event(BaseModel):
+    name: str
+    time: datetime
+
+
+class IngestResult(BaseModel):
+    count: int
+    names: list[str]
+
+
+class EventStream(NDJSONStream[Event]):
+    max_body_size = 1024
+    max_items = 5
+    chunk_size = 16
+
+
+class EventsResource(TypedResource):
+
+    def post(self, events: EventStream) -> IngestResult:
+        """
+        Ingests events
+
+        :param events: Events as newline delimited JSON
+        :return: Ingested events
+        """
+        names = [event.name for event in events]
+        return IngestResult(count=len(names), names=names)
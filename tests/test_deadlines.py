@@ -0,0 +1,90 @@
+import time
+
+import pytest
+from flask import Flask
+
+from flask_typed import TypedAPI, TypedResource, deadline, Deadline, DeadlinePolicy
+
+
+class BudgetResource(TypedResource):
+
+    @deadline(budget=2.0)
+    def get(self, remaining: Deadline) -> dict:
+        return {"remaining": remaining.remaining(), "timeout": remaining.timeout(10.0)}
+
+
+class PlainResource(TypedResource):
+
+    def get(self, remaining: Deadline) -> dict:
+        return {"remaining": remaining.remaining()}
+
+
+class HeaderResource(PlainResource):
+    pass
+
+
+@pytest.fixture()
+def deadline_app():
+    app = Flask("deadline_app")
+    api = TypedAPI(app)
+    api.add_resource(BudgetResource, "/budget")
+    api.add_resource(PlainResource, "/plain")
+    api.add_resource(HeaderResource, "/header", deadline=DeadlinePolicy())
+    return app, api
+
+
+def test_remaining_budget_is_injected(deadline_app):
+    app, _ = deadline_app
+    data = app.test_client().get("/budget").json
+
+    assert 1.5 < data["remaining"] <= 2.0
+    assert data["timeout"] <= data["remaining"]
+
+
+def test_request_queued_past_budget_is_rejected(deadline_app):
+    app, api = deadline_app
+    enforcer = api.resources["/budget"].methods["GET"].deadline_enforcer
+    start_ms = int((time.time() - 3) * 1000)
+
+    response = app.test_client().get("/budget", headers={"X-Request-Start": f"t={start_ms}"})
+
+    assert response.status_code == 504
+    assert enforcer.rejected.value == 1
+    assert enforcer.rejected_age.mean >= 3
+
+
+def test_incoming_deadline_header(deadline_app):
+    app, api = deadline_app
+    client = app.test_client()
+
+    expired = client.get("/header", headers={"X-Request-Deadline": str(time.time() - 1)})
+    assert expired.status_code == 504
+
+    data = client.get("/header", headers={"X-Request-Deadline": str(time.time() + 5)}).json
+    assert 4 < data["remaining"] <= 5
+
+    assert client.get("/header").json == {"remaining": None}
+    assert api.resources["/header"].methods["GET"].deadline_enforcer.admitted.value == 2
+
+
+def test_incoming_deadline_is_bounded_by_budget(deadline_app):
+    app, _ = deadline_app
+    data = app.test_client().get("/budget", headers={"X-Request-Deadline": str(time.time() + 60)}).json
+
+    assert data["remaining"] <= 2.0
+
+
+def test_deadline_without_policy_is_unbounded(deadline_app):
+    app, api = deadline_app
+
+    assert app.test_client().get("/plain").json == {"remaining": None}
+    assert api.resources["/plain"].methods["GET"].deadline_enforcer is None
+
+
+def test_deadline_is_documented(deadline_app):
+    _, api = deadline_app
+    schema = api.get_openapi_schema()
+
+    assert "504" in schema["paths"]["/budget"]["get"]["responses"]
+    assert "504" not in schema["paths"]["/plain"]["get"]["responses"]
+    assert all(param["in"] != "query" for param in schema["paths"]["/budget"]["get"].get("parameters", []))
@@ -0,0 +1,86 @@
+import io
+
+import pytest
+from flask import Flask
+
+from flask_typed import TypedAPI, TypedResource, FileResponse
+
+CONTENT = bytes(range(256)) * 4
+
+
+class ArtifactResource(TypedResource):
+
+    def get(self, name: str) -> FileResponse:
+        """
+        Downloads an artifact
+
+        :param name: Artifact name
+        :return: Artifact content
+        """
+        if name == "proxied":
+            return FileResponse(ArtifactResource.path, accel_redirect="/internal/artifact.bin")
+        if name == "memory":
+            return FileResponse(io.BytesIO(CONTENT))
+        return FileResponse(ArtifactResource.path, use_x_sendfile=name == "sendfile")
+
+
+@pytest.fixture()
+def artifact_client(tmp_path):
+    ArtifactResource.path = tmp_path / "artifact.bin"
+    ArtifactResource.path.write_bytes(CONTENT)
+    app = Flask("artifact_app")
+    api = TypedAPI(app)
+    api.add_resource(ArtifactResource, "/artifact")
+    return app.test_client()
+
+
+def test_file_response(artifact_client):
+    response = artifact_client.get("/artifact?name=full")
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/octet-stream"
+    assert response.headers["Accept-Ranges"] == "bytes"
+    assert response.get_data() == CONTENT
+
+
+def test_file_object_without_name(artifact_client):
+    response = artifact_client.get("/artifact?name=memory")
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/octet-stream"
+    assert response.get_data() == CONTENT
+
+
+def test_file_response_range(artifact_client):
+    response = artifact_client.get("/artifact?name=full", headers={"Range": "bytes=10-19"})
+
+    assert response.status_code == 206
+    assert response.headers["Content-Range"] == f"bytes 10-19/{len(CONTENT)}"
+    assert response.get_data() == CONTENT[10:20]
+
+
+def test_file_response_if_range(artifact_client):
+    etag = artifact_client.get("/artifact?name=full").headers["ETag"]
+
+    response = artifact_client.get("/artifact?name=full", headers={"Range": "bytes=0-9", "If-Range": etag})
+    assert response.status_code == 206
+
+    response = artifact_client.get("/artifact?name=full", headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+    assert response.status_code == 200
+    assert response.get_data() == CONTENT
+
+
+def test_file_response_offloaded_to_proxy(artifact_client):
+    response = artifact_client.get("/artifact?name=sendfile")
+    assert response.headers["X-Sendfile"].endswith("artifact.bin")
+    assert response.get_data() == b""
+
+    response = artifact_client.get("/artifact?name=proxied")
+    assert response.headers["X-Accel-Redirect"] == "/internal/artifact.bin"
+    assert response.get_data() == b""
+
+
+def test_file_response_docs(artifact_client):
+    responses = artifact_client.get("/openapi").json["paths"]["/artifact"]["get"]["responses"]
+
+    assert responses["200"]["content"]["application/octet-stream"]["schema"] == {"type": "string", "format": "binary"}
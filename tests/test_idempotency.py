@@ -0,0 +1,219 @@
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from flask import Flask
+from pydantic import BaseModel
+
+from flask_typed import (
+    TypedAPI, TypedResource, idempotent, MemoryIdempotencyStore, SQLiteIdempotencyStore, InternalServerError
+)
+from flask_typed.annotations import Form, File
+from tests.test_data.events import EventStream, IngestResult
+
+calls = []
+release = threading.Event()
+
+
+class Payment(BaseModel):
+    amount: int
+
+
+class PaymentResult(BaseModel):
+    id: int
+    amount: int
+
+    model_config = {"status_code": 201}
+
+
+class PaymentResource(TypedResource):
+
+    @idempotent()
+    def post(self, payment: Payment) -> PaymentResult:
+        release.wait(5)
+        calls.append(payment.amount)
+        if payment.amount < 0:
+            raise InternalServerError(message="Payment failed")
+        return PaymentResult(id=len(calls), amount=payment.amount)
+
+
+class RequiredKeyResource(TypedResource):
+
+    @idempotent(required=True)
+    def post(self, payment: Payment) -> PaymentResult:
+        return PaymentResult(id=0, amount=payment.amount)
+
+
+@pytest.fixture()
+def client():
+    calls.clear()
+    release.set()
+    PaymentResource.post.idempotency.store = MemoryIdempotencyStore()
+    app = Flask("idempotency_app")
+    api = TypedAPI(app)
+    api.add_resource(PaymentResource, "/payments")
+    api.add_resource(RequiredKeyResource, "/required")
+    yield app.test_client()
+    release.set()
+
+
+def pay(client, amount, key=None, url="/payments"):
+    headers = {"Idempotency-Key": key} if key is not None else {}
+    return client.post(url, json={"amount": amount}, headers=headers)
+
+
+def test_retry_is_replayed(client):
+    first = pay(client, 10, "a")
+    retry = pay(client, 10, "a")
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json == first.json == {"id": 1, "amount": 10}
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first.headers
+    assert calls == [10]
+
+
+def test_requests_without_key_are_executed(client):
+    pay(client, 10)
+    pay(client, 10)
+
+    assert calls == [10, 10]
+
+
+def test_key_reused_for_different_request(client):
+    pay(client, 10, "a")
+    response = pay(client, 20, "a")
+
+    assert response.status_code == 422
+    assert calls == [10]
+
+
+def test_server_errors_are_not_stored(client):
+    assert pay(client, -1, "a").status_code == 500
+    assert pay(client, -1, "a").status_code == 500
+    assert calls == [-1, -1]
+
+
+def test_concurrent_duplicates_wait_for_first(client):
+    release.clear()
+    executor = ThreadPoolExecutor(4)
+    futures = [executor.submit(pay, client, 10, "a") for _ in range(4)]
+    threading.Event().wait(0.1)
+    release.set()
+    responses = [future.result() for future in futures]
+    executor.shutdown()
+
+    assert calls == [10]
+    assert all(response.json == {"id": 1, "amount": 10} for response in responses)
+
+
+def test_required_key(client):
+    assert pay(client, 10, url="/required").status_code == 400
+    assert pay(client, 10, "a", url="/required").status_code == 201
+
+
+def test_sqlite_store_with_ttl(tmp_path):
+    app = Flask("idempotency_sqlite_app")
+
+    class StoredPaymentResource(TypedResource):
+
+        @idempotent(store=SQLiteIdempotencyStore(str(tmp_path / "idempotency.db")), ttl=60)
+        def post(self, payment: Payment) -> PaymentResult:
+            calls.append(payment.amount)
+            return PaymentResult(id=len(calls), amount=payment.amount)
+
+    calls.clear()
+    api = TypedAPI(app)
+    api.add_resource(StoredPaymentResource, "/payments")
+    client = app.test_client()
+
+    first = pay(client, 5, "b")
+    retry = pay(client, 5, "b")
+
+    assert retry.json == first.json
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert calls == [5]
+
+
+def test_idempotency_is_documented(client):
+    app = Flask("idempotency_docs_app")
+    api = TypedAPI(app)
+    api.add_resource(RequiredKeyResource, "/required")
+    operation = api.get_openapi_schema()["paths"]["/required"]["post"]
+
+    assert {"name": "Idempotency-Key", "in": "header"}.items() <= operation["parameters"][0].items()
+    assert operation["parameters"][0]["required"] is True
+    assert {"400", "422"} <= operation["responses"].keys()
+
+
+class LaggingStore(MemoryIdempotencyStore):
+    # The first read after a write misses it, like a duplicate checking the store just before the response is stored
+
+    def __init__(self):
+        super().__init__()
+        self.lagging = False
+
+    def set(self, key, response, ttl):
+        super().set(key, response, ttl)
+        self.lagging = True
+
+    def get(self, key):
+        if self.lagging:
+            self.lagging = False
+            return None
+        return super().get(key)
+
+
+def test_duplicate_after_first_finished_is_replayed():
+    calls.clear()
+    PaymentResource.post.idempotency.store = LaggingStore()
+    app = Flask("idempotency_lagging_app")
+    TypedAPI(app).add_resource(PaymentResource, "/payments")
+    client = app.test_client()
+
+    first = pay(client, 10, "a")
+    retry = pay(client, 10, "a")
+
+    assert retry.json == first.json
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert calls == [10]
+
+
+def test_streamed_body_is_rejected():
+    class IdempotentEventsResource(TypedResource):
+
+        @idempotent()
+        def post(self, events: EventStream) -> IngestResult:
+            return IngestResult(count=0, names=[])
+
+    api = TypedAPI(Flask("idempotency_stream_app"))
+    with pytest.raises(ValueError, match="streams the request body"):
+        api.add_resource(IdempotentEventsResource, "/events")
+
+
+def test_uploads_are_fingerprinted():
+    uploads = []
+
+    class IdempotentUploadResource(TypedResource):
+
+        @idempotent()
+        def post(self, title: Form[str], document: File) -> str:
+            uploads.append(document.read())
+            return title
+
+    app = Flask("idempotency_upload_app")
+    TypedAPI(app).add_resource(IdempotentUploadResource, "/documents")
+    client = app.test_client()
+
+    def upload(content):
+        return client.post(
+            "/documents",
+            data={"title": "Report", "document": (io.BytesIO(content), "report.txt")},
+            headers={"Idempotency-Key": "a"},
+        )
+
+    assert upload(b"first").status_code == 200
+    assert upload(b"first").headers["Idempotent-Replayed"] == "true"
+    assert upload(b"second").status_code == 422
+    assert uploads == [b"first"]
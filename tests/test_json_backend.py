@@ -0,0 +1,77 @@
+from datetime import datetime
+
+import pytest
+from flask import Flask
+
+from flask_typed import TypedAPI, TypedResource, StdlibJsonBackend, OrjsonBackend
+from flask_typed.json_backend import get_json_backend, DEFAULT_JSON_BACKEND
+
+
+class StatsResource(TypedResource):
+
+    def get(self) -> dict:
+        return {"updated": datetime(2020, 1, 2, 3, 4, 5), "counts": [1, 2], "b": 1, "a": 2}
+
+
+class NumbersResource(TypedResource):
+
+    def get(self) -> list:
+        return [{1: "a"}, {"b": 2 ** 70}]
+
+
+@pytest.fixture(params=[StdlibJsonBackend, OrjsonBackend])
+def json_backend_app(request):
+    try:
+        backend = request.param()
+    except ImportError:
+        pytest.skip("orjson is not installed")
+    app = Flask("json_backend_app")
+    api = TypedAPI(app, json_backend=backend)
+    api.add_resource(StatsResource, "/stats")
+    api.add_resource(NumbersResource, "/numbers")
+
+    @app.route("/plain")
+    def plain():
+        return [{1: "a"}, {"b": 2 ** 70}]
+
+    return app, api
+
+
+def test_plain_values_use_backend(json_backend_app):
+    app, _ = json_backend_app
+    response = app.test_client().get("/stats")
+
+    assert response.get_data() == (
+        b'{"a":2,"b":1,"counts":[1,2],"updated":"Thu, 02 Jan 2020 03:04:05 GMT"}\n'
+    )
+
+
+def test_values_unsupported_by_backend(json_backend_app):
+    app, _ = json_backend_app
+    client = app.test_client()
+
+    assert client.get("/numbers").json == [{"1": "a"}, {"b": 2 ** 70}]
+    assert client.get("/plain").json == [{"1": "a"}, {"b": 2 ** 70}]
+
+
+def test_backend_is_kept_per_application(json_backend_app):
+    app, _ = json_backend_app
+    other_app = Flask("other_json_backend_app")
+    TypedAPI(other_app)
+
+    with other_app.app_context():
+        assert isinstance(get_json_backend(), StdlibJsonBackend)
+    with app.app_context():
+        assert get_json_backend() is app.extensions["flask_typed.json"].backend
+    assert get_json_backend() is DEFAULT_JSON_BACKEND
+    assert type(app.json).__name__ == "DefaultJSONProvider"
+
+
+def test_openapi_document(json_backend_app):
+    app, api = json_backend_app
+    client = app.test_client()
+
+    response = client.get("/openapi")
+    assert response.mimetype == "application/json"
+    assert response.json == api.get_openapi_schema()
+    assert list(response.json["paths"]) == ["/stats", "/numbers"]
@@ -0,0 +1,143 @@
+from datetime import datetime
+
+import pytest
+from flask import Flask
+from pydantic import BaseModel
+
+from flask_typed import TypedAPI, TypedResource, Paginated, PageRequest
+from flask_typed.testing import TypedTestClient
+
+ROWS = [{"id": i, "name": f"item-{i}"} for i in range(1, 26)]
+fetched = []
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+class ItemsResource(TypedResource):
+
+    def get(self, page: PageRequest, prefix: str = "item") -> Paginated[Item]:
+        def rows():
+            for row in ROWS:
+                if page.after is not None and row["id"] <= page.after[0]:
+                    continue
+                fetched.append(row["id"])
+                yield Item(id=row["id"], name=row["name"])
+        return page.results(rows(), key=lambda item: item.id)
+
+
+@pytest.fixture()
+def api():
+    app = Flask("pagination_app")
+    app.secret_key = "secret"
+    api = TypedAPI(app)
+    api.add_resource(ItemsResource, "/items")
+    fetched.clear()
+    return api
+
+
+def test_pages_follow_next_links(api):
+    client = api.app.test_client()
+
+    first = client.get("/items?limit=10").json
+    assert [item["id"] for item in first["items"]] == list(range(1, 11))
+    assert len(fetched) == 11
+    assert first["next"].startswith("/items?limit=10&cursor=")
+
+    second = client.get(first["next"]).json
+    assert [item["id"] for item in second["items"]] == list(range(11, 21))
+
+    last = client.get(second["next"]).json
+    assert [item["id"] for item in last["items"]] == list(range(21, 26))
+    assert last["next_cursor"] is None
+    assert last["next"] is None
+
+
+def test_limit_is_bounded(api):
+    client = api.app.test_client()
+
+    assert len(client.get("/items").json["items"]) == PageRequest.default_limit
+    assert len(client.get("/items?limit=1000").json["items"]) == 25
+    assert len(fetched) == 25 + PageRequest.default_limit + 1
+    assert client.get("/items?limit=0").status_code == 400
+    assert client.get("/items?limit=ten").status_code == 400
+
+
+def test_tampered_cursor_is_rejected(api):
+    client = api.app.test_client()
+    cursor = client.get("/items?limit=5").json["next_cursor"]
+
+    assert client.get(f"/items?cursor={cursor[:-2]}xx").status_code == 400
+    assert client.get("/items?cursor=WzVd").status_code == 400
+
+
+def test_docs(api):
+    schema = api.get_openapi_schema()
+    operation = schema["paths"]["/items"]["get"]
+
+    assert {"cursor", "limit", "prefix"} <= {param["name"] for param in operation["parameters"]}
+    limit = next(param for param in operation["parameters"] if param["name"] == "limit")
+    assert limit["schema"]["maximum"] == PageRequest.max_limit
+    assert "400" in operation["responses"]
+    content = operation["responses"]["200"]["content"]["application/json"]["schema"]
+    assert content["$ref"].endswith("Paginated_Item_")
+
+
+@pytest.mark.parametrize("full_stack", [False, True])
+def test_test_client_returns_typed_page(api, full_stack):
+    client = TypedTestClient(api, full_stack=full_stack)
+
+    page = client.get(ItemsResource, query_string={"limit": "2"})
+
+    assert page == Paginated[Item](
+        items=[Item(id=1, name="item-1"), Item(id=2, name="item-2")],
+        next_cursor=page.next_cursor,
+        next=page.next,
+    )
+    assert page.next_cursor is not None
+
+
+EVENTS = [{"at": datetime(2020, 1, 1, hour), "id": hour} for hour in range(5)]
+
+
+class Event(BaseModel):
+    at: datetime
+    id: int
+
+
+class EventPage(PageRequest):
+    key_type = tuple[datetime, int]
+
+
+class EventsResource(TypedResource):
+
+    def get(self, page: EventPage) -> Paginated[Event]:
+        rows = (Event(**row) for row in EVENTS if page.after is None or (row["at"], row["id"]) > page.after)
+        return page.results(rows, key=lambda event: (event.at, event.id))
+
+
+class UntypedEventsResource(TypedResource):
+
+    def get(self, page: PageRequest) -> Paginated[Event]:
+        return page.results((Event(**row) for row in EVENTS), key=lambda event: event.at)
+
+
+def test_cursor_keys_are_decoded_to_key_type(api):
+    api.add_resource(EventsResource, "/events")
+    client = api.app.test_client()
+
+    first = client.get("/events?limit=3").json
+    second = client.get(first["next"]).json
+
+    assert [event["id"] for event in first["items"]] == [0, 1, 2]
+    assert [event["id"] for event in second["items"]] == [3, 4]
+
+
+def test_keys_which_are_not_json_values_require_key_type(api):
+    api.add_resource(UntypedEventsResource, "/untyped-events")
+    api.app.testing = True
+
+    with pytest.raises(TypeError, match="set its key_type"):
+        api.app.test_client().get("/untyped-events?limit=3")
@@ -0,0 +1,91 @@
+import time
+
+import openapi_pydantic as openapi
+import pytest
+from flask import Flask
+from werkzeug.datastructures import Headers
+
+from flask_typed import TypedAPI, TypedResource, memoized
+from flask_typed.parsers import BodyParser, HeaderParser
+
+
+@memoized(headers=("Authorization",), maxsize=2, ttl=0.2)
+class TokenParser(HeaderParser):
+    parse_count = 0
+
+    def __init__(self, user: str):
+        self.user = user
+
+    @classmethod
+    def parse(cls, headers: Headers) -> 'TokenParser':
+        TokenParser.parse_count += 1
+        return TokenParser(headers.get("Authorization", "anonymous").removeprefix("Token "))
+
+    @classmethod
+    def schema(cls) -> list[openapi.Parameter]:
+        return []
+
+
+class ProfileResource(TypedResource):
+
+    def get(self, token: TokenParser) -> dict:
+        return {"user": token.user}
+
+
+@pytest.fixture()
+def profile_client():
+    TokenParser.parse_count = 0
+    TokenParser.parse_cache.clear()
+    app = Flask("profile_app")
+    api = TypedAPI(app)
+    api.add_resource(ProfileResource, "/profile")
+    return app.test_client()
+
+
+def get_user(client, token):
+    return client.get("/profile", headers={"Authorization": f"Token {token}"}).json["user"]
+
+
+def test_memoized_parser_reuses_results(profile_client):
+    assert [get_user(profile_client, token) for token in ["a", "a", "b", "a"]] == ["a", "a", "b", "a"]
+    assert TokenParser.parse_count == 2
+
+
+def test_memoized_parser_is_bounded(profile_client):
+    for token in ["a", "b", "c", "a"]:
+        get_user(profile_client, token)
+
+    assert TokenParser.parse_count == 4
+
+
+def test_memoized_parser_expires(profile_client):
+    get_user(profile_client, "a")
+    time.sleep(0.25)
+    get_user(profile_client, "a")
+
+    assert TokenParser.parse_count == 2
+
+
+class RawBody(BodyParser):
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    @classmethod
+    def parse(cls, data: bytes) -> 'RawBody':
+        return cls(data)
+
+
+class RawResource(TypedResource):
+
+    def post(self, body: RawBody) -> dict:
+        return {"length": len(body.data)}
+
+
+def test_body_parser_without_schema():
+    app = Flask("raw_body_app")
+    api = TypedAPI(app)
+    api.add_resource(RawResource, "/raw")
+
+    assert "requestBody" not in api.get_openapi_schema()["paths"]["/raw"]["post"]
+    assert app.test_client().post("/raw", data=b"abc").json == {"length": 3}
@@ -0,0 +1,110 @@
+from datetime import date
+
+import pytest
+from flask import Flask
+from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+
+from flask_typed import TypedAPI, TypedResource, Partial
+
+stored = {}
+
+
+class Profile(BaseModel):
+    name: str = Field(min_length=1)
+    age: int
+    nickname: str | None = None
+    joined: date
+
+
+class ProfileResource(TypedResource):
+
+    def patch(self, changes: Partial[Profile]) -> Profile:
+        stored["fields"] = changes.model_fields_set
+        return changes.apply(Profile(name="Ada", age=36, nickname="ada", joined=date(2000, 1, 1)))
+
+
+@pytest.fixture()
+def api():
+    app = Flask("partial_app")
+    api = TypedAPI(app)
+    api.add_resource(ProfileResource, "/profile")
+    return api
+
+
+def test_partial_model_is_cached():
+    assert Partial[Profile] is Partial[Profile]
+    assert Partial[Profile].__name__ == "PartialProfile"
+
+
+def test_only_sent_fields_are_set(api):
+    response = api.app.test_client().patch("/profile", json={"age": 37, "nickname": None})
+
+    assert response.status_code == 200
+    assert response.json == {"name": "Ada", "age": 37, "nickname": None, "joined": "2000-01-01"}
+    assert stored["fields"] == {"age", "nickname"}
+
+
+def test_changes_exclude_unset():
+    changes = Partial[Profile].model_validate({"joined": "2001-02-03"})
+
+    assert changes.changes() == {"joined": date(2001, 2, 3)}
+
+
+def test_constraints_and_nullability_are_kept(api):
+    client = api.app.test_client()
+
+    assert client.patch("/profile", json={"name": ""}).status_code == 422
+    assert client.patch("/profile", json={"age": None}).status_code == 422
+
+
+def test_request_schema(api):
+    schema = api.get_openapi_schema()
+    body = schema["paths"]["/profile"]["patch"]["requestBody"]["content"]["application/json"]["schema"]
+    partial_schema = schema["components"]["schemas"]["PartialProfile"]
+
+    assert body["$ref"].endswith("/PartialProfile")
+    assert "required" not in partial_schema
+    assert partial_schema["properties"]["name"] == {"minLength": 1, "title": "Name", "type": "string"}
+    assert "default" not in partial_schema["properties"]["age"]
+
+
+class Account(BaseModel):
+    email: str
+    tags: list[str] = Field(default_factory=list)
+    password: str | None = None
+    password_confirmation: str | None = None
+
+    @field_validator("email")
+    @classmethod
+    def check_email(cls, value: str) -> str:
+        if "@" not in value:
+            raise ValueError("Invalid email")
+        return value.lower()
+
+    @model_validator(mode="after")
+    def check_passwords(self):
+        if self.password != self.password_confirmation:
+            raise ValueError("Passwords do not match")
+        return self
+
+
+def test_default_factory_fields():
+    changes = Partial[Account].model_validate({"tags": ["a"]})
+
+    assert changes.changes() == {"tags": ["a"]}
+    assert Partial[Account].model_validate({}).tags is None
+
+
+def test_validators_are_kept():
+    assert Partial[Account].model_validate({"email": "ADA@example.com"}).email == "ada@example.com"
+    with pytest.raises(ValidationError, match="Invalid email"):
+        Partial[Account].model_validate({"email": "nope"})
+
+
+def test_model_validators_are_skipped():
+    # Only one of the fields compared by the model validator is sent
+    changes = Partial[Account].model_validate({"password": "secret"})
+
+    assert changes.changes() == {"password": "secret"}
+    with pytest.raises(ValidationError, match="Passwords do not match"):
+        Account.model_validate({"email": "ada@example.com", "password": "secret"})
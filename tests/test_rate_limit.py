@@ -0,0 +1,68 @@
+import pytest
+from flask import Flask
+
+from flask_typed import TypedAPI, TypedResource, rate_limit, RateLimit, SQLiteBucketBackend, header_key
+
+
+class QuotaResource(TypedResource):
+
+    @rate_limit(0.01, burst=2, key=header_key("X-Api-Key"))
+    def get(self) -> str:
+        return "ok"
+
+
+class SearchResource(TypedResource):
+
+    def get(self) -> str:
+        return "ok"
+
+
+def create_app(backend=None):
+    app = Flask("rate_limit_app")
+    api = TypedAPI(app)
+    api.add_resource(QuotaResource, "/quota")
+    api.add_resource(SearchResource, "/search", rate_limit=RateLimit(0.01, burst=1, backend=backend))
+    return app
+
+
+@pytest.fixture()
+def rate_limited_client():
+    return create_app().test_client()
+
+
+def test_rate_limit_per_client_key(rate_limited_client):
+    statuses = [rate_limited_client.get("/quota", headers={"X-Api-Key": "a"}).status_code for _ in range(3)]
+    assert statuses == [200, 200, 429]
+
+    response = rate_limited_client.get("/quota", headers={"X-Api-Key": "a"})
+    assert response.json["message"] == "Too many requests"
+    assert int(response.headers["Retry-After"]) > 0
+    assert response.headers["RateLimit-Limit"] == "2"
+    assert response.headers["RateLimit-Remaining"] == "0"
+
+    assert rate_limited_client.get("/quota", headers={"X-Api-Key": "b"}).status_code == 200
+
+
+def test_sqlite_backend_is_shared(tmp_path):
+    # Two apps stand in for two workers on the same host
+    path = str(tmp_path / "buckets.sqlite")
+    first = create_app(SQLiteBucketBackend(path)).test_client()
+    second = create_app(SQLiteBucketBackend(path)).test_client()
+
+    assert first.get("/search").status_code == 200
+    assert second.get("/search").status_code == 429
+
+
+def test_rate_limit_is_documented(rate_limited_client):
+    docs = rate_limited_client.get("/openapi").json
+
+    assert "429" in docs["paths"]["/quota"]["get"]["responses"]
+    assert "429" in docs["paths"]["/search"]["get"]["responses"]
+
+
+def test_requests_without_key_are_limited_per_address(rate_limited_client):
+    def get(address):
+        return rate_limited_client.get("/quota", environ_base={"REMOTE_ADDR": address}).status_code
+
+    assert [get("10.0.0.1") for _ in range(3)] == [200, 200, 429]
+    assert get("10.0.0.2") == 200
@@ -0,0 +1,135 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from flask import Flask
+from pydantic import BaseModel
+
+from flask_typed import TypedAPI, TypedResource, SlowRequestLog, slow_requests, coalesce
+from flask_typed.annotations import Header
+
+
+class Login(BaseModel):
+    user: str
+    password: str
+
+
+class Session(BaseModel):
+    token: str
+
+
+class LoginResource(TypedResource):
+
+    @slow_requests(threshold=0.01, redact={"login": lambda login: {"user": login.user}})
+    def post(self, login: Login, api_key: Header[str], delay: float = 0.0) -> Session:
+        time.sleep(delay)
+        return Session(token="t" * 100)
+
+
+class FastResource(TypedResource):
+
+    def get(self, delay: float = 0.0) -> Session:
+        time.sleep(delay)
+        return Session(token="fast")
+
+
+@pytest.fixture()
+def slow_app():
+    log = SlowRequestLog(threshold=10.0, max_entries=2, redact={"api_key": None})
+    app = Flask("slow_app")
+    api = TypedAPI(app, slow_request_log=log, slow_requests_path="/admin/slow-requests")
+    api.add_resource(LoginResource, "/login")
+    api.add_resource(FastResource, "/fast")
+    return app, log
+
+
+def login(client, delay):
+    return client.post(
+        f"/login?delay={delay}", json={"user": "ada", "password": "secret"}, headers={"Api-Key": "key"}
+    )
+
+
+def test_slow_request_is_logged_with_phases(slow_app, caplog):
+    app, log = slow_app
+    with caplog.at_level(logging.WARNING, logger="flask_typed.slow_requests"):
+        login(app.test_client(), 0.05)
+
+    entry = log.entries()[0]
+    assert entry["endpoint"] == "POST /login"
+    assert entry["status"] == 200
+    assert entry["duration"] >= 0.05
+    assert entry["phases"]["handler"] >= 0.05
+    assert entry["phases"]["validation"] < entry["phases"]["handler"]
+    assert entry["response_size"] == len('{"token":""}') + 100
+    assert entry["args"] == {"login": {"user": "ada"}, "api_key": "[redacted]", "delay": 0.05}
+    assert caplog.records[0].slow_request is entry
+
+
+def test_fast_requests_and_global_threshold(slow_app):
+    app, log = slow_app
+    client = app.test_client()
+    login(client, 0.0)
+    client.get("/fast?delay=0.02")
+
+    assert log.entries() == []
+    assert log.slow.value == 0
+
+
+def test_ring_buffer_and_admin_endpoint(slow_app):
+    app, log = slow_app
+    client = app.test_client()
+    for delay in (0.011, 0.012, 0.013):
+        login(client, delay)
+
+    entries = client.get("/admin/slow-requests").json
+    assert [entry["args"]["delay"] for entry in entries] == [0.013, 0.012]
+    assert log.slow.value == 3
+
+
+def test_validation_errors_are_logged_without_args(slow_app):
+    app, log = slow_app
+    log.threshold = 0.0
+    app_client = app.test_client()
+    # The route threshold is used for LoginResource, the global one for FastResource
+    app_client.get("/fast?delay=abc")
+
+    entry = log.entries()[0]
+    assert entry["status"] == 422
+    assert entry["args"] is None
+
+
+def test_failing_redact_rule_is_logged_without_args(caplog):
+    log = SlowRequestLog(threshold=0.0, redact={"api_key": lambda api_key: api_key.missing})
+    app = Flask("slow_redact_app")
+    TypedAPI(app, slow_request_log=log).add_resource(LoginResource, "/login")
+
+    with caplog.at_level(logging.ERROR, logger="flask_typed.slow_requests"):
+        response = login(app.test_client(), 0.02)
+
+    assert response.status_code == 200
+    assert log.entries()[0]["args"] is None
+    assert "Could not log the arguments" in caplog.text
+
+
+class CoalescedResource(TypedResource):
+
+    @slow_requests(threshold=0.0)
+    @coalesce(timeout=5)
+    def get(self) -> Session:
+        time.sleep(0.2)
+        return Session(token="shared")
+
+
+def test_coalesced_duplicates_have_no_handler_phase():
+    log = SlowRequestLog()
+    app = Flask("slow_coalesce_app")
+    TypedAPI(app, slow_request_log=log).add_resource(CoalescedResource, "/shared")
+
+    with ThreadPoolExecutor(4) as executor:
+        statuses = list(executor.map(lambda _: app.test_client().get("/shared").status_code, range(4)))
+
+    assert statuses == [200] * 4
+    phases = [entry["phases"] for entry in log.entries()]
+    assert sum("handler" in entry for entry in phases) == 1
+    assert all("validation" in entry for entry in phases)
@@ -0,0 +1,108 @@
+from datetime import date
+
+import pytest
+from flask import Flask
+from pydantic import BaseModel, Field
+
+from flask_typed import TypedAPI, TypedResource, sparse_fields
+from flask_typed.response import BaseModelResponse
+
+
+class Author(BaseModel):
+    name: str
+    email: str
+
+
+class Article(BaseModel):
+    id: int
+    title: str
+    published: date = Field(alias="publishDate")
+    author: Author
+
+
+class ArticleList(BaseModel):
+    count: int
+    items: list[Article]
+
+
+class ArticlesResource(TypedResource):
+
+    @sparse_fields()
+    def get(self) -> ArticleList:
+        author = Author(name="Jane", email="jane@example.com")
+        return ArticleList(count=2, items=[
+            Article(id=1, title="First", publishDate=date(2020, 1, 1), author=author),
+            Article(id=2, title="Second", publishDate=date(2020, 1, 2), author=author),
+        ])
+
+
+@pytest.fixture()
+def articles_client():
+    app = Flask("articles_app")
+    api = TypedAPI(app)
+    api.add_resource(ArticlesResource, "/articles")
+    return app.test_client()
+
+
+def test_all_fields_by_default(articles_client):
+    response = articles_client.get("/articles")
+
+    assert response.json["items"][0]["author"]["email"] == "jane@example.com"
+
+
+def test_selected_nested_fields(articles_client):
+    response = articles_client.get("/articles?fields=count,items.id,items.publishDate,items.author.name")
+
+    assert response.status_code == 200
+    assert response.json == {
+        "count": 2,
+        "items": [
+            {"id": 1, "publishDate": "2020-01-01", "author": {"name": "Jane"}},
+            {"id": 2, "publishDate": "2020-01-02", "author": {"name": "Jane"}},
+        ]
+    }
+
+
+def test_parent_field_includes_children(articles_client):
+    response = articles_client.get("/articles?fields=items.author,items.author.name")
+
+    assert response.json["items"][0] == {"author": {"name": "Jane", "email": "jane@example.com"}}
+
+
+def test_unknown_fields(articles_client):
+    response = articles_client.get("/articles?fields=count,items.body,total")
+
+    assert response.status_code == 400
+    assert response.json["message"] == "Unknown fields: items.body, total"
+
+
+def test_fields_parameter_docs(articles_client):
+    parameters = articles_client.get("/openapi").json["paths"]["/articles"]["get"]["parameters"]
+
+    fields = {param["name"]: param for param in parameters}["fields"]
+    assert "items.author.email" in fields["schema"]["items"]["enum"]
+    assert fields["explode"] is False
+
+
+class AuthorResponse(BaseModelResponse):
+    json_config = {"exclude_none": True}
+
+    name: str
+    email: str
+    bio: str | None = None
+
+
+class AuthorResource(TypedResource):
+
+    @sparse_fields()
+    def get(self) -> AuthorResponse:
+        return AuthorResponse(name="Jane", email="jane@example.com")
+
+
+def test_selected_fields_of_model_response():
+    app = Flask("author_response_app")
+    TypedAPI(app).add_resource(AuthorResource, "/author")
+    client = app.test_client()
+
+    assert client.get("/author?fields=name").json == {"name": "Jane"}
+    assert client.get("/author").json == {"name": "Jane", "email": "jane@example.com"}
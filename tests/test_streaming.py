@@ -0,0 +1,61 @@
+import json
+
+import pytest
+from flask import Flask
+
+from flask_typed import TypedAPI
+from tests.test_data.events import EventsResource
+
+
+@pytest.fixture()
+def events_client():
+    app = Flask("events_app")
+    api = TypedAPI(app)
+    api.add_resource(EventsResource, "/events")
+    return app.test_client()
+
+
+def ndjson(*items) -> bytes:
+    return "\n".join(json.dumps(item) for item in items).encode()
+
+
+def test_ndjson_items_are_validated_lazily(events_client):
+    body = ndjson(
+        {"name": "first", "time": "2020-01-01T00:00:00"},
+        {"name": "second", "time": "2020-01-01T00:00:01"},
+    ) + b"\n\n"
+
+    response = events_client.post("/events", data=body, content_type="application/x-ndjson")
+
+    assert response.status_code == 200
+    assert response.json == {"count": 2, "names": ["first", "second"]}
+
+
+def test_ndjson_invalid_item_line_number(events_client):
+    body = ndjson(
+        {"name": "first", "time": "2020-01-01T00:00:00"},
+        {"name": "second", "time": "invalid"},
+    )
+
+    response = events_client.post("/events", data=body, content_type="application/x-ndjson")
+
+    assert response.status_code == 422
+    assert response.json["line"] == 2
+
+
+def test_ndjson_limits(events_client):
+    item = {"name": "event", "time": "2020-01-01T00:00:00"}
+
+    response = events_client.post("/events", data=ndjson(*[item] * 6), content_type="application/x-ndjson")
+    assert response.status_code == 413
+
+    response = events_client.post("/events", data=b" " * 2048, content_type="application/x-ndjson")
+    assert response.status_code == 413
+
+
+def test_ndjson_docs(events_client):
+    operation = events_client.get("/openapi").json["paths"]["/events"]["post"]
+
+    schema = operation["requestBody"]["content"]["application/x-ndjson"]["schema"]
+    assert schema["$ref"] == "#/components/schemas/Event"
+    assert "413" in operation["responses"]
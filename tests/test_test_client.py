@@ -0,0 +1,95 @@
+from datetime import date
+
+import pytest
+from flask import Flask
+from pydantic import BaseModel
+
+from flask_typed import TypedAPI, TypedResource, docs, NotFoundError
+from flask_typed.annotations import Header
+from flask_typed.parameter import ValidationError
+from flask_typed.testing import TypedTestClient
+from tests.test_data.jobs import JobsResource, JobResult
+from tests.test_data.simple_user import UserResource, User
+from tests.test_data.todo_resource import TodoListResource, BlogPostListResponse
+
+
+class Note(BaseModel):
+    title: str
+    tags: list[str] = []
+
+
+class NoteResource(TypedResource):
+
+    @docs(errors=[NotFoundError])
+    def get(self, note_id: int) -> Note:
+        if note_id != 1:
+            raise NotFoundError(message="No such note")
+        return Note(title="first")
+
+    def put(self, note_id: int, note: Note, revision: Header[int]) -> Note:
+        return Note(title=f"{note.title} #{note_id}.{revision}", tags=note.tags)
+
+
+@pytest.fixture(params=[False, True], ids=["in_process", "full_stack"])
+def typed_client(request):
+    app = Flask("test_client_app")
+    api = TypedAPI(app)
+    api.add_resource(UserResource, "/users")
+    api.add_resource(TodoListResource, "/todo")
+    api.add_resource(JobsResource, "/jobs/<int:job_id>/<string:job_date>")
+    api.add_resource(NoteResource, "/notes/<int:note_id>")
+    return TypedTestClient(api, full_stack=request.param)
+
+
+def test_typed_arguments_and_result(typed_client):
+    user = typed_client.get("/users", user_id=12, join_date=date(2001, 2, 3))
+
+    assert user == User(id=12, name="default", age=5, join_date=date(2001, 2, 3))
+
+
+def test_path_parameters(typed_client):
+    result = typed_client.post(JobsResource, job_id=3, job_date=date(2000, 1, 2))
+
+    assert isinstance(result, JobResult)
+    assert result.id == 3
+    assert result.job_date == date(2000, 1, 2)
+
+
+def test_body_and_header(typed_client):
+    note = typed_client.put("/notes/<int:note_id>", note_id=1, note=Note(title="todo", tags=["a"]), revision=2)
+
+    assert note == Note(title="todo #1.2", tags=["a"])
+
+
+def test_raised_error_is_returned(typed_client):
+    error = typed_client.get(NoteResource, note_id=2)
+
+    assert isinstance(error, NotFoundError)
+    assert error.status_code == 404
+    assert error.response.message == "No such note"
+
+
+def test_validation_error(typed_client):
+    error = typed_client.put(NoteResource, note_id=1, note={"tags": ["a"]})
+
+    assert isinstance(error, ValidationError)
+    assert error.status_code == 422
+    assert {err.parameter for err in error.response.errors} == {"note", "Revision"}
+
+
+def test_request_parsers_read_raw_request(typed_client):
+    result = typed_client.get(
+        TodoListResource, accept_language="en-US", query_string={"after": "2001-01-01"}
+    )
+
+    assert isinstance(result, BlogPostListResponse)
+    assert result.items[0].language == "en-US"
+
+
+def test_in_process_rejects_unknown_arguments():
+    app = Flask("test_client_app")
+    api = TypedAPI(app)
+    api.add_resource(NoteResource, "/notes/<int:note_id>")
+
+    with pytest.raises(TypeError):
+        TypedTestClient(api).get(NoteResource, note_id=1, unknown=True)
@@ -0,0 +1,112 @@
+import io
+
+import pytest
+from flask import Flask
+from pydantic import BaseModel
+from werkzeug.datastructures import FileStorage
+
+from flask_typed import TypedAPI, TypedResource, UploadedFile, upload_limits, PayloadTooLargeError
+from flask_typed.annotations import Form, File
+from flask_typed.uploads import SpooledUpload
+
+
+class UploadResult(BaseModel):
+    title: str
+    filename: str
+    size: int
+    in_memory: bool
+    head: str
+
+
+class UploadResource(TypedResource):
+
+    @upload_limits(spool_threshold=16, max_file_size=64)
+    def post(self, title: Form[str], document: File, attachment: File = None) -> UploadResult:
+        """
+        Uploads a document
+
+        :param title: Document title
+        :param document: Document content
+        :param attachment: Optional attachment
+        :return: Uploaded document details
+        """
+        view = document.mmap()
+        return UploadResult(
+            title=title,
+            filename=document.filename,
+            size=document.size,
+            in_memory=document.stream.in_memory,
+            head=bytes(view[:4]).decode(),
+        )
+
+
+@pytest.fixture()
+def upload_client():
+    app = Flask("upload_app")
+    api = TypedAPI(app)
+    api.add_resource(UploadResource, "/documents")
+    return app.test_client()
+
+
+@pytest.mark.parametrize("content, in_memory", [(b"small", True), (b"large file " * 4, False)])
+def test_file_upload_is_spooled(upload_client, content, in_memory):
+    response = upload_client.post("/documents", data={
+        "title": "Report",
+        "document": (io.BytesIO(content), "report.txt"),
+    })
+
+    assert response.status_code == 200
+    assert response.json == {
+        "title": "Report",
+        "filename": "report.txt",
+        "size": len(content),
+        "in_memory": in_memory,
+        "head": content[:4].decode(),
+    }
+
+
+def test_file_upload_size_limit(upload_client):
+    response = upload_client.post("/documents", data={
+        "title": "Report",
+        "document": (io.BytesIO(b"x" * 65), "report.txt"),
+    })
+
+    assert response.status_code == 413
+
+
+def test_missing_file(upload_client):
+    response = upload_client.post("/documents", data={"title": "Report"})
+
+    assert response.status_code == 422
+    assert response.json["errors"][0]["parameter"] == "document"
+    assert response.json["errors"][0]["location"] == "file"
+
+
+def test_multipart_docs(upload_client):
+    operation = upload_client.get("/openapi").json["paths"]["/documents"]["post"]
+    schema = operation["requestBody"]["content"]["multipart/form-data"]["schema"]
+
+    assert schema["properties"]["title"] == {"type": "string", "description": "Document title"}
+    assert schema["properties"]["document"]["format"] == "binary"
+    assert schema["required"] == ["title", "document"]
+    assert "413" in operation["responses"]
+
+
+def test_spool_is_closed_when_limit_is_exceeded(tmp_path):
+    upload = SpooledUpload(spool_threshold=4, max_file_size=8, spool_dir=str(tmp_path))
+    upload.write(b"x" * 6)
+    assert not upload.in_memory
+
+    with pytest.raises(PayloadTooLargeError):
+        upload.write(b"x" * 6)
+    assert upload.closed
+
+
+def test_memory_map_of_unspooled_streams():
+    in_memory = SpooledUpload(spool_threshold=16, max_file_size=None)
+    in_memory.write(b"small")
+    in_memory.seek(1)
+
+    assert in_memory.memory_map() == b"small"
+    assert in_memory.tell() == 1
+    assert UploadedFile(FileStorage(io.BytesIO(b"plain"))).mmap() == b"plain"
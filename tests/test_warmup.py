@@ -0,0 +1,65 @@
+import gc
+
+from flask import Flask
+from pydantic import BaseModel, ConfigDict
+
+from flask_typed import TypedAPI, TypedResource
+
+
+class DeferredBody(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: str
+
+
+class DeferredResult(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: str
+    length: int
+
+
+class DeferredResource(TypedResource):
+
+    def post(self, body: DeferredBody) -> DeferredResult:
+        return DeferredResult(name=body.name, length=len(body.name))
+
+
+def test_warmup_builds_deferred_models():
+    api = TypedAPI(Flask("warmup_app"))
+    api.add_resource(DeferredResource, "/deferred")
+
+    assert not DeferredResult.__pydantic_complete__
+
+    api.warmup(freeze=True)
+    try:
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+    assert DeferredBody.__pydantic_complete__
+    assert DeferredResult.__pydantic_complete__
+
+    response = api.app.test_client().post("/deferred", json={"name": "test"})
+    assert response.json == {"name": "test", "length": 4}
+
+
+class TreeNode(BaseModel):
+    name: str
+    children: list["TreeNode"] = []
+
+
+class TreeResource(TypedResource):
+
+    def get(self) -> TreeNode:
+        return TreeNode(name="root", children=[TreeNode(name="leaf")])
+
+
+def test_warmup_self_referencing_model():
+    api = TypedAPI(Flask("warmup_tree_app"))
+    api.add_resource(TreeResource, "/tree")
+
+    api.warmup()
+
+    response = api.app.test_client().get("/tree")
+    assert response.json == {"name": "root", "children": [{"name": "leaf", "children": []}]}